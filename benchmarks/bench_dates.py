@@ -0,0 +1,110 @@
+"""
+Posted-date parsing throughput: the previous per-call parser vs the
+run-anchored one, one string at a time and in batch.
+
+Builds --rows posted-date strings in the forms the sites show ("Posted 3d ago",
+"5h ago", "Posted 2 days ago", "Posted yesterday", "30+ days ago") plus some
+absolute dates, and times the old parser, utils.parse_posted_date with a cold
+and a warm phrase cache, and utils.parse_posted_dates over the whole list.
+
+Usage:
+    python benchmarks/bench_dates.py [--rows 100000] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import _posted_phrase, parse_posted_date, parse_posted_dates, reference_time  # noqa: E402
+
+FORMS = [
+    lambda rng: f"Posted {rng.randint(1, 30)}d ago",
+    lambda rng: f"{rng.randint(1, 23)}h ago",
+    lambda rng: f"Posted {rng.randint(2, 29)} days ago",
+    lambda rng: f"Posted {rng.randint(1, 4)}w ago",
+    lambda rng: "Posted yesterday",
+    lambda rng: "30+ days ago",
+    lambda rng: "Posted today",
+    lambda rng: f"Posted on {rng.randint(1, 28)} Mar 2025",
+]
+
+
+def legacy_parse_posted_date(date_text):
+    """parse_posted_date before run anchoring"""
+    if not date_text:
+        return None
+    text = date_text.lower()
+    now = datetime.now()
+    if 'yesterday' in text:
+        return (now - timedelta(days=1)).date().isoformat()
+    if 'today' in text:
+        return now.date().isoformat()
+    if '30+' in text:
+        return (now - timedelta(days=30)).date().isoformat()
+    match = re.search(r'(\d+)\s*([a-z]+)', text)
+    if match:
+        num = int(match.group(1))
+        unit = match.group(2)
+        delta = timedelta(0)
+        if 'h' in unit:
+            delta = timedelta(hours=num)
+        elif 'd' in unit:
+            delta = timedelta(days=num)
+        elif 'm' in unit and 'mon' not in unit:
+            delta = timedelta(minutes=num)
+        elif 'w' in unit:
+            delta = timedelta(weeks=num)
+        elif 'mon' in unit:
+            delta = timedelta(days=num * 30)
+        elif 'y' in unit:
+            delta = timedelta(days=num * 365)
+        return (now - delta).date().isoformat()
+    return None
+
+
+def timed(fn, repeat, before=None):
+    total = 0.0
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        fn()
+        total += time.perf_counter() - start
+    return total / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    texts = [rng.choice(FORMS)(rng) for _ in range(args.rows)]
+    now = reference_time()
+    print(f"{len(texts)} strings, {len(set(texts))} distinct")
+
+    relative = [text for text in texts if "Mar 2025" not in text]
+    same = sum(legacy_parse_posted_date(text) == parse_posted_date(text) for text in relative)
+    print(f"Relative strings dated the same as before: {same}/{len(relative)}")
+
+    runs = [
+        ("legacy per call", lambda: [legacy_parse_posted_date(text) for text in texts], None),
+        ("parse_posted_date, cold", lambda: [parse_posted_date(text) for text in texts], _posted_phrase.cache_clear),
+        ("parse_posted_date, warm", lambda: [parse_posted_date(text) for text in texts], None),
+        ("parse_posted_dates", lambda: parse_posted_dates(texts, now), _posted_phrase.cache_clear),
+    ]
+    print(f"{'parser':<26} {'ms':>8} {'strings/s':>12}")
+    for label, fn, before in runs:
+        seconds = timed(fn, args.repeat, before)
+        print(f"{label:<26} {seconds * 1000:>8.2f} {len(texts) / seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
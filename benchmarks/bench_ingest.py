@@ -0,0 +1,96 @@
+"""
+Ingest benchmark: bulk upsert of synthetic jobs.
+
+Inserts --rows fake jobs into a fresh SQLite database, upserts them all again
+with a changed title (every row an update), then once more unchanged (every
+row only has last_seen_at bumped), and reports rows/s for each pass. Pass --url
+to run against another database instead, e.g. a scratch PostgreSQL; its jobs
+table is dropped and recreated. --copy loads through the COPY staging table
+(ingest_jobs.copy_upsert_jobs) instead, which needs PostgreSQL.
+
+Usage:
+    python benchmarks/bench_ingest.py [--rows 20000] [--batch 500] [--url sqlite:///bench.db]
+    python benchmarks/bench_ingest.py --copy --url postgresql+psycopg2://localhost/scratch
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from database import Base, create_db_engine  # noqa: E402
+from ingest_jobs import copy_upsert_jobs, prepare_job, upsert_jobs  # noqa: E402
+
+
+def fake_jobs(count, title_prefix):
+    for n in range(count):
+        yield {
+            "source": "seek",
+            "job_title": f"{title_prefix} {n}",
+            "company_name": f"Company {n % 500}",
+            "location": "Sydney NSW",
+            "city": "Sydney",
+            "state": "NSW",
+            "country": "Australia",
+            "work_type": "Full time",
+            "salary_range": "$90,000 - $110,000",
+            "min_annual_salary": 90000,
+            "max_annual_salary": 110000,
+            "posted_date": "2025-01-31",
+            "job_description": "Lorem ipsum dolor sit amet. " * 80,
+            "url": f"https://www.seek.com.au/job/{n}",
+        }
+
+
+def timed_upsert(Session, rows, batch, copy=False):
+    db = Session()
+    start = time.perf_counter()
+    prepared = (prepare_job(job) for job in rows)
+    if copy:
+        counts = copy_upsert_jobs(db, prepared)
+    else:
+        counts = upsert_jobs(db, prepared, batch_size=batch)
+    db.commit()
+    elapsed = time.perf_counter() - start
+    db.close()
+    return counts, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--url", help="Database URL (default: a temporary SQLite file)")
+    parser.add_argument("--copy", action="store_true", help="Load through COPY and a staging table")
+    args = parser.parse_args()
+
+    tmp = None
+    url = args.url
+    if not url:
+        tmp = tempfile.TemporaryDirectory()
+        url = f"sqlite:///{os.path.join(tmp.name, 'bench.db')}"
+
+    engine = create_db_engine(url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+
+    passes = (("insert", "Engineer"), ("update", "Senior Engineer"), ("same", "Senior Engineer"))
+    for label, prefix in passes:
+        rows = fake_jobs(args.rows, prefix)
+        (inserted, updated, unchanged), elapsed = timed_upsert(Session, rows, args.batch, args.copy)
+        print(f"{label:>6}: {args.rows} rows in {elapsed:.2f}s ({args.rows / elapsed:,.0f} rows/s) "
+              f"- inserted {inserted}, updated {updated}, unchanged {unchanged}")
+
+    engine.dispose()
+    if tmp:
+        tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
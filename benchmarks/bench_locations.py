@@ -0,0 +1,107 @@
+"""
+Location parsing throughput: the previous regex heuristic vs the gazetteer resolver.
+
+Takes the location strings from combined_jobs.csv and the output/*/*.json
+files, repeats them --scale times (scraped locations repeat heavily) and
+times the old parser, locations.resolve_location with a cold cache and
+utils.parse_location with a warm one. Also prints how many strings each
+resolves to a state.
+
+Usage:
+    python benchmarks/bench_locations.py [--scale 100] [--repeat 5]
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd  # noqa: E402
+
+from locations import STATE_NAMES, load_gazetteer, resolve_location  # noqa: E402
+from utils import parse_location  # noqa: E402
+
+
+def legacy_parse_location(location_str):
+    """parse_location before the gazetteer resolver"""
+    if not location_str:
+        return {"city": None, "state": None, "country": "Australia"}
+    clean_loc = re.sub(r'\(.*?\)', '', location_str).strip()
+    parts = [p.strip() for p in clean_loc.split(',')]
+    city = None
+    state = None
+    if len(parts) == 1:
+        match = re.search(r'^(.*?)\s+([A-Z]{2,3})$', parts[0])
+        if match:
+            city = match.group(1).strip()
+            state = match.group(2).strip()
+        else:
+            city = parts[0]
+    else:
+        match = re.search(r'^(.*?)\s+([A-Z]{2,3})$', parts[-1])
+        if match:
+            state = match.group(2).strip()
+            city = parts[0]
+        elif re.match(r'^[A-Z]{2,3}$', parts[-1]):
+            state = parts[-1]
+            city = parts[0]
+        else:
+            city = parts[0]
+            state = parts[-1]
+    return {"city": city, "state": state, "country": "Australia"}
+
+
+def load_locations():
+    locations = list(pd.read_csv(os.path.join(ROOT, "combined_jobs.csv"), usecols=["location"])["location"].dropna())
+    for path in glob.glob(os.path.join(ROOT, "output", "*", "*.json")):
+        with open(path, encoding="utf-8") as f:
+            locations += [job["location"] for job in json.load(f) if job.get("location")]
+    return locations
+
+
+def timed(fn, repeat, before=None):
+    total = 0.0
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        fn()
+        total += time.perf_counter() - start
+    return total / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=100, help="Repeat the location strings this many times")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    locations = load_locations()
+    distinct = sorted(set(locations))
+    texts = locations * args.scale
+    load_gazetteer()
+    print(f"{len(texts)} strings, {len(distinct)} distinct")
+
+    legacy_states = sum(legacy_parse_location(text)["state"] in STATE_NAMES for text in distinct)
+    new_states = sum(resolve_location(text).state is not None for text in distinct)
+    print(f"Distinct strings with a state: legacy {legacy_states}, gazetteer {new_states}")
+
+    runs = [
+        ("legacy regex", lambda: [legacy_parse_location(text) for text in texts], None),
+        ("resolve_location, cold", lambda: [resolve_location(text) for text in texts], resolve_location.cache_clear),
+        ("parse_location, warm", lambda: [parse_location(text) for text in texts], None),
+    ]
+    print(f"{'parser':<24} {'ms':>8} {'strings/s':>12}")
+    for label, fn, before in runs:
+        seconds = timed(fn, args.repeat, before)
+        print(f"{label:<24} {seconds * 1000:>8.2f} {len(texts) / seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Keyword classification throughput over the scraped output.
+
+Runs normalize.classify over the title and description of every job in
+output/*/*.json (repeated --scale times) and compares it with the
+substring-scan approach it replaced: lowercasing each text and testing the
+same keywords one `in` check at a time. Also prints how the corpus was
+labelled.
+
+Usage:
+    python benchmarks/bench_normalize.py [--scale 10] [--repeat 3]
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from normalize import MATCHER, SENIORITY, WORK_TYPES, classify  # noqa: E402
+
+
+def substring_classify(title, description):
+    """The same labels by repeated substring checks (no word boundaries), as the scrapers used to"""
+    labels = {"work_type": None, "is_remote": False, "is_hybrid": False, "seniority": None}
+    for field, text in (("title", title), ("description", description)):
+        text = (text or "").lower()
+        if labels["work_type"] is None:
+            labels["work_type"] = next((work_type for work_type, fields, keywords in WORK_TYPES
+                                        if field in fields and any(keyword in text for keyword in keywords)), None)
+        if labels["seniority"] is None:
+            labels["seniority"] = next((level for level, fields, keywords in reversed(SENIORITY)
+                                        if field in fields and any(keyword in text for keyword in keywords)), None)
+        for keyword, entries in MATCHER.values.items():
+            for category, value, fields in entries:
+                if category in ("is_remote", "is_hybrid") and field in fields and keyword in text:
+                    labels[category] = True
+    return labels
+
+
+def load_jobs():
+    jobs = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "output", "*", "*.json"))):
+        with open(path, encoding="utf-8") as f:
+            jobs += [(job.get("job_title"), job.get("job_description")) for job in json.load(f)]
+    return jobs
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=10, help="Repeat the corpus this many times")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = load_jobs()
+    jobs = corpus * args.scale
+    chars = sum(len(title or "") + len(description or "") for title, description in jobs)
+    print(f"{len(jobs)} jobs, {chars / 1e6:.1f}M characters")
+
+    runs = [
+        ("substring scans", lambda: [substring_classify(title, description) for title, description in jobs]),
+        ("KeywordMatcher", lambda: [classify(title, description) for title, description in jobs]),
+    ]
+    print(f"{'classifier':<18} {'ms':>9} {'jobs/s':>10} {'MB/s':>7}")
+    for label, fn in runs:
+        seconds = timed(fn, args.repeat)
+        print(f"{label:<18} {seconds * 1000:>9.1f} {len(jobs) / seconds:>10,.0f} {chars / seconds / 1e6:>7.1f}")
+
+    labels = [classify(title, description) for title, description in corpus]
+    print("\nwork_type:", dict(Counter(label["work_type"] for label in labels)))
+    print("seniority:", dict(Counter(label["seniority"] for label in labels)))
+    print("remote:", sum(label["is_remote"] for label in labels), "hybrid:", sum(label["is_hybrid"] for label in labels))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Parse-stage throughput: inline vs the process pool.
+
+Parses the fixture pages (or --dir, see bench_parsers.py) --pages times over,
+inline and through ParsePool with 1..--workers processes, and reports pages
+per second. Pool timings include sending the HTML to the workers and the
+records back, but not spawning them (the pool is warmed first).
+
+Usage:
+    python benchmarks/bench_parse_pool.py [--dir fixtures] [--pages 400] [--workers 4]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parse_pool import ParsePool  # noqa: E402
+from parsers import extract_job_details, parse_career_jobs, parse_jobsearch_jobs, parse_new_site  # noqa: E402
+
+PARSERS = {
+    "seek_detail": extract_job_details,
+    "jora_detail": parse_new_site,
+    "career_listing": parse_career_jobs,
+    "jobsearch_listing": parse_jobsearch_jobs,
+}
+
+
+def load_pages(directory, count):
+    pages = []
+    for prefix, parser in PARSERS.items():
+        for path in sorted(glob.glob(os.path.join(directory, f"{prefix}*.html"))):
+            with open(path, encoding="utf-8") as f:
+                pages.append((parser, f.read()))
+    return [pages[i % len(pages)] for i in range(count)]
+
+
+def run(pool, pages):
+    start = time.perf_counter()
+    futures = [pool.submit(parser, html) for parser, html in pages]
+    for future in futures:
+        future.result()
+    return time.perf_counter() - start
+
+
+def main():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", default=os.path.join(root, "fixtures"))
+    parser.add_argument("--pages", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    pages = load_pages(args.dir, args.pages)
+    print(f"{len(pages)} pages, {os.cpu_count()} CPUs")
+    print(f"{'workers':<8} {'seconds':>8} {'pages/s':>10}")
+    for workers in range(0, args.workers + 1):
+        with ParsePool(workers=workers) as pool:
+            if workers:
+                # Spawn and import in every worker before timing
+                for future in [pool.submit(parser, html) for parser, html in pages[:workers * 2]]:
+                    future.result()
+            seconds = run(pool, pages)
+        label = "inline" if workers == 0 else str(workers)
+        print(f"{label:<8} {seconds:>8.2f} {len(pages) / seconds:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Parse-time benchmark for the site parsers, per backend.
+
+Runs every parser over saved pages and reports the average time per page for
+each available tree builder. Pages are read from fixtures/ by default; point
+--dir at a folder of real saved pages named like the fixtures
+(seek_detail*.html, jora_detail*.html, career_listing*.html,
+jobsearch_listing*.html) for production-sized numbers.
+
+Usage:
+    python benchmarks/bench_parsers.py [--dir fixtures] [--repeat 20]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parsers import (  # noqa: E402
+    BACKENDS, extract_job_details, parse_new_site, parse_career_jobs, parse_jobsearch_jobs,
+)
+
+PARSERS = {
+    "seek_detail": extract_job_details,
+    "jora_detail": parse_new_site,
+    "career_listing": parse_career_jobs,
+    "jobsearch_listing": parse_jobsearch_jobs,
+}
+
+
+def load_pages(directory, prefix):
+    pages = []
+    for path in sorted(glob.glob(os.path.join(directory, f"{prefix}*.html"))):
+        with open(path, encoding="utf-8") as f:
+            pages.append(f.read())
+    return pages
+
+
+def time_parser(parse, pages, backend, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            parse(html, backend=backend)
+    return (time.perf_counter() - start) / (repeat * len(pages))
+
+
+def main():
+    default_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures")
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", default=default_dir, help="directory of saved pages")
+    parser.add_argument("--repeat", type=int, default=20, help="passes over each page")
+    args = parser.parse_args()
+
+    print(f"{'parser':<20}{'pages':>6}  " + "".join(f"{b:>14}" for b in BACKENDS) + f"{'speedup':>10}")
+    for prefix, parse in PARSERS.items():
+        pages = load_pages(args.dir, prefix)
+        if not pages:
+            print(f"{prefix:<20}{0:>6}  (no pages)")
+            continue
+
+        results = {}
+        for backend in BACKENDS:
+            outputs = [parse(html, backend=backend) for html in pages]
+            if backend != "html.parser" and outputs != [parse(html, backend="html.parser") for html in pages]:
+                print(f"  WARNING: {prefix} output differs between {backend} and html.parser")
+            results[backend] = time_parser(parse, pages, backend, args.repeat)
+
+        row = "".join(f"{results[b] * 1000:>11.2f} ms" for b in BACKENDS)
+        speedup = results["html.parser"] / min(results.values())
+        print(f"{prefix:<20}{len(pages):>6}  {row}{speedup:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
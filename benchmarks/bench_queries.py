@@ -0,0 +1,111 @@
+"""
+Listing query benchmark: composite/partial indexes and keyset vs OFFSET paging.
+
+Seeds --rows synthetic jobs (default 1,000,000) into a temporary SQLite
+database (or --url) and times queries.find_jobs for a few filter mixes,
+first without the listing indexes and then with them. For each mix it
+times the first page, and a page --depth rows deep fetched both with the
+keyset cursor and with the OFFSET it replaces.
+
+Usage:
+    python benchmarks/bench_queries.py [--rows 1000000] [--depth 10000] [--repeat 10] [--url postgresql://...]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from database import Base, Job, create_db_engine  # noqa: E402
+from queries import encode_cursor, find_jobs, jobs_query  # noqa: E402
+from seed_jobs import seed_jobs  # noqa: E402
+
+FILTERS = [
+    {},
+    {"state": "VIC"},
+    {"is_remote": True},
+    {"is_hybrid": True, "state": "NSW"},
+    {"min_salary": 150000},
+    {"state": "QLD", "posted_within_days": 7},
+]
+
+LISTING_INDEXES = [index for index in Job.__table__.indexes if index.name.endswith("posted_date_id")
+                   or index.name == "ix_jobs_salary"]
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def run_pass(db, label, depth, repeat):
+    print(f"\n{label}")
+    print(f"{'filters':<42} {'page 1 ms':>10} {'keyset ms':>10} {'offset ms':>10}")
+    for filters in FILTERS:
+        first = timed(lambda: find_jobs(db, **filters), repeat)
+        # Cursor for the row just before `depth`, found once outside the timing
+        anchor = db.execute(jobs_query(limit=1, **filters).offset(depth - 1)).scalar()
+        if anchor is None:
+            print(f"{str(filters):<42} {first:>10.2f} {'-':>10} {'-':>10}")
+            continue
+        cursor = encode_cursor(anchor)
+        keyset = timed(lambda: find_jobs(db, after=cursor, **filters), repeat)
+        offset = timed(lambda: db.execute(jobs_query(**filters).offset(depth)).scalars().all(), repeat)
+        print(f"{str(filters):<42} {first:>10.2f} {keyset:>10.2f} {offset:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--depth", type=int, default=10000, help="Rows skipped for the deep page")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--url", help="Database URL (default: a temporary SQLite file)")
+    args = parser.parse_args()
+
+    tmp = None
+    url = args.url
+    if not url:
+        tmp = tempfile.TemporaryDirectory()
+        url = f"sqlite:///{os.path.join(tmp.name, 'bench.db')}"
+
+    engine = create_db_engine(url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        for index in LISTING_INDEXES:
+            index.drop(conn)
+    start = time.perf_counter()
+    # Short descriptions: listings never read them, and 1M full ones would take gigabytes
+    seed_jobs(engine, args.rows, words=10)
+    print(f"Seeded {args.rows} jobs in {time.perf_counter() - start:.1f}s")
+
+    db = sessionmaker(bind=engine)()
+    run_pass(db, "Without listing indexes", args.depth, args.repeat)
+
+    db.close()
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        for index in LISTING_INDEXES:
+            index.create(conn)
+        if engine.dialect.name == "sqlite":
+            conn.exec_driver_sql("ANALYZE")
+    print(f"\nBuilt listing indexes in {time.perf_counter() - start:.1f}s")
+
+    db = sessionmaker(bind=engine)()
+    run_pass(db, "With listing indexes", args.depth, args.repeat)
+
+    db.close()
+    engine.dispose()
+    if tmp:
+        tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
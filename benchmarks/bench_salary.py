@@ -0,0 +1,89 @@
+"""
+Salary parsing throughput over the salary_range column of combined_jobs.csv.
+
+Times the previous per-call parser (kept below for comparison), the
+precompiled utils.parse_salary with a cold and a warm cache, and checks
+they return the same values.
+
+Usage:
+    python benchmarks/bench_salary.py [--csv combined_jobs.csv] [--repeat 20] [--scale 1]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+
+from utils import parse_salary  # noqa: E402
+
+
+def legacy_parse_salary(salary_text):
+    """parse_salary before the precompiled, table-driven version"""
+    if not salary_text:
+        return None, None
+    text = salary_text.lower().replace(',', '')
+    matches = re.findall(r'(\d+(?:\.\d+)?)\s*(k)?', text)
+    values = [float(num) * 1000 if k else float(num) for num, k in matches]
+    if not values:
+        return None, None
+    multiplier = 1.0
+    if any(x in text for x in ['hour', 'hr', '/h', 'p.h']):
+        multiplier = 2080.0
+    elif any(x in text for x in ['day', 'daily', '/d', 'p.d']):
+        multiplier = 260.0
+    elif any(x in text for x in ['week', 'weekly', '/w']):
+        multiplier = 52.0
+    elif any(x in text for x in ['month', 'monthly', '/m']):
+        multiplier = 12.0
+    if multiplier == 1.0 and all(v < 200 for v in values):
+        multiplier = 2080.0
+    annual_values = sorted(v * multiplier for v in values)
+    return int(annual_values[0]), int(annual_values[-1])
+
+
+def timed(fn, repeat, before=None):
+    total = 0.0
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        fn()
+        total += time.perf_counter() - start
+    return total / repeat
+
+
+def main():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", default=os.path.join(root, "combined_jobs.csv"))
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--scale", type=int, default=1, help="Repeat the column this many times")
+    args = parser.parse_args()
+
+    column = pd.read_csv(args.csv, usecols=["salary_range"])["salary_range"]
+    column = pd.concat([column] * args.scale, ignore_index=True)
+    texts = [None if pd.isna(text) else text for text in column]
+    print(f"{len(texts)} rows, {column.nunique()} distinct salary texts")
+
+    expected = [legacy_parse_salary(text) for text in texts]
+    parse_salary.cache_clear()
+    assert [parse_salary(text) for text in texts] == expected
+
+    runs = [
+        ("legacy per call", lambda: [legacy_parse_salary(text) for text in texts], None),
+        ("parse_salary, cold cache", lambda: [parse_salary(text) for text in texts], parse_salary.cache_clear),
+        ("parse_salary, warm cache", lambda: [parse_salary(text) for text in texts], None),
+    ]
+    print(f"{'parser':<26} {'ms':>8} {'rows/s':>12}")
+    for label, fn, before in runs:
+        seconds = timed(fn, args.repeat, before)
+        print(f"{label:<26} {seconds * 1000:>8.2f} {len(texts) / seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
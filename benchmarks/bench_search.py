@@ -0,0 +1,92 @@
+"""
+Keyword search benchmark: full-text index vs ILIKE scan.
+
+Seeds --rows synthetic jobs into a temporary SQLite database (or --url), sets
+up the full-text index, and times a few keyword searches through
+search.search_jobs against the equivalent ILIKE query over title, company
+and description.
+
+Usage:
+    python benchmarks/bench_search.py [--rows 100000] [--repeat 20] [--url postgresql://...]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import or_, select  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from database import Base, Job, create_db_engine, setup_full_text_search  # noqa: E402
+from search import search_jobs  # noqa: E402
+from seed_jobs import seed_jobs  # noqa: E402
+
+QUERIES = [
+    ("python", {}),
+    ("skill120 skill450", {}),
+    ("nurse skill30", {"state": "NSW"}),
+    ("senior accountant skill75", {"min_salary": 100000}),
+]
+
+
+def ilike_search(db, query, state=None, min_salary=None, limit=20):
+    stmt = select(Job)
+    for term in query.split():
+        pattern = f"%{term}%"
+        stmt = stmt.where(or_(Job.job_title.ilike(pattern), Job.company_name.ilike(pattern),
+                              Job.job_description.ilike(pattern)))
+    if state:
+        stmt = stmt.where(Job.state == state)
+    if min_salary is not None:
+        stmt = stmt.where(Job.max_annual_salary >= min_salary)
+    return db.execute(stmt.limit(limit)).scalars().all()
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--url", help="Database URL (default: a temporary SQLite file)")
+    args = parser.parse_args()
+
+    tmp = None
+    url = args.url
+    if not url:
+        tmp = tempfile.TemporaryDirectory()
+        url = f"sqlite:///{os.path.join(tmp.name, 'bench.db')}"
+
+    engine = create_db_engine(url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    start = time.perf_counter()
+    seed_jobs(engine, args.rows)
+    with engine.begin() as conn:
+        setup_full_text_search(conn)
+    print(f"Seeded and indexed {args.rows} jobs in {time.perf_counter() - start:.1f}s")
+
+    db = sessionmaker(bind=engine)()
+    print(f"{'query':<28} {'filters':<24} {'fts ms':>8} {'ilike ms':>9}")
+    for query, filters in QUERIES:
+        fts = timed(lambda: search_jobs(db, query, **filters), args.repeat)
+        ilike = timed(lambda: ilike_search(db, query, **filters), max(1, args.repeat // 4))
+        print(f"{query:<28} {str(filters):<24} {fts:>8.2f} {ilike:>9.2f}")
+
+    db.close()
+    engine.dispose()
+    if tmp:
+        tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
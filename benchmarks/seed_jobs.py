@@ -0,0 +1,69 @@
+"""
+Synthetic jobs for the database benchmarks.
+
+seed_jobs() fills the jobs table of a database with `rows` reproducible fake
+postings (titles, companies, states, work types, salary ranges, posting dates
+over the last 90 days and ~100-word descriptions) using bulk executemany
+inserts.
+"""
+
+import random
+from datetime import date, timedelta
+
+from sqlalchemy import insert
+
+from database import Job
+
+TITLES = [
+    "Data Engineer", "Software Engineer", "Registered Nurse", "Accountant", "Chef",
+    "Project Manager", "Electrician", "Sales Representative", "Teacher", "Warehouse Operator",
+    "Business Analyst", "Customer Service Officer", "Civil Engineer", "Pharmacist", "Barista",
+]
+SENIORITY = ["", "Senior ", "Junior ", "Lead ", "Graduate "]
+STATES = ["NSW", "VIC", "QLD", "WA", "SA", "TAS", "ACT", "NT"]
+WORK_TYPES = ["Full time", "Part time", "Contract/Temp", "Casual/Vacation"]
+COMMON_WORDS = (
+    "team customer python sql cloud aws azure reporting stakeholder safety patient care "
+    "budget forecasting kitchen menu retail logistics forklift compliance agile scrum "
+    "communication leadership mentoring design testing automation pipeline warehouse "
+    "construction site community education curriculum pharmacy coffee hospitality "
+    "analytics dashboard finance payroll audit tax sales targets growth marketing"
+).split()
+# A long tail of rarer words, so keyword matches are as selective as in real ads
+WORDS = COMMON_WORDS + [f"skill{n}" for n in range(5000)]
+# Zipf-like: the n-th word is n times rarer than the first
+WEIGHTS = [1.0 / rank for rank in range(1, len(WORDS) + 1)]
+
+
+def fake_job(n, rng, today, words=100):
+    title = rng.choice(SENIORITY) + rng.choice(TITLES)
+    low = rng.randrange(50, 180) * 1000
+    has_salary = rng.random() < 0.6
+    return {
+        "source": rng.choice(["seek", "jora", "jobsearch", "careerone"]),
+        "job_title": title,
+        "company_name": f"Company {rng.randrange(5000)}",
+        "location": "",
+        "city": "",
+        "state": rng.choice(STATES),
+        "country": "Australia",
+        "is_remote": rng.random() < 0.1,
+        "is_hybrid": rng.random() < 0.2,
+        "work_type": rng.choice(WORK_TYPES),
+        "salary_range": "",
+        "min_annual_salary": float(low) if has_salary else None,
+        "max_annual_salary": float(low + rng.randrange(0, 40) * 1000) if has_salary else None,
+        "posted_date": today - timedelta(days=rng.randrange(90)),
+        "job_description": " ".join(rng.choices(WORDS, WEIGHTS, k=words)),
+        "url": f"https://example.com/job/{n}",
+    }
+
+
+def seed_jobs(engine, rows, batch=10000, seed=42, words=100):
+    """Insert `rows` synthetic jobs, `words` description words each, into an existing jobs table"""
+    rng = random.Random(seed)
+    today = date.today()
+    stmt = insert(Job.__table__)
+    with engine.begin() as conn:
+        for start in range(0, rows, batch):
+            conn.execute(stmt, [fake_job(n, rng, today, words) for n in range(start, min(start + batch, rows))])
@@ -0,0 +1,189 @@
+"""
+On-disk cache of fetched HTML.
+
+Pages are stored zlib-compressed in a single SQLite file, keyed by the
+normalized URL. Each source has its own TTL, and the whole cache is capped in
+size with least-recently-used eviction. Within the TTL a re-run (or parser
+development against yesterday's pages) needs no network at all.
+
+Settings (environment):
+    HTML_CACHE=0          disable the cache
+    HTML_CACHE_DIR        directory for the cache file (default .cache)
+    HTML_CACHE_MAX_MB     size cap for stored (compressed) pages (default 500)
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+CACHE_ENABLED = os.getenv("HTML_CACHE", "1") != "0"
+CACHE_DIR = os.getenv("HTML_CACHE_DIR", ".cache")
+CACHE_MAX_BYTES = int(float(os.getenv("HTML_CACHE_MAX_MB", "500")) * 1024 * 1024)
+
+# Attempts to open a cache file another process has locked, and the first delay in seconds
+OPEN_RETRIES = 5
+OPEN_BACKOFF = 0.2
+
+# Time-to-live per source, in seconds
+CACHE_TTLS = {
+    "seek": 24 * 3600,
+    "jora": 24 * 3600,
+    "jobsearch": 12 * 3600,
+    "career": 12 * 3600,
+}
+DEFAULT_TTL = 12 * 3600
+
+# Per-click / per-search tracking params that don't change the page content
+TRACKING_PARAMS = {
+    # seek
+    "type", "ref", "origin",
+    # jora
+    "abstract_type", "disallow", "fsv", "sl", "sol_key", "sp", "sponsored",
+    "sq", "sr", "tk", "trigger_source",
+    # careerone
+    "page_referral_element",
+}
+
+
+def normalize_url(url):
+    """
+    Cache key for a URL: lowercase scheme/host, no fragment, tracking params
+    dropped and the remaining query params sorted.
+    """
+    parts = urlsplit(url)
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k not in TRACKING_PARAMS and not k.startswith("utm_")
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+class HtmlCache:
+    """
+    Read-through page cache for one source.
+
+    Usage:
+        cache = HtmlCache("seek")
+        html = cache.get(url)
+        if html is None:
+            html = fetch(url)
+            cache.put(url, html)
+    """
+
+    def __init__(self, source, ttl=None, cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES,
+                 enabled=CACHE_ENABLED):
+        self.source = source
+        self.ttl = ttl if ttl is not None else CACHE_TTLS.get(source, DEFAULT_TTL)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        self._conn = None
+
+        if self.enabled:
+            os.makedirs(cache_dir, exist_ok=True)
+            self.path = os.path.join(cache_dir, "html_cache.sqlite3")
+            self._open()
+
+    def _open(self):
+        """
+        Connect and create the table. Scrapers run in parallel and share the
+        file, so a locked database is retried; if it stays locked the cache is
+        turned off for this source rather than failing the scrape.
+        """
+        for attempt in range(OPEN_RETRIES):
+            conn = None
+            try:
+                conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+                # Switching the journal mode needs an exclusive lock: only do it once per file
+                if conn.execute("PRAGMA journal_mode").fetchone()[0].lower() != "wal":
+                    conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    """CREATE TABLE IF NOT EXISTS pages (
+                        key TEXT PRIMARY KEY,
+                        source TEXT NOT NULL,
+                        url TEXT NOT NULL,
+                        fetched_at REAL NOT NULL,
+                        last_access REAL NOT NULL,
+                        size INTEGER NOT NULL,
+                        body BLOB NOT NULL
+                    )"""
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS ix_pages_last_access ON pages (last_access)")
+                conn.commit()
+                self._conn = conn
+                return
+            except sqlite3.OperationalError as e:
+                if conn is not None:
+                    conn.close()
+                error = e
+                time.sleep(OPEN_BACKOFF * 2 ** attempt)
+        print(f"[{self.source}] HTML cache unavailable ({error}), continuing without it")
+        self.enabled = False
+
+    def get(self, url):
+        """Return cached HTML for `url`, or None if missing or older than the TTL"""
+        if not self.enabled:
+            return None
+        key = normalize_url(url)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, fetched_at FROM pages WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                self.stats["misses"] += 1
+                return None
+            self._conn.execute("UPDATE pages SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.stats["hits"] += 1
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def put(self, url, html):
+        """Store the HTML for `url`, then evict least-recently-used pages over the size cap"""
+        if not self.enabled or not html:
+            return
+        body = zlib.compress(html.encode("utf-8"), 6)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (key, source, url, fetched_at, last_access, size, body) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (normalize_url(url), self.source, url, now, now, len(body), body),
+            )
+            self.stats["stores"] += 1
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT key, size FROM pages ORDER BY last_access").fetchall()
+        doomed = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM pages WHERE key = ?", doomed)
+        self.stats["evictions"] += len(doomed)
+
+    def print_stats(self):
+        if not self.enabled:
+            return
+        lookups = self.stats["hits"] + self.stats["misses"]
+        rate = (self.stats["hits"] / lookups * 100) if lookups else 0.0
+        print(
+            f"[{self.source}] cache hits: {self.stats['hits']}, misses: {self.stats['misses']} "
+            f"({rate:.0f}% hit rate), stored: {self.stats['stores']}, evicted: {self.stats['evictions']}"
+        )
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -1,21 +1,13 @@
-from seleniumbase import Driver
+import sys
 import time
-from bs4 import BeautifulSoup
-import json
-import os
-import re
-from utils import parse_posted_date, parse_location, parse_salary
 
-# Initialize the driver
-driver = Driver(uc=True, headless=True)
+from parsers import parse_career_jobs
+from fetcher import is_usable
+from waits import wait_for_selector
+from scraper import Scraper, register, run_in_process
 
 url = "https://www.careerone.com.au/jobs/in-australia"
 
-# Open URL and handle captcha if needed
-driver.get(url)
-# driver.uc_gui_click_captcha() # Optional if needed
-time.sleep(5)
-
 # Function to scroll down gradually
 def scroll_down(driver, pause_time=1, scrolls=5):
     """Scroll down to load lazy content"""
@@ -43,185 +35,144 @@ def close_popups(driver):
     except:
         pass
 
-def parse_career_jobs(html):
-    soup = BeautifulSoup(html, 'html.parser')
-    parsed_jobs = []
-    
-    # Iterate over job cards
-    # Based on browser subagent: .job-card-detailed
-    job_cards = soup.select(".job-card-detailed")
-    
-    for card in job_cards:
-        job = {}
-        
-        # Title
-        title_el = card.select_one("h2 a")
-        job["job_title"] = title_el.get_text(strip=True) if title_el else None
-        job["url"] = None
-        if title_el and title_el.has_attr('href'):
-            # Ensure absolute URL
-            href = title_el['href']
-            if href.startswith('/'):
-                job["url"] = f"https://www.careerone.com.au{href}"
-            else:
-                job["url"] = href
-
-        # Company
-        company_el = card.select_one("h3 a")
-        job["company_name"] = company_el.get_text(strip=True) if company_el else None
-
-        # Location
-        # Finds div with location-like text or specific class if available
-        # Previous scraper used a somewhat generic locator, let's try to be robust
-        # This selector targets the location text usually found under company
-        location_el = card.select_one(".text-body-4.text-truncate a") 
-        raw_location = location_el.get_text(strip=True) if location_el else None
-        job["location"] = raw_location
-        
-        loc_data = parse_location(raw_location)
-        job["city"] = loc_data["city"]
-        job["state"] = loc_data["state"] # type: ignore
-        job["country"] = loc_data["country"]
-        
-        # Salary
-        # Looking for text that looks like salary
-        salary_el = card.find(string=lambda t: t and '$' in t)
-        raw_salary = salary_el.strip() if salary_el else None
-        # Try a more specific selector if that failed
-        if not raw_salary:
-             sal_span = card.select_one("span.text-title-4")
-             if sal_span:
-                 raw_salary = sal_span.get_text(strip=True)
-
-        job["salary_range"] = raw_salary
-        min_sal, max_sal = parse_salary(raw_salary)
-        job["min_annual_salary"] = min_sal
-        job["max_annual_salary"] = max_sal
-
-        # Description / Key Points
-        # Updated via second loop below
-        job["job_description"] = None
-        
-        # Work Type
-        # Often a badge or text
-        work_type = None
-        # Look for common work type words
-        all_text = card.get_text(" ", strip=True).lower()
-        if "full time" in all_text: work_type = "Full time"
-        elif "part time" in all_text: work_type = "Part time"
-        elif "casual" in all_text: work_type = "Casual"
-        elif "contract" in all_text: work_type = "Contract"
-        
-        job["work_type"] = work_type
-        
-        # Remote/Hybrid
-        job["is_remote"] = "remote" in all_text
-        job["is_hybrid"] = "hybrid" in all_text
-        
-        # job["classification"] = None # REMOVED 
-
-        # Posted Date
-        # Look for "2d ago" etc.
-        posted_el = card.select_one(".job-date")
-        raw_posted = posted_el.get_text(strip=True) if posted_el else None
-        job["posted_date"] = parse_posted_date(raw_posted)
-        
-        parsed_jobs.append(job)
-        
-    # ------------- SECOND LOOP: Update Job_description ---------------
-    job_descrip_containers = soup.find_all('div', class_="d-block cursor-pointer")
-
-    for i, div in enumerate(job_descrip_containers, 1):
-        # Find the <ul> inside this div
-        ul_tag = div.find('ul')
-        if ul_tag:
-            # Extract all <li> text
-            key_points = [li.get_text(strip=True) for li in ul_tag.find_all('li')]
-            # Join as single string or keep as list
-            key_points_text = "; ".join(key_points)
-
-            # Update existing entry
-            if i-1 < len(parsed_jobs):  # safety check
-                parsed_jobs[i-1]["job_description"] = key_points_text
-        
-    return parsed_jobs
-
-
-# ==========================================
-# MAIN LOOP
-# ==========================================
-
-all_jobs = []
-max_pages = 5 # Set number of pages to scrape
-
-try:
-    # Close popup if it exists
-    close_popups(driver)
-    
-    for page in range(1, max_pages + 1):
-        print(f"\n--- Scraping Page {page} ---")
-        
-        # Scroll to load everything
-        scroll_down(driver, pause_time=1, scrolls=5)
-        
-        # Parse content
-        html = driver.page_source
-        jobs_on_page = parse_career_jobs(html)
-        print(f"  Found {len(jobs_on_page)} jobs")
-        all_jobs.extend(jobs_on_page)
-        
-        if page < max_pages:
-            # Go to next page
-            try:
-                # Based on subagent investigation: button.page-link[aria-label="Go to next page"]
-                # Sometimes it might be simple "Next" text or similar
-                next_btn = driver.find_element("css selector", "button.page-link[aria-label='Go to next page']")
-                
-                # Check if disabled
-                if not next_btn.is_enabled():
-                    print("Next button disabled. Reached end.")
+def page_url(page):
+    """Address of a result page; also the cache key for pages reached by clicking Next"""
+    return url if page == 1 else f"{url}?page={page}"
+
+
+@register
+class CareerScraper(Scraper):
+    name = "career"
+    source = "careerone"
+
+    # Every job card carries this class; without it the page is a challenge or shell
+    listing_marker = "job-card-detailed"
+    listing_selector = ".job-card-detailed"
+    listing_baseline = 5
+
+    max_pages = 5 # Set number of pages to scrape
+
+    def listing_urls(self):
+        for page in range(1, self.max_pages + 1):
+            yield page_url(page)
+
+    def parse_listing(self, html, url):
+        return parse_career_jobs(html)
+
+    def listing_pages(self, ctx):
+        start_page = yield from self._server_rendered_pages(ctx)
+        if start_page <= self.max_pages:
+            yield from self._browser_pages(ctx, start_page)
+
+    def _server_rendered_pages(self, ctx):
+        """
+        CACHE / HTTP FIRST: pages are addressable as ?page=N; read them from
+        the cache or fetch them over plain HTTP until one comes back unusable.
+        Returns the page the browser should carry on from.
+        """
+        start_page = 1
+        previous_urls = None
+        while start_page <= self.max_pages:
+            current = page_url(start_page)
+            html = ctx.cache.get(current)
+            origin = "cache"
+            if html is None and ctx.http:
+                html = ctx.http.fetch(current, expect=self.listing_marker)
+                origin = "http"
+                if html is not None:
+                    ctx.cache.put(current, html)
+            if html is None:
+                break
+            ctx.metrics.page(html)
+            jobs_on_page = ctx.parse_listing(html, current)
+            page_urls = [job["url"] for job in jobs_on_page]
+            if not jobs_on_page or page_urls == previous_urls:
+                # Empty, or the site ignored ?page= and served the same results again
+                break
+            print(f"\n--- Scraping Page {start_page} ({origin}) ---")
+            yield current, jobs_on_page
+            previous_urls = page_urls
+            start_page += 1
+        return start_page
+
+    def _browser_pages(self, ctx, start_page):
+        """BROWSER: remaining pages via the Next button"""
+        driver = ctx.get_driver()
+
+        try:
+            # Open URL and handle captcha if needed
+            driver.get(url)
+            # driver.uc_gui_click_captcha() # Optional if needed
+            wait_for_selector(driver, self.listing_selector, source=self.name, baseline=self.listing_baseline)
+
+            # Close popup if it exists
+            close_popups(driver)
+
+            for page in range(1, self.max_pages + 1):
+                # Loaded by driver.get or the last Next click
+                ctx.page_visited()
+                if page >= start_page:
+                    print(f"\n--- Scraping Page {page} ---")
+
+                    # Scroll to load everything
+                    scroll_down(driver, pause_time=1, scrolls=5)
+
+                    # Parse content
+                    html = driver.page_source
+                    ctx.metrics.page(html)
+                    if is_usable(html, self.listing_marker):
+                        ctx.cache.put(page_url(page), html)
+                    yield page_url(page), ctx.parse_listing(html, page_url(page))
+
+                if page < self.max_pages and not self._next_page(driver):
                     break
-                    
-                # Click
-                driver.execute_script("arguments[0].click();", next_btn)
-                print("  Clicked Next >")
-                time.sleep(5)  # Wait for reload
-                
-            except Exception as e:
-                print(f"  Could not find or click Next button: {e}")
-                # Try fallback selector just in case
-                try:
-                     links = driver.find_elements("css selector", "a.page-link")
-                     found_next = False
-                     for link in links:
-                         if "next" in link.text.lower():
-                             link.click()
-                             found_next = True
-                             print("  Clicked Next (fallback) >")
-                             time.sleep(5)
-                             break
-                     if not found_next:
-                         print("  No Next button found (fallback). Stopping.")
-                         break
-                except:
-                     print("  Stopping pagination.")
-                     break
-                     
-except Exception as e:
-    print(f"An error occurred: {e}")
-
-finally:
-    driver.quit()
-
-
-print(f"\nTotal jobs collected: {len(all_jobs)}")
-
-# Save JSON
-output_dir = "output/career"
-os.makedirs(output_dir, exist_ok=True)
-output_file = os.path.join(output_dir, "career_jobs.json")
-
-with open(output_file, "w", encoding="utf-8") as f:
-    json.dump(all_jobs, f, indent=2, ensure_ascii=False)
-
-print(f"Saved to {output_file}")
+
+        except Exception as e:
+            print(f"An error occurred: {e}")
+
+    def _next_page(self, driver):
+        """Click through to the next result page; False when there is none"""
+        # Any card from this page; it goes stale once the next page renders
+        try:
+            current_card = driver.find_element("css selector", self.listing_selector)
+        except Exception:
+            current_card = None
+
+        try:
+            # Based on subagent investigation: button.page-link[aria-label="Go to next page"]
+            # Sometimes it might be simple "Next" text or similar
+            next_btn = driver.find_element("css selector", "button.page-link[aria-label='Go to next page']")
+
+            # Check if disabled
+            if not next_btn.is_enabled():
+                print("Next button disabled. Reached end.")
+                return False
+
+            # Click
+            driver.execute_script("arguments[0].click();", next_btn)
+            print("  Clicked Next >")
+            wait_for_selector(driver, self.listing_selector, source=self.name, baseline=self.listing_baseline,
+                              replaces=current_card)  # Wait for reload
+            return True
+
+        except Exception as e:
+            print(f"  Could not find or click Next button: {e}")
+            # Try fallback selector just in case
+            try:
+                 links = driver.find_elements("css selector", "a.page-link")
+                 for link in links:
+                     if "next" in link.text.lower():
+                         link.click()
+                         print("  Clicked Next (fallback) >")
+                         wait_for_selector(driver, self.listing_selector, source=self.name,
+                                           baseline=self.listing_baseline, replaces=current_card)
+                         return True
+                 print("  No Next button found (fallback). Stopping.")
+                 return False
+            except:
+                 print("  Stopping pagination.")
+                 return False
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_in_process(["career"]) else 1)
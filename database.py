@@ -1,39 +1,94 @@
 import os
-from sqlalchemy import create_engine, Column, Integer, String, Date, Text, DateTime, Float
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, Column, Integer, BigInteger, String, Date, Text, DateTime, Float, ForeignKey
+from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.sql import func, expression
-from sqlalchemy import Boolean
+from sqlalchemy import Boolean, Index, Table, inspect, text
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Nothing here connects or reads the environment at import time: importing
+# the models is cheap, and the engine is created on first use from
+# DIRECT_DATABASE_URL (psycopg2 for PostgreSQL), or from whatever URL or
+# engine configure() was given, e.g. configure("sqlite://") in tests.
 
-# Get Database URL, default to psycopg2 one if available for synchronous usage
-# Note: The prompt provided asyncpg for DATABASE_URL, but we are writing a sync script first.
-# We will use DIRECT_DATABASE_URL which uses psycopg2.
-SQLALCHEMY_DATABASE_URL = os.getenv("DIRECT_DATABASE_URL")
+_engine = None
+_sessionmaker = None
 
-if not SQLALCHEMY_DATABASE_URL:
-    raise ValueError("DIRECT_DATABASE_URL environment variable is not set")
+def get_database_url():
+    """DIRECT_DATABASE_URL, from the environment or .env"""
+    load_dotenv()
+    url = os.getenv("DIRECT_DATABASE_URL")
+    if not url:
+        raise ValueError("DIRECT_DATABASE_URL environment variable is not set")
+    return url
 
-# Create engine
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+def create_db_engine(url=None, **kwargs):
+    """
+    Engine for `url` (default: DIRECT_DATABASE_URL). An in-memory SQLite URL
+    gets a single shared connection, so every session sees the same database.
+    """
+    url = url or get_database_url()
+    if url in ("sqlite://", "sqlite:///:memory:"):
+        kwargs.setdefault("poolclass", StaticPool)
+        kwargs.setdefault("connect_args", {"check_same_thread": False})
+    return create_engine(url, **kwargs)
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def configure(url=None, engine=None):
+    """Point the shared engine and SessionLocal at `engine`, or a new engine for `url`"""
+    global _engine, _sessionmaker
+    _engine = engine if engine is not None else create_db_engine(url)
+    _sessionmaker = None
+    return _engine
+
+def get_engine():
+    """The shared engine, created on first use"""
+    if _engine is None:
+        configure()
+    return _engine
+
+def get_sessionmaker():
+    """sessionmaker bound to the shared engine"""
+    global _sessionmaker
+    if _sessionmaker is None:
+        _sessionmaker = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+    return _sessionmaker
+
+def SessionLocal():
+    """A new session on the shared engine"""
+    return get_sessionmaker()()
+
+def __getattr__(name):
+    # `from database import engine` keeps working, without an engine at import time
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Base class for models
 Base = declarative_base()
 
 class Job(Base):
     __tablename__ = "jobs"
+    # Match the filters queries.find_jobs runs; every feed is ordered by (posted_date, id)
+    __table_args__ = (
+        Index("ix_jobs_posted_date_id", "posted_date", "id"),
+        Index("ix_jobs_state_posted_date_id", "state", "posted_date", "id"),
+        # Partial: only the small remote / hybrid subsets are indexed
+        Index("ix_jobs_remote_posted_date_id", "posted_date", "id",
+              postgresql_where=text("is_remote"), sqlite_where=text("is_remote = 1")),
+        Index("ix_jobs_hybrid_posted_date_id", "posted_date", "id",
+              postgresql_where=text("is_hybrid"), sqlite_where=text("is_hybrid = 1")),
+        Index("ix_jobs_salary", "max_annual_salary", "min_annual_salary",
+              postgresql_where=text("min_annual_salary IS NOT NULL"),
+              sqlite_where=text("min_annual_salary IS NOT NULL")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     source = Column(String, index=True)  # 'seek' or 'jobsearch'
     job_title = Column(String, index=True)
     company_name = Column(String, index=True)
     location = Column(String, index=True)
+    # "Toowong" of "Toowong, Brisbane QLD"; city is then Brisbane (see locations.resolve_location)
+    suburb = Column(String, nullable=True)
     city = Column(String, nullable=True)
     state = Column(String, nullable=True)
     country = Column(String, default="Australia")
@@ -41,6 +96,8 @@ class Job(Base):
     is_hybrid = Column(Boolean, default=False)
     # classification = Column(String, nullable=True) # REMOVED
     work_type = Column(String, nullable=True)
+    # Level named in the title, e.g. "Senior" (see normalize.classify)
+    seniority = Column(String, nullable=True)
     salary_range = Column(String, nullable=True)
     min_annual_salary = Column(Float, nullable=True)
     max_annual_salary = Column(Float, nullable=True)
@@ -48,11 +105,141 @@ class Job(Base):
     posted_date = Column(Date, nullable=True)
     job_description = Column(Text, nullable=True)
     url = Column(String, unique=True, index=True) # Unique constraint to prevent duplicates
+    # Digest of the scraped fields (see ingest_jobs.content_hash); unchanged jobs are not rewritten
+    content_hash = Column(String(32), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Last ingest that saw this job, bumped in bulk even when nothing changed
+    last_seen_at = Column(DateTime(timezone=True), nullable=True)
+    # Set by retention.py once the job stops being seen; cleared if it is seen again
+    expired_at = Column(DateTime(timezone=True), nullable=True, index=True)
+
+# Expired jobs moved out of `jobs` by retention.py: the same columns (no
+# unique url, since a job can be archived more than once) plus archived_at.
+# On PostgreSQL the table is partitioned by posted_date, one partition per month.
+jobs_archive = Table(
+    "jobs_archive",
+    Base.metadata,
+    *[Column(column.name, column.type) for column in Job.__table__.columns],
+    Column("archived_at", DateTime(timezone=True), nullable=False),
+    Index("ix_jobs_archive_url", "url"),
+    postgresql_partition_by="RANGE (posted_date)",
+)
+
+class ScrapeRun(Base):
+    """One run of the scrapers (or a standalone ingest); see metrics.py"""
+    __tablename__ = "scrape_runs"
+
+    id = Column(Integer, primary_key=True)
+    mode = Column(String)  # 'processes', 'in-process' or 'ingest'
+    status = Column(String, default="running")
+    started_at = Column(DateTime(timezone=True), index=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+class ScrapeRunSource(Base):
+    """What one source did in a run: scrape throughput and ingest outcome"""
+    __tablename__ = "scrape_run_sources"
+    __table_args__ = (
+        Index("ix_scrape_run_sources_source_started_at", "source", "started_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    run_id = Column(Integer, ForeignKey("scrape_runs.id"), index=True)
+    source = Column(String)
+    status = Column(String, nullable=True)  # 'ok', 'failed' or 'timeout'; NULL when only ingested
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    pages = Column(Integer, default=0)
+    jobs = Column(Integer, default=0)
+    parse_failures = Column(Integer, default=0)
+    bytes_fetched = Column(BigInteger, default=0)
+    inserted = Column(Integer, default=0)
+    updated = Column(Integer, default=0)
+    unchanged = Column(Integer, default=0)
+
+def add_missing_columns(conn):
+    """
+    Add model columns that an existing table predates (create_all only creates
+    missing tables). Added columns are nullable and have no default.
+    """
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column['name'] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            column_type = column.type.compile(dialect=conn.dialect)
+            conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+
+def add_missing_indexes(conn):
+    """Create model indexes that an existing table predates"""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+# Full-text search over title, company and description (see search.py).
+# PostgreSQL: a generated, weighted tsvector column with a GIN index.
+# SQLite: an external-content FTS5 table kept in sync by triggers.
+PG_SEARCH_DDL = [
+    """ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(job_title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(company_name, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(job_description, '')), 'C')
+    ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_jobs_search_vector ON jobs USING GIN (search_vector)",
+]
+
+SQLITE_SEARCH_DDL = [
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts (rowid, job_title, company_name, job_description)
+        VALUES (new.id, new.job_title, new.company_name, new.job_description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts (jobs_fts, rowid, job_title, company_name, job_description)
+        VALUES ('delete', old.id, old.job_title, old.company_name, old.job_description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE OF job_title, company_name, job_description ON jobs BEGIN
+        INSERT INTO jobs_fts (jobs_fts, rowid, job_title, company_name, job_description)
+        VALUES ('delete', old.id, old.job_title, old.company_name, old.job_description);
+        INSERT INTO jobs_fts (rowid, job_title, company_name, job_description)
+        VALUES (new.id, new.job_title, new.company_name, new.job_description);
+    END""",
+]
+
+def setup_full_text_search(conn):
+    """Create the search column/index (PostgreSQL) or FTS5 table and triggers (SQLite)"""
+    if conn.dialect.name == "postgresql":
+        for statement in PG_SEARCH_DDL:
+            conn.execute(text(statement))
+    elif conn.dialect.name == "sqlite":
+        exists = inspect(conn).has_table("jobs_fts")
+        if not exists:
+            conn.execute(text(
+                "CREATE VIRTUAL TABLE jobs_fts USING fts5("
+                "job_title, company_name, job_description, "
+                "content='jobs', content_rowid='id', tokenize='porter unicode61')"
+            ))
+        for statement in SQLITE_SEARCH_DDL:
+            conn.execute(text(statement))
+        if not exists:
+            # Index the rows that predate the table
+            conn.execute(text("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')"))
+
+def setup_archive(conn):
+    """On PostgreSQL, give jobs_archive a default partition for undated jobs"""
+    if conn.dialect.name == "postgresql":
+        conn.execute(text("CREATE TABLE IF NOT EXISTS jobs_archive_default PARTITION OF jobs_archive DEFAULT"))
 
-def init_db():
-    """Create tables in the database"""
+def init_db(engine=None):
+    """Create tables in the database (default: the shared engine)"""
+    engine = engine or get_engine()
     Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        add_missing_columns(conn)
+        add_missing_indexes(conn)
+        setup_full_text_search(conn)
+        setup_archive(conn)
 
 def get_db():
     """Dependency for DB session"""
@@ -61,3 +248,77 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# ---------------------------------------------------------------------------
+# Async engine
+#
+# DATABASE_URL is the asyncpg URL; when it is not set the async URL is derived
+# from DIRECT_DATABASE_URL (postgresql:// -> postgresql+asyncpg://,
+# sqlite:// -> sqlite+aiosqlite://). The engine is created on first use.
+# ---------------------------------------------------------------------------
+
+# Connection pool sizing for the async engine (ignored for SQLite)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+_async_engine = None
+_async_sessionmaker = None
+
+def to_async_url(url):
+    """Swap a sync driver in a database URL for its async counterpart"""
+    scheme, sep, rest = url.partition("://")
+    return ASYNC_DRIVERS.get(scheme, scheme) + sep + rest
+
+def create_async_db_engine(url, pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW,
+                           pool_timeout=DB_POOL_TIMEOUT, pool_recycle=DB_POOL_RECYCLE):
+    """Async engine for `url` with the given pool sizing"""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    url = to_async_url(url)
+    if url.startswith("sqlite"):
+        return create_async_engine(url)
+    return create_async_engine(url, pool_size=pool_size, max_overflow=max_overflow,
+                               pool_timeout=pool_timeout, pool_recycle=pool_recycle,
+                               pool_pre_ping=True)
+
+def get_async_engine():
+    """The shared async engine, created on first use"""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_db_engine(os.getenv("DATABASE_URL") or get_database_url())
+    return _async_engine
+
+def get_async_sessionmaker(async_engine=None):
+    """async_sessionmaker bound to `async_engine` (default: the shared one)"""
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    global _async_sessionmaker
+    if async_engine is not None:
+        return async_sessionmaker(async_engine, expire_on_commit=False)
+    if _async_sessionmaker is None:
+        _async_sessionmaker = async_sessionmaker(get_async_engine(), expire_on_commit=False)
+    return _async_sessionmaker
+
+async def init_db_async(async_engine=None):
+    """Create tables (and missing columns) through the async engine"""
+    async with (async_engine or get_async_engine()).begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(add_missing_columns)
+        await conn.run_sync(add_missing_indexes)
+        await conn.run_sync(setup_full_text_search)
+        await conn.run_sync(setup_archive)
+
+async def get_async_db():
+    """Dependency for an async DB session"""
+    async with get_async_sessionmaker()() as db:
+        yield db
@@ -0,0 +1,207 @@
+"""
+Warm pool of browser drivers shared by every scraper in a run.
+
+Starting Chrome costs seconds per instance, and a crashed driver used to
+mean another cold start in the middle of a scrape. DriverPool starts a few
+browsers ahead of time in the background, lends them to whichever source
+or detail worker needs one, checks that a driver still responds before
+handing it out again, and replaces it after DRIVER_MAX_PAGES pages or when
+the borrower reports a failure.
+
+Settings (environment):
+    DRIVER_POOL_WARM      browsers started ahead of time (default 1)
+    DRIVER_MAX_PAGES      pages a driver serves before it is replaced (default 50)
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from seleniumbase import Driver
+
+DRIVER_POOL_WARM = int(os.getenv("DRIVER_POOL_WARM", "1"))
+DRIVER_MAX_PAGES = int(os.getenv("DRIVER_MAX_PAGES", "50"))
+
+
+def start_driver(headless=True):
+    return Driver(uc=True, headless=headless)
+
+
+def is_healthy(driver):
+    """True if the browser still answers; a dead session raises"""
+    try:
+        return driver.execute_script("return 1") == 1
+    except Exception:
+        return False
+
+
+def quit_driver(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class DriverPool:
+    """
+    At most `size` live browsers, headless and headed kept apart.
+
+    Usage:
+        pool = DriverPool(size=4)
+        pool.warm(2)
+        with pool.lease() as driver:
+            driver.get(url)
+        pool.close()
+    """
+
+    def __init__(self, size=4, max_pages=DRIVER_MAX_PAGES, factory=start_driver):
+        self.size = max(1, size)
+        self.max_pages = max(1, max_pages)
+        self.factory = factory
+        self.stats = {"started": 0, "reused": 0, "recycled": 0, "unhealthy": 0, "startup_seconds": 0.0}
+
+        self._idle = []       # [(driver, headless)], most recently returned last
+        self._headless = {}   # id(driver) -> headless
+        self._pages = {}      # id(driver) -> pages served
+        self._live = 0        # started or starting, idle or lent out
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _start(self, headless):
+        """Start a browser for a slot already counted in _live"""
+        start = time.monotonic()
+        try:
+            driver = self.factory(headless)
+        except Exception:
+            with self._cond:
+                self._live -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self.stats["started"] += 1
+            self.stats["startup_seconds"] += time.monotonic() - start
+            self._headless[id(driver)] = headless
+            self._pages[id(driver)] = 0
+        return driver
+
+    def _discard(self, driver):
+        """Quit a driver and free its slot"""
+        quit_driver(driver)
+        with self._cond:
+            self._headless.pop(id(driver), None)
+            self._pages.pop(id(driver), None)
+            self._live -= 1
+            self._cond.notify()
+
+    def warm(self, count=DRIVER_POOL_WARM, headless=True):
+        """Start up to `count` idle browsers in the background"""
+        def warm_one():
+            try:
+                driver = self._start(headless)
+            except Exception as e:
+                print(f"  Driver pool: warm-up failed ({e})")
+                return
+            with self._cond:
+                if not self._closed:
+                    self._idle.append((driver, headless))
+                    self._cond.notify()
+                    return
+            self._discard(driver)
+
+        for _ in range(count):
+            with self._cond:
+                if self._closed or self._live >= self.size:
+                    break
+                self._live += 1
+            threading.Thread(target=warm_one, daemon=True, name="driver-warm").start()
+
+    def acquire(self, headless=True):
+        """Borrow a healthy driver, starting one if there is room, else wait for one"""
+        while True:
+            driver = stale = None
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("DriverPool is closed")
+                    match = next((i for i, (_, h) in enumerate(self._idle) if h == headless), None)
+                    if match is not None:
+                        driver, _ = self._idle.pop(match)
+                        break
+                    if self._live < self.size:
+                        self._live += 1
+                        break
+                    if self._idle:
+                        # Full of idle browsers in the other mode: hand one's slot over
+                        stale, _ = self._idle.pop(0)
+                        self._headless.pop(id(stale), None)
+                        self._pages.pop(id(stale), None)
+                        break
+                    self._cond.wait()
+
+            if driver is None:
+                if stale is not None:
+                    quit_driver(stale)
+                return self._start(headless)
+
+            if is_healthy(driver):
+                with self._cond:
+                    self.stats["reused"] += 1
+                return driver
+            with self._cond:
+                self.stats["unhealthy"] += 1
+            self._discard(driver)
+
+    def release(self, driver, failed=False, pages=1):
+        """
+        Return a borrowed driver after it served `pages` pages. It is replaced
+        rather than reused when `failed` is set or it has reached max_pages.
+        """
+        with self._cond:
+            pages += self._pages.get(id(driver), 0)
+            self._pages[id(driver)] = pages
+            headless = self._headless.get(id(driver), True)
+            retire = failed or pages >= self.max_pages or self._closed
+            if retire:
+                self.stats["recycled"] += int(not self._closed)
+            else:
+                self._idle.append((driver, headless))
+                self._cond.notify()
+        if retire:
+            self._discard(driver)
+
+    @contextmanager
+    def lease(self, headless=True):
+        """Borrow a driver for one page; an exception marks it failed"""
+        driver = self.acquire(headless)
+        try:
+            yield driver
+        except Exception:
+            self.release(driver, failed=True)
+            raise
+        self.release(driver)
+
+    def print_stats(self):
+        if not self.stats["started"]:
+            return
+        avg = self.stats["startup_seconds"] / self.stats["started"]
+        print(
+            f"Driver pool: started {self.stats['started']} (avg startup {avg:.1f}s), "
+            f"reused {self.stats['reused']}, recycled {self.stats['recycled']}, "
+            f"unhealthy {self.stats['unhealthy']}"
+        )
+
+    def close(self):
+        """Quit every idle driver; drivers still lent out are quit when returned"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for driver, _ in idle:
+            self._discard(driver)
@@ -0,0 +1,301 @@
+"""
+Shared page fetching helpers for the scrapers.
+
+HttpFetcher tries a plain keep-alive HTTP request first and only reports a
+page as unusable when the response looks like a bot challenge or an empty
+JavaScript shell; callers then fall back to the browser.
+
+DetailFetchPool visits job detail pages with several browsers at once instead
+of walking the URL list on a single driver. Workers borrow browsers from a
+DriverPool (see drivers.py) page by page, and a per-domain semaphore caps how
+many of them hit the same site concurrently.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from drivers import DriverPool
+from waits import wait_for_selector, DEFAULT_TIMEOUT
+
+# Pool sizing, overridable from the environment (e.g. in CI)
+DETAIL_WORKERS = int(os.getenv("DETAIL_WORKERS", "4"))
+DETAIL_PER_DOMAIN = int(os.getenv("DETAIL_PER_DOMAIN", "4"))
+
+# Set HTTP_FIRST=0 to always render pages in the browser
+HTTP_FIRST = os.getenv("HTTP_FIRST", "1") != "0"
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-AU,en;q=0.9",
+}
+
+# Status codes that mean "you look like a bot", not "page missing"
+BLOCKED_STATUS_CODES = {401, 403, 429, 503}
+
+# Lowercase fragments found on Cloudflare / PerimeterX / DataDome style challenge pages
+CHALLENGE_MARKERS = (
+    "cf-browser-verification",
+    "challenge-platform",
+    "cf-challenge",
+    "cf-turnstile",
+    "<title>just a moment",
+    "attention required! | cloudflare",
+    "px-captcha",
+    "_incapsula_resource",
+    "captcha-delivery.com",
+)
+
+# Anything smaller than this cannot be a real job page
+MIN_BODY_LENGTH = 512
+
+
+def looks_like_challenge(html):
+    """True if the HTML is a bot-check interstitial rather than the real page"""
+    lowered = html.lower()
+    return any(marker in lowered for marker in CHALLENGE_MARKERS)
+
+
+def looks_like_shell(html, expect=None):
+    """
+    True if the HTML is an empty client-side shell.
+    `expect` is a fragment the parser depends on (e.g. 'jobAdDetails');
+    when given, its absence means the content was never server-rendered.
+    """
+    if len(html) < MIN_BODY_LENGTH:
+        return True
+    if expect and expect not in html:
+        return True
+    return False
+
+
+def is_usable(html, expect=None):
+    """True if the page is real content the parsers can use (and worth caching)"""
+    return bool(html) and not looks_like_challenge(html) and not looks_like_shell(html, expect)
+
+
+class HttpFetcher:
+    """
+    Pooled keep-alive HTTP client.
+    fetch() returns the body when it is usable by the parsers, otherwise None
+    so the caller can render the page in the browser instead.
+    """
+
+    def __init__(self, pool_size=DETAIL_WORKERS, timeout=15, headers=None):
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.stats = {"ok": 0, "fallback": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def fetch(self, url, expect=None):
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.RequestException as e:
+            print(f"  HTTP fetch failed for {url}: {e}")
+            self._count("fallback")
+            return None
+
+        html = response.text
+        if (
+            response.status_code in BLOCKED_STATUS_CODES
+            or not response.ok
+            or not is_usable(html, expect)
+        ):
+            self._count("fallback")
+            return None
+
+        self._count("ok")
+        return html
+
+    def close(self):
+        self.session.close()
+
+
+def fetch_page(url, http, get_driver, expect=None, wait_selector=None,
+               timeout=DEFAULT_TIMEOUT, source="default", baseline=None, cache=None):
+    """
+    Fetch a one-off page (e.g. a listing page): the cache first, then plain
+    HTTP, then the browser returned by `get_driver()` if the response was
+    unusable. In the browser, waits for `wait_selector` before reading the page.
+    """
+    if cache:
+        html = cache.get(url)
+        if html is not None:
+            return html
+
+    html = http.fetch(url, expect=expect) if http else None
+    if html is None:
+        driver = get_driver()
+        driver.get(url)
+        if wait_selector:
+            wait_for_selector(driver, wait_selector, timeout=timeout, source=source, baseline=baseline)
+        html = driver.page_source
+
+    if cache and is_usable(html, expect):
+        cache.put(url, html)
+    return html
+
+
+class DetailFetchPool:
+    """
+    Bounded pool of workers for fetching job detail pages.
+    Each page is tried over pooled HTTP first; a browser is only borrowed
+    from the DriverPool when a page needs rendering.
+
+    The worker threads live as long as the pool, so several sources can
+    share one pool (and its per-domain limits) by passing their own page
+    settings to fetch_all().
+
+    Usage:
+        with DetailFetchPool(workers=4, per_domain=2) as pool:
+            for url, job in pool.fetch_all(urls, extract_job_details):
+                ...
+    """
+
+    # Per-page settings that fetch()/fetch_all() callers may override
+    PAGE_OPTIONS = ("wait_selector", "wait_timeout", "baseline", "source", "expect", "cache")
+
+    def __init__(self, workers=DETAIL_WORKERS, per_domain=DETAIL_PER_DOMAIN,
+                 wait_selector=None, wait_timeout=DEFAULT_TIMEOUT, baseline=None,
+                 source="default", headless=True, http_first=HTTP_FIRST, expect=None,
+                 cache=None, http=None, drivers=None):
+        self.workers = max(1, workers)
+        self.per_domain = max(1, per_domain)
+        self.wait_selector = wait_selector
+        self.wait_timeout = wait_timeout
+        self.baseline = baseline
+        self.source = source
+        self.headless = headless
+        self.expect = expect
+        self.cache = cache
+        # A fetcher passed in is shared with the caller, who closes it
+        self._owns_http = http is None
+        if http is None and http_first:
+            http = HttpFetcher(pool_size=self.workers)
+        self.http = http if http_first else None
+
+        # A driver pool passed in is shared with the caller, who closes it
+        self._owns_drivers = drivers is None
+        self.drivers = drivers or DriverPool(size=self.workers)
+
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._domain_slots = {}
+        self._domain_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _options(self, overrides):
+        unknown = set(overrides) - set(self.PAGE_OPTIONS)
+        if unknown:
+            raise TypeError(f"Unknown page options: {', '.join(sorted(unknown))}")
+        options = {name: getattr(self, name) for name in self.PAGE_OPTIONS}
+        options.update(overrides)
+        return options
+
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                    thread_name_prefix="detail")
+            return self._executor
+
+    def _domain_slot(self, url):
+        """Semaphore limiting concurrent requests to the URL's domain"""
+        domain = urlparse(url).netloc
+        with self._domain_lock:
+            slot = self._domain_slots.get(domain)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.per_domain)
+                self._domain_slots[domain] = slot
+            return slot
+
+    def fetch(self, url, **overrides):
+        """Return the page HTML from the cache, over plain HTTP when possible, otherwise rendered in the browser"""
+        options = self._options(overrides)
+        cache = options["cache"]
+        if cache:
+            html = cache.get(url)
+            if html is not None:
+                return html
+
+        html = self._fetch_live(url, options)
+        if cache and is_usable(html, options["expect"]):
+            cache.put(url, html)
+        return html
+
+    def _fetch_live(self, url, options):
+        with self._domain_slot(url):
+            if self.http:
+                html = self.http.fetch(url, expect=options["expect"])
+                if html is not None:
+                    return html
+
+            with self.drivers.lease(self.headless) as driver:
+                driver.get(url)
+                if options["wait_selector"]:
+                    wait_for_selector(driver, options["wait_selector"], timeout=options["wait_timeout"],
+                                      source=options["source"], baseline=options["baseline"])
+                return driver.execute_script("return document.documentElement.outerHTML")
+
+    def _fetch_and_parse(self, url, parse, overrides):
+        html = self.fetch(url, **overrides)
+        return parse(html)
+
+    def fetch_all(self, urls, parse, **overrides):
+        """
+        Fetch every URL and run `parse(html)` on it.
+        Keyword arguments override the pool's page settings for these URLs
+        (see PAGE_OPTIONS), e.g. source="jora", expect="job-description-container".
+        Yields (url, parsed) pairs in completion order; pages that fail are
+        reported and yielded as (url, None).
+        """
+        self._options(overrides)
+        total = len(urls)
+        executor = self._get_executor()
+        futures = {executor.submit(self._fetch_and_parse, url, parse, overrides): url for url in urls}
+        try:
+            for done, future in enumerate(as_completed(futures), start=1):
+                url = futures[future]
+                try:
+                    parsed = future.result()
+                    print(f"[{done}/{total}] Fetched: {url}")
+                except Exception as e:
+                    print(f"[{done}/{total}] Error fetching {url}: {e}")
+                    parsed = None
+                yield url, parsed
+        finally:
+            # The caller stopped early: drop the pages not started yet
+            for future in futures:
+                future.cancel()
+
+    def close(self):
+        """Stop the workers and close the fetcher and driver pool it owns"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        if self.http and self._owns_http:
+            self.http.close()
+        if self._owns_drivers:
+            self.drivers.close()
@@ -1,25 +1,54 @@
 import os
+import io
+import csv
 import json
+import time
+import hashlib
 import logging
-from datetime import datetime
+import argparse
+import asyncio
+import threading
+from itertools import islice
+from datetime import date, datetime, timezone
+from sqlalchemy import column, func, literal, literal_column, select, table, text, update
+from sqlalchemy.types import DateTime
 from sqlalchemy.orm import Session
-from database import init_db, SessionLocal, Job
+from database import init_db, SessionLocal, Job, init_db_async, get_async_sessionmaker
+from metrics import INGEST_COUNTS, record_ingest
+from output import iter_records, resolve_output_file
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def load_json_file(filepath):
-    """Load JSON file and return data, or empty list if file doesn't exist"""
+# Rows per INSERT ... ON CONFLICT statement
+INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "500"))
+# Rows per transaction in streaming mode
+INGEST_CHUNK_SIZE = int(os.getenv("INGEST_CHUNK_SIZE", "5000"))
+
+# (source tag, scraper output file)
+SOURCE_FILES = [
+    ('seek', "output/seek/seek_jobs.json"),
+    ('jobsearch', "output/jobsearch/jobsearch_jobs.json"),
+    ('jora', "output/jora/jora_jobs.json"),
+    ('careerone', "output/career/career_jobs.json"),
+]
+
+def load_json_file(filepath, lazy=False):
+    """
+    Load a scraper's output (.json or .jsonl, see output.iter_records).
+    Returns a list, or an iterator over the records when lazy=True.
+    Missing or unreadable files give an empty result.
+    """
+    if resolve_output_file(filepath) is None:
+        logger.warning(f"File not found: {filepath}")
+        return iter(()) if lazy else []
+    if lazy:
+        return iter_records(filepath)
     try:
-        if os.path.exists(filepath):
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                logger.info(f"Loaded {len(data)} jobs from {filepath}")
-                return data
-        else:
-            logger.warning(f"File not found: {filepath}")
-            return []
+        data = list(iter_records(filepath))
+        logger.info(f"Loaded {len(data)} jobs from {resolve_output_file(filepath)}")
+        return data
     except Exception as e:
         logger.error(f"Error loading {filepath}: {e}")
         return []
@@ -36,35 +65,199 @@ def parse_date(date_str):
     except Exception:
         return None
 
-def ingest_data():
+def _normalize(value):
+    """Canonical form of a field for hashing: collapsed whitespace, ISO dates, rounded floats"""
+    if isinstance(value, str):
+        return ' '.join(value.split()) or None
+    if isinstance(value, float):
+        return round(value, 2)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+def content_hash(job_dict, ignore=()):
+    """Digest of a prepared row's scraped fields; equal hashes mean nothing worth rewriting changed"""
+    fields = {key: _normalize(value) for key, value in job_dict.items()
+              if key not in ('url', 'content_hash', 'last_seen_at') and key not in ignore}
+    payload = json.dumps(fields, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+def prepare_job(job_data):
+    """Map a scraped record onto the jobs table columns. Returns None for jobs without a URL."""
+    url = job_data.get('url')
+    if not url:
+        return None # Skip jobs without URL
+
+    # Parse numeric fields
+    min_salary = job_data.get('min_annual_salary')
+    max_salary = job_data.get('max_annual_salary')
+
+    job_dict = {
+        'source': job_data.get('source'),
+        'job_title': job_data.get('job_title'),
+        'company_name': job_data.get('company_name'),
+        'location': job_data.get('location'),
+        'suburb': job_data.get('suburb'),
+        'city': job_data.get('city'),
+        'state': job_data.get('state'),
+        'country': job_data.get('country'),
+        'is_remote': job_data.get('is_remote', False),
+        'is_hybrid': job_data.get('is_hybrid', False),
+        # 'classification': job_data.get('classification'), # REMOVED
+        'work_type': job_data.get('work_type'),
+        'seniority': job_data.get('seniority'),
+        'salary_range': job_data.get('salary_range'),
+        'min_annual_salary': float(min_salary) if min_salary else None,
+        'max_annual_salary': float(max_salary) if max_salary else None,
+        # 'posting_time': job_data.get('posting_time'),
+        'posted_date': parse_date(job_data.get('posted_date')),
+        'job_description': job_data.get('job_description'),
+        'url': url
+    }
+    # "30+ days ago" dates back from each run's start: a moving date alone is no change
+    ignore = ('posted_date',) if job_data.get('posted_date_open_ended') else ()
+    job_dict['content_hash'] = content_hash(job_dict, ignore)
+    return job_dict
+
+def _batches(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def _count(by_source, row, outcome, n=1):
+    """Add to the per-source ingest counts, if the caller asked for them"""
+    if by_source is not None:
+        counts = by_source.setdefault(row.get('source'), dict.fromkeys(INGEST_COUNTS, 0))
+        counts[outcome] += n
+
+def _merge_counts(target, counts):
+    for source, source_counts in counts.items():
+        for outcome, n in source_counts.items():
+            _count(target, {'source': source}, outcome, n)
+
+def _dialect_insert(db):
+    """The dialect's INSERT construct with on_conflict_do_update, or None if it has none"""
+    name = db.get_bind().dialect.name
+    if name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+        return insert
+    if name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+        return insert
+    return None
+
+def _upsert_rows_orm(db, rows, now, by_source=None):
+    """Row-by-row fallback for databases without INSERT ... ON CONFLICT"""
+    inserted = updated = unchanged = 0
+    for job_dict in rows:
+        existing_job = db.query(Job).filter(Job.url == job_dict['url']).first()
+        if existing_job and existing_job.content_hash == job_dict['content_hash']:
+            existing_job.last_seen_at = now
+            existing_job.expired_at = None
+            unchanged += 1
+            _count(by_source, job_dict, 'unchanged')
+        elif existing_job:
+            for key, value in job_dict.items():
+                setattr(existing_job, key, value)
+            existing_job.last_seen_at = now
+            existing_job.expired_at = None
+            updated += 1
+            _count(by_source, job_dict, 'updated')
+        else:
+            db.add(Job(**job_dict, last_seen_at=now))
+            inserted += 1
+            _count(by_source, job_dict, 'inserted')
+    db.flush()
+    return inserted, updated, unchanged
+
+def touch_jobs(db, urls, now=None):
+    """Bulk-bump last_seen_at (and revive expired ones) for jobs that were seen again but did not change"""
+    if not urls:
+        return
+    table = Job.__table__
+    db.execute(update(table).where(table.c.url.in_(urls))
+               .values(last_seen_at=now or datetime.now(timezone.utc), expired_at=None))
+
+def upsert_jobs(db, rows, batch_size=INGEST_BATCH_SIZE, by_source=None):
+    """
+    Insert or update prepared job rows (see prepare_job) keyed on the unique url,
+    one multi-row INSERT ... ON CONFLICT (url) DO UPDATE per batch.
+    Rows whose content_hash matches the stored one are not rewritten; only
+    their last_seen_at is bumped, with one UPDATE per batch.
+    Rows that are None are skipped; the first row for a URL in a batch wins,
+    as in iter_unique_jobs.
+    The caller commits. Returns (inserted, updated, unchanged), and adds the
+    same counts per source to `by_source` when given.
+    """
+    rows = (row for row in rows if row)
+    now = datetime.now(timezone.utc)
+    insert = _dialect_insert(db)
+    if insert is None:
+        return _upsert_rows_orm(db, rows, now, by_source)
+
+    table = Job.__table__
+    update_columns = [c.name for c in table.columns if c.name not in ("id", "url", "created_at")]
+    stmt = insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.url],
+        set_={name: stmt.excluded[name] for name in update_columns},
+    )
+    inserted = updated = unchanged = 0
+
+    for batch in _batches(rows, batch_size):
+        # ON CONFLICT cannot touch the same row twice in one statement
+        unique = {}
+        for row in batch:
+            unique.setdefault(row['url'], row)
+        batch = list(unique.values())
+        urls = [row['url'] for row in batch]
+        stored = dict(db.execute(
+            select(table.c.url, table.c.content_hash).where(table.c.url.in_(urls))
+        ).all())
+
+        changed = []
+        same = []
+        for row in batch:
+            if row['url'] in stored and stored[row['url']] == row['content_hash']:
+                same.append(row['url'])
+                _count(by_source, row, 'unchanged')
+            else:
+                changed.append(dict(row, last_seen_at=now, expired_at=None))
+                _count(by_source, row, 'updated' if row['url'] in stored else 'inserted')
+
+        if changed:
+            # executemany: SQLAlchemy sends it as multi-row VALUES where the driver allows
+            db.execute(stmt, changed)
+        touch_jobs(db, same, now)
+
+        unchanged += len(same)
+        updated += len(stored) - len(same)
+        inserted += len(batch) - len(stored)
+
+    return inserted, updated, unchanged
+
+def ingest_data(files=SOURCE_FILES, session_factory=None):
     """Ingest data from JSON files into the database"""
     
     # 1. Initialize Tables
-    logger.info("Initializing database tables...")
-    init_db()
+    if session_factory is None:
+        logger.info("Initializing database tables...")
+        init_db()
+        session_factory = SessionLocal
     
     # 2. Load Data
-    seek_file = "output/seek/seek_jobs.json"
-    jobsearch_file = "output/jobsearch/jobsearch_jobs.json"
-    jora_file = "output/jora/jora_jobs.json"
-    career_file = "output/career/career_jobs.json"
-    
-    seek_data = load_json_file(seek_file)
-    jobsearch_data = load_json_file(jobsearch_file)
-    jora_data = load_json_file(jora_file)
-    career_data = load_json_file(career_file)
-    
-    # Add source tag
-    for job in seek_data:
-        job['source'] = 'seek'
-    for job in jobsearch_data:
-        job['source'] = 'jobsearch'
-    for job in jora_data:
-        job['source'] = 'jora'
-    for job in career_data:
-        job['source'] = 'careerone'
-        
-    all_jobs = seek_data + jobsearch_data + jora_data + career_data
+    all_jobs = []
+    for source, filepath in files:
+        data = load_json_file(filepath)
+        # Add source tag
+        for job in data:
+            job['source'] = source
+        all_jobs.extend(data)
     
     if not all_jobs:
         logger.warning("No jobs found to ingest.")
@@ -75,68 +268,26 @@ def ingest_data():
     for job in all_jobs:
         url = job.get('url')
         if url:
-             # Later entries overwrite earlier ones (e.g. if sources overlap, or just duplicates in list)
-             unique_jobs[url] = job
+             # The first record for a URL wins, as in iter_unique_jobs (e.g. if sources overlap)
+             unique_jobs.setdefault(url, job)
     
     all_jobs = list(unique_jobs.values())
     logger.info(f"Deduplicated jobs. Unique count: {len(all_jobs)}")
 
-    db = SessionLocal()
+    db = session_factory()
     try:
-        total_processed = 0
-        total_inserted = 0
-        total_updated = 0
-        
-        for job_data in all_jobs:
-            total_processed += 1
-            
-            # Extract fields
-            url = job_data.get('url')
-            if not url:
-                continue # Skip jobs without URL
-            
-            # Check if exists
-            existing_job = db.query(Job).filter(Job.url == url).first()
-            
-            # Parse numeric fields
-            min_salary = job_data.get('min_annual_salary')
-            max_salary = job_data.get('max_annual_salary')
-            
-            # Prepare data
-            job_dict = {
-                'source': job_data.get('source'),
-                'job_title': job_data.get('job_title'),
-                'company_name': job_data.get('company_name'),
-                'location': job_data.get('location'),
-                'city': job_data.get('city'),
-                'state': job_data.get('state'),
-                'country': job_data.get('country'),
-                'is_remote': job_data.get('is_remote', False),
-                'is_hybrid': job_data.get('is_hybrid', False),
-                # 'classification': job_data.get('classification'), # REMOVED
-                'work_type': job_data.get('work_type'),
-                'salary_range': job_data.get('salary_range'),
-                'min_annual_salary': float(min_salary) if min_salary else None,
-                'max_annual_salary': float(max_salary) if max_salary else None,
-                # 'posting_time': job_data.get('posting_time'),
-                'posted_date': parse_date(job_data.get('posted_date')),
-                'job_description': job_data.get('job_description'),
-                'url': url
-            }
-            
-            if existing_job:
-                # Update existing
-                for key, value in job_dict.items():
-                    setattr(existing_job, key, value)
-                total_updated += 1
-            else:
-                # Create new
-                new_job = Job(**job_dict)
-                db.add(new_job)
-                total_inserted += 1
-                
+        start = time.time()
+        total_processed = len(all_jobs)
+        by_source = {}
+        total_inserted, total_updated, total_unchanged = upsert_jobs(db, (prepare_job(job) for job in all_jobs),
+                                                                     by_source=by_source)
         db.commit()
-        logger.info(f"Ingestion complete. Processed: {total_processed}, Inserted: {total_inserted}, Updated: {total_updated}")
+        record_ingest(by_source, session_factory=session_factory)
+        elapsed = time.time() - start
+        logger.info(f"Ingestion complete. Processed: {total_processed}, Inserted: {total_inserted}, Updated: {total_updated}, "
+                    f"Unchanged: {total_unchanged} ({elapsed:.1f}s, {total_processed / elapsed if elapsed else 0:.0f} jobs/s)")
+        return {"processed": total_processed, "inserted": total_inserted, "updated": total_updated,
+                "unchanged": total_unchanged}
         
     except Exception as e:
         logger.error(f"Error during ingestion: {e}")
@@ -144,5 +295,439 @@ def ingest_data():
     finally:
         db.close()
 
+def url_hash(url):
+    """64-bit digest of a URL; a set of these is far smaller than a set of URLs"""
+    return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'big')
+
+def iter_unique_jobs(files=SOURCE_FILES, stats=None):
+    """
+    Yield prepared rows from every source file, one record at a time.
+    The first record seen for a URL wins; later duplicates are dropped.
+    Records that cannot be mapped are logged and skipped.
+    """
+    stats = stats if stats is not None else {}
+    seen = set()
+    for source, filepath in files:
+        for job in load_json_file(filepath, lazy=True):
+            stats['read'] = stats.get('read', 0) + 1
+            job['source'] = source
+            try:
+                row = prepare_job(job)
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Skipping bad record from {source} ({job.get('url')}): {e}")
+                stats['bad'] = stats.get('bad', 0) + 1
+                continue
+            if row is None:
+                continue
+            key = url_hash(row['url'])
+            if key in seen:
+                stats['duplicates'] = stats.get('duplicates', 0) + 1
+                continue
+            seen.add(key)
+            yield row
+
+def ingest_stream(files=SOURCE_FILES, chunk_size=INGEST_CHUNK_SIZE, session_factory=None):
+    """
+    Streaming ingest: read the source files record by record and commit every
+    `chunk_size` rows, so memory stays flat and a failing chunk is rolled back
+    on its own while the rest of the run carries on.
+    """
+    if session_factory is None:
+        logger.info("Initializing database tables...")
+        init_db()
+        session_factory = SessionLocal
+
+    stats = {'read': 0, 'bad': 0, 'duplicates': 0}
+    totals = {'processed': 0, 'inserted': 0, 'updated': 0, 'unchanged': 0, 'failed': 0}
+    by_source = {}
+    run_start = time.time()
+
+    db = session_factory()
+    try:
+        for number, chunk in enumerate(_batches(iter_unique_jobs(files, stats), chunk_size), start=1):
+            chunk_start = time.time()
+            chunk_counts = {}
+            try:
+                inserted, updated, unchanged = upsert_jobs(db, chunk, by_source=chunk_counts)
+                db.commit()
+                _merge_counts(by_source, chunk_counts)
+            except Exception as e:
+                db.rollback()
+                totals['failed'] += len(chunk)
+                logger.error(f"Chunk {number}: {len(chunk)} rows rolled back: {e}")
+                continue
+
+            totals['processed'] += len(chunk)
+            totals['inserted'] += inserted
+            totals['updated'] += updated
+            totals['unchanged'] += unchanged
+            elapsed = time.time() - chunk_start
+            logger.info(f"Chunk {number}: {len(chunk)} rows (inserted {inserted}, updated {updated}, unchanged {unchanged}) "
+                        f"in {elapsed:.2f}s ({len(chunk) / elapsed if elapsed else 0:.0f} rows/s), {totals['processed']} so far")
+    finally:
+        db.close()
+
+    elapsed = time.time() - run_start
+    logger.info(f"Streaming ingestion complete. Read: {stats['read']}, Duplicates: {stats['duplicates']}, "
+                f"Bad: {stats['bad']}, Inserted: {totals['inserted']}, Updated: {totals['updated']}, "
+                f"Unchanged: {totals['unchanged']}, "
+                f"Failed: {totals['failed']} ({elapsed:.1f}s, {totals['processed'] / elapsed if elapsed else 0:.0f} jobs/s)")
+    record_ingest(by_source, session_factory=session_factory)
+    return totals
+
+# Columns filled from the scraped records (see prepare_job), in COPY order
+COPY_COLUMNS = [c.name for c in Job.__table__.columns
+                if c.name not in ('id', 'created_at', 'last_seen_at', 'expired_at')]
+COPY_NULL = '\\N'
+
+class CopyStream:
+    """
+    Read-only file object serving prepared rows as CSV for COPY ... FROM STDIN.
+    Rows are rendered as the driver reads, so the whole load never sits in memory.
+    """
+
+    def __init__(self, rows, columns=COPY_COLUMNS, rows_per_read=1000):
+        self.rows = iter(rows)
+        self.columns = columns
+        self.rows_per_read = rows_per_read
+        self.count = 0
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator='\n')
+        self._pending = ''
+        self._done = False
+
+    def _fill(self):
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        for row in islice(self.rows, self.rows_per_read):
+            self._writer.writerow([COPY_NULL if row[name] is None else row[name] for name in self.columns])
+            self.count += 1
+        chunk = self._buffer.getvalue()
+        if not chunk:
+            self._done = True
+        self._pending += chunk
+
+    def read(self, size=-1):
+        while not self._done and (size < 0 or len(self._pending) < size):
+            self._fill()
+        if size < 0:
+            data, self._pending = self._pending, ''
+        else:
+            data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+def _copy_into(db, table_name, stream, columns=COPY_COLUMNS):
+    """COPY the stream into a table over the session's connection (psycopg2 or psycopg 3)"""
+    sql = (f"COPY {table_name} ({', '.join(columns)}) FROM STDIN "
+           f"WITH (FORMAT csv, NULL '{COPY_NULL}')")
+    cursor = db.connection().connection.cursor()
+    try:
+        if hasattr(cursor, 'copy_expert'):
+            cursor.copy_expert(sql, stream, size=65536)
+        else:
+            with cursor.copy(sql) as copy:
+                while data := stream.read(65536):
+                    copy.write(data)
+    finally:
+        cursor.close()
+
+def copy_upsert_jobs(db, rows, by_source=None):
+    """
+    Bulk upsert through a staging table: COPY the prepared rows into a
+    temporary table, then merge it into jobs with one INSERT ... SELECT ...
+    ON CONFLICT (url) DO UPDATE. Unchanged rows (same content_hash) only get
+    last_seen_at bumped. Rows must be unique by url (see iter_unique_jobs).
+
+    PostgreSQL only; other databases fall back to upsert_jobs. The caller
+    commits. Returns (inserted, updated, unchanged), and adds the same counts
+    per source to `by_source` when given.
+    """
+    if db.get_bind().dialect.name != 'postgresql':
+        return upsert_jobs(db, rows, by_source=by_source)
+
+    from sqlalchemy.dialects.postgresql import insert
+
+    now = datetime.now(timezone.utc)
+    jobs = Job.__table__
+    staging = table('jobs_staging', *[column(name) for name in COPY_COLUMNS])
+
+    # Typed like jobs but without its constraints, indexes and triggers; gone at commit
+    db.execute(text(f"CREATE TEMP TABLE jobs_staging ON COMMIT DROP AS "
+                    f"SELECT {', '.join(COPY_COLUMNS)} FROM jobs WITH NO DATA"))
+    start = time.time()
+    stream = CopyStream(row for row in rows if row)
+    _copy_into(db, 'jobs_staging', stream)
+    elapsed = time.time() - start
+    logger.info(f"COPY: {stream.count} rows staged in {elapsed:.2f}s "
+                f"({stream.count / elapsed if elapsed else 0:.0f} rows/s)")
+
+    # Before the merge, while content_hash still tells unchanged rows apart
+    touched = (
+        update(jobs)
+        .where(jobs.c.url == staging.c.url, jobs.c.content_hash == staging.c.content_hash)
+        .values(last_seen_at=now, expired_at=None)
+        .returning(jobs.c.source)
+        .cte('touched')
+    )
+    counts = {}
+    for source, n in db.execute(select(touched.c.source, func.count()).group_by(touched.c.source)):
+        _count(counts, {'source': source}, 'unchanged', n)
+
+    stmt = insert(jobs).from_select(
+        COPY_COLUMNS + ['last_seen_at'],
+        select(*[staging.c[name] for name in COPY_COLUMNS], literal(now, DateTime(timezone=True))),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[jobs.c.url],
+        set_={**{name: stmt.excluded[name] for name in COPY_COLUMNS if name != 'url'},
+              'last_seen_at': stmt.excluded.last_seen_at, 'expired_at': None},
+        where=jobs.c.content_hash.is_distinct_from(stmt.excluded.content_hash),
+    )
+    # xmax is 0 for a freshly inserted row version; rows skipped by the WHERE are not returned
+    merged = stmt.returning(jobs.c.source, literal_column('xmax = 0').label('inserted')).cte('merged')
+    for source, inserted, written in db.execute(
+        select(merged.c.source, func.count().filter(merged.c.inserted), func.count()).group_by(merged.c.source)
+    ):
+        _count(counts, {'source': source}, 'inserted', inserted)
+        _count(counts, {'source': source}, 'updated', written - inserted)
+
+    if by_source is not None:
+        _merge_counts(by_source, counts)
+    return tuple(sum(c[outcome] for c in counts.values()) for outcome in INGEST_COUNTS)
+
+def ingest_copy(files=SOURCE_FILES, session_factory=None):
+    """
+    Backfill mode: load every source file in one transaction through
+    copy_upsert_jobs. On databases other than PostgreSQL this is ingest_stream.
+    """
+    if session_factory is None:
+        logger.info("Initializing database tables...")
+        init_db()
+        session_factory = SessionLocal
+
+    db = session_factory()
+    try:
+        if db.get_bind().dialect.name != 'postgresql':
+            logger.info("COPY needs PostgreSQL; falling back to batched inserts")
+            db.close()
+            return ingest_stream(files, session_factory=session_factory)
+
+        stats = {'read': 0, 'bad': 0, 'duplicates': 0}
+        by_source = {}
+        start = time.time()
+        try:
+            inserted, updated, unchanged = copy_upsert_jobs(db, iter_unique_jobs(files, stats), by_source)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+    finally:
+        db.close()
+
+    processed = inserted + updated + unchanged
+    elapsed = time.time() - start
+    logger.info(f"COPY ingestion complete. Read: {stats['read']}, Duplicates: {stats['duplicates']}, "
+                f"Bad: {stats['bad']}, Inserted: {inserted}, Updated: {updated}, Unchanged: {unchanged} "
+                f"({elapsed:.1f}s, {processed / elapsed if elapsed else 0:.0f} jobs/s)")
+    record_ingest(by_source, session_factory=session_factory)
+    return {'processed': processed, 'inserted': inserted, 'updated': updated,
+            'unchanged': unchanged, 'failed': 0}
+
+class AsyncIngest:
+    """
+    Async ingest pipeline: records are prepared and deduplicated as they are
+    put() and grouped into chunks, and a writer task upserts each chunk
+    through the async engine while the next one is being filled.
+
+    Records can come from files (ingest_files_async) or straight from a
+    running scraper (see BackgroundIngest).
+
+    Usage:
+        ingest = AsyncIngest()
+        await ingest.start()
+        await ingest.put({...})
+        totals = await ingest.close()
+    """
+
+    def __init__(self, chunk_size=INGEST_CHUNK_SIZE, session_factory=None, queue_size=2, run_id=None):
+        self.chunk_size = chunk_size
+        self.session_factory = session_factory
+        self.stats = {'read': 0, 'bad': 0, 'duplicates': 0}
+        self.totals = {'processed': 0, 'inserted': 0, 'updated': 0, 'unchanged': 0, 'failed': 0}
+        self.by_source = {}
+        # Counts go to the run metrics of the configured database, not to a caller's own one
+        self.run_id = run_id
+        self._record_metrics = session_factory is None
+        self._queue = asyncio.Queue(maxsize=queue_size)
+        self._seen = set()
+        self._chunk = []
+        self._chunks = 0
+        self._writer = None
+        self._start = None
+
+    async def start(self):
+        if self.session_factory is None:
+            logger.info("Initializing database tables...")
+            await init_db_async()
+            self.session_factory = get_async_sessionmaker()
+        self._start = time.time()
+        self._writer = asyncio.create_task(self._write_chunks())
+
+    async def put(self, job):
+        """Add one raw scraped record (with its 'source' set)"""
+        self.stats['read'] += 1
+        try:
+            row = prepare_job(job)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Skipping bad record from {job.get('source')} ({job.get('url')}): {e}")
+            self.stats['bad'] += 1
+            return
+        if row is not None:
+            await self.put_rows([row])
+
+    async def put_rows(self, rows):
+        """Add prepared rows (see prepare_job); URLs already seen are dropped"""
+        for row in rows:
+            key = url_hash(row['url'])
+            if key in self._seen:
+                self.stats['duplicates'] += 1
+                continue
+            self._seen.add(key)
+            self._chunk.append(row)
+            if len(self._chunk) >= self.chunk_size:
+                await self._flush()
+
+    async def _flush(self):
+        if self._writer.done():
+            # The writer died; surface its error instead of waiting on a full queue
+            self._writer.result()
+        if self._chunk:
+            chunk, self._chunk = self._chunk, []
+            # Waits while the writer is behind, so memory stays bounded
+            await self._queue.put(chunk)
+
+    async def _write_chunks(self):
+        while True:
+            chunk = await self._queue.get()
+            if chunk is None:
+                return
+            self._chunks += 1
+            chunk_start = time.time()
+            chunk_counts = {}
+            async with self.session_factory() as db:
+                try:
+                    inserted, updated, unchanged = await db.run_sync(upsert_jobs, chunk, by_source=chunk_counts)
+                    await db.commit()
+                    _merge_counts(self.by_source, chunk_counts)
+                except Exception as e:
+                    await db.rollback()
+                    self.totals['failed'] += len(chunk)
+                    logger.error(f"Chunk {self._chunks}: {len(chunk)} rows rolled back: {e}")
+                    continue
+
+            self.totals['processed'] += len(chunk)
+            self.totals['inserted'] += inserted
+            self.totals['updated'] += updated
+            self.totals['unchanged'] += unchanged
+            elapsed = time.time() - chunk_start
+            logger.info(f"Chunk {self._chunks}: {len(chunk)} rows (inserted {inserted}, updated {updated}, unchanged {unchanged}) "
+                        f"in {elapsed:.2f}s ({len(chunk) / elapsed if elapsed else 0:.0f} rows/s), {self.totals['processed']} so far")
+
+    async def close(self):
+        """Write what is left and wait for the writer; returns the totals"""
+        await self._flush()
+        await self._queue.put(None)
+        await self._writer
+        elapsed = time.time() - self._start
+        logger.info(f"Async ingestion complete. Read: {self.stats['read']}, Duplicates: {self.stats['duplicates']}, "
+                    f"Bad: {self.stats['bad']}, Inserted: {self.totals['inserted']}, Updated: {self.totals['updated']}, "
+                    f"Unchanged: {self.totals['unchanged']}, Failed: {self.totals['failed']} "
+                    f"({elapsed:.1f}s, {self.totals['processed'] / elapsed if elapsed else 0:.0f} jobs/s)")
+        if self._record_metrics:
+            await asyncio.to_thread(record_ingest, self.by_source, self.run_id)
+        return self.totals
+
+async def ingest_files_async(files=SOURCE_FILES, chunk_size=INGEST_CHUNK_SIZE, session_factory=None):
+    """
+    Async version of ingest_stream: the source files are read and parsed in a
+    worker thread, one chunk ahead of the chunk being written to the database.
+    """
+    ingest = AsyncIngest(chunk_size, session_factory)
+    await ingest.start()
+    rows = iter_unique_jobs(files, ingest.stats)
+    while True:
+        chunk = await asyncio.to_thread(lambda: list(islice(rows, chunk_size)))
+        if not chunk:
+            break
+        await ingest.put_rows(chunk)
+    return await ingest.close()
+
+class BackgroundIngest:
+    """
+    Runs an AsyncIngest on its own event loop thread so synchronous code (the
+    scraper Scheduler's threads) can hand it records as they are scraped.
+
+    Usage:
+        with BackgroundIngest() as ingest:
+            Scheduler(scrapers, sink=ingest.submit).run()
+        print(ingest.totals)
+    """
+
+    def __init__(self, chunk_size=INGEST_CHUNK_SIZE, session_factory=None, run_id=None):
+        self.ingest = None
+        self.totals = None
+        self._args = (chunk_size, session_factory)
+        self._run_id = run_id
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True, name="ingest")
+
+    def _call(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def __enter__(self):
+        self._thread.start()
+
+        async def start():
+            self.ingest = AsyncIngest(*self._args, run_id=self._run_id)
+            await self.ingest.start()
+
+        self._call(start())
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def submit(self, source, record):
+        """Thread-safe: queue one scraped record; blocks while the writer is behind"""
+        self._call(self.ingest.put(dict(record, source=source)))
+
+    def close(self):
+        if self.totals is not None:
+            return self.totals
+        try:
+            self.totals = self._call(self.ingest.close())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+        return self.totals
+
 if __name__ == "__main__":
-    ingest_data()
+    parser = argparse.ArgumentParser(description="Load scraper output into the jobs table")
+    parser.add_argument("--stream", action="store_true",
+                        help="Read records incrementally and commit in chunks (bounded memory)")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="Like --stream, through the async engine, parsing the next chunk while one is written")
+    parser.add_argument("--copy", action="store_true",
+                        help="Backfill through PostgreSQL COPY and one set-based merge (batched inserts elsewhere)")
+    parser.add_argument("--chunk-size", type=int, default=INGEST_CHUNK_SIZE,
+                        help="Rows per commit in --stream / --async mode")
+    args = parser.parse_args()
+    if args.copy:
+        ingest_copy()
+    elif args.use_async:
+        asyncio.run(ingest_files_async(chunk_size=args.chunk_size))
+    elif args.stream:
+        ingest_stream(chunk_size=args.chunk_size)
+    else:
+        ingest_data()
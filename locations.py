@@ -0,0 +1,172 @@
+"""
+Location resolver backed by a gazetteer of Australian places.
+
+Turns the location strings the sites show ("Sydney NSW",
+"Toowong, Brisbane QLD(Hybrid)", "Naracoorte,", "Clare SA 5453") into
+suburb / city / state plus the remote and hybrid flags. Places are looked up
+by a normalized key in data/au_locations.csv (name, state, city; city is the
+place itself for a city or town). Set LOCATION_GAZETTEER to use a fuller
+file in the same format.
+
+The same few hundred strings repeat across thousands of jobs, so results are
+kept in a bounded LRU cache.
+"""
+
+import csv
+import os
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+DEFAULT_GAZETTEER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "au_locations.csv")
+
+LOCATION_CACHE_SIZE = 8192
+
+STATE_NAMES = {
+    "NSW": "New South Wales",
+    "VIC": "Victoria",
+    "QLD": "Queensland",
+    "WA": "Western Australia",
+    "SA": "South Australia",
+    "TAS": "Tasmania",
+    "ACT": "Australian Capital Territory",
+    "NT": "Northern Territory",
+}
+# Normalized key -> state code, for both codes and full names
+STATE_KEYS = {**{code.lower(): code for code in STATE_NAMES},
+              **{name.lower(): code for code, name in STATE_NAMES.items()}}
+
+# Words that qualify a place without changing it: "All Sydney", "Sydney CBD", "Gold Coast City"
+PLACE_MODIFIERS = {"all", "greater", "cbd", "city", "region", "area", "metro", "metropolitan"}
+
+BRACKETS_RE = re.compile(r"\((.*?)\)")
+POSTCODE_RE = re.compile(r"\b\d{4}\b")
+NON_WORD_RE = re.compile(r"[^a-z0-9' ]+")
+TRAILING_STATE_RE = re.compile(r"^(.*?)\s+([A-Za-z]{2,3})$")
+REMOTE_RE = re.compile(r"\b(remote|work from home|wfh)\b", re.IGNORECASE)
+HYBRID_RE = re.compile(r"\bhybrid\b", re.IGNORECASE)
+
+
+class Place(NamedTuple):
+    name: str
+    state: str
+    city: str
+
+
+class Location(NamedTuple):
+    suburb: Optional[str]
+    city: Optional[str]
+    state: Optional[str]
+    country: str
+    is_remote: bool
+    is_hybrid: bool
+
+
+def location_key(text):
+    """Lowercase, punctuation-free, single-spaced form used for lookups"""
+    return " ".join(NON_WORD_RE.sub(" ", text.lower()).split())
+
+
+@lru_cache(maxsize=None)
+def load_gazetteer(path=None):
+    """{normalized name: [Place, ...]} from the gazetteer CSV; a name can be in several states or cities"""
+    path = path or os.getenv("LOCATION_GAZETTEER") or DEFAULT_GAZETTEER
+    places = {}
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            place = Place(row["name"], row["state"].upper(), row["city"] or row["name"])
+            places.setdefault(location_key(place.name), []).append(place)
+    return places
+
+
+def _lookup(name, gazetteer):
+    """Gazetteer entries for a place name, ignoring modifiers like 'All' or 'CBD'"""
+    key = location_key(name)
+    if key in gazetteer:
+        return gazetteer[key], True
+    words = [w for w in key.split() if w not in PLACE_MODIFIERS]
+    stripped = " ".join(words)
+    if stripped in gazetteer:
+        return gazetteer[stripped], False
+    # "Outer Northern Suburbs Brisbane": the area is named by its last words
+    for start in range(1, len(words)):
+        tail = " ".join(words[start:])
+        if tail in gazetteer:
+            return gazetteer[tail], False
+    return [], False
+
+
+def _pick(places, state=None, city=None):
+    """The one entry matching the state (and city, if it narrows it), or None if ambiguous"""
+    if state:
+        places = [p for p in places if p.state == state]
+    if city:
+        places = [p for p in places if p.city == city] or places
+    if not places or len({p.state for p in places}) > 1:
+        return None
+    return places[0]
+
+
+def _split_state(part):
+    """'Brisbane QLD' -> ('Brisbane', 'QLD'); 'Victoria' -> ('', 'VIC'); 'Toowong' -> ('Toowong', None)"""
+    key = location_key(part)
+    if key in STATE_KEYS:
+        return "", STATE_KEYS[key]
+    match = TRAILING_STATE_RE.match(part)
+    if match and match.group(2).lower() in STATE_KEYS:
+        rest = match.group(1).strip()
+        # "New South Wales NSW"
+        return ("" if location_key(rest) in STATE_KEYS else rest), match.group(2).upper()
+    return part, None
+
+
+@lru_cache(maxsize=LOCATION_CACHE_SIZE)
+def resolve_location(location_str):
+    """Resolve a site's location string to a Location"""
+    if not location_str:
+        return Location(None, None, None, "Australia", False, False)
+
+    # Tags: "(Remote)", "(Hybrid)", or a whole part like ", Work from home"
+    tags = BRACKETS_RE.findall(location_str)
+    is_remote = any(REMOTE_RE.search(tag) for tag in tags)
+    is_hybrid = any(HYBRID_RE.search(tag) for tag in tags)
+
+    text = POSTCODE_RE.sub(" ", BRACKETS_RE.sub(" ", location_str)).replace('"', " ")
+    state = None
+    names = []
+    for part in text.split(","):
+        part = " ".join(part.split())
+        if REMOTE_RE.fullmatch(part):
+            is_remote = True
+            continue
+        if HYBRID_RE.fullmatch(part):
+            is_hybrid = True
+            continue
+        if location_key(part) == "australia":
+            continue
+        if part.lower().startswith("australia "):
+            part = part[len("australia "):]
+        part, part_state = _split_state(part)
+        state = state or part_state
+        if part:
+            names.append(part)
+
+    gazetteer = load_gazetteer()
+    suburb = city = None
+    if names:
+        # Most general place first ("Toowong, Brisbane QLD" -> Brisbane), then the most specific
+        general = None
+        if len(names) > 1:
+            general = _pick(_lookup(names[-1], gazetteer)[0], state)
+        entries, exact = _lookup(names[0], gazetteer)
+        specific = _pick(entries, state or (general and general.state), general and general.city)
+        if specific:
+            city = specific.city
+            suburb = specific.name if exact and specific.name != specific.city else None
+            state = specific.state
+        elif general:
+            suburb, city, state = names[0], general.city, general.state
+        else:
+            city = names[0]
+
+    return Location(suburb, city, state, "Australia", is_remote, is_hybrid)
@@ -0,0 +1,276 @@
+"""
+Scrape-run metrics.
+
+Every scraper run records one scrape_runs row, with one scrape_run_sources
+row per source holding its start and end times, pages visited, jobs
+parsed, parse failures and HTML bytes read. Ingest adds the
+inserted / updated / unchanged counts per source to the same run (or to a
+run of its own when it is started separately).
+
+run_scrapers.py opens the run and hands its id to the scraper processes
+in SCRAPE_RUN_ID, so each child's numbers land in the parent's run.
+Nothing is recorded when DIRECT_DATABASE_URL is not set (in the environment
+or .env), and a database error never stops a scrape.
+
+    python metrics.py                  # jobs-per-minute per source per day, last 14 days
+    python metrics.py --days 30 seek   # one source, longer history
+"""
+
+import argparse
+import os
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+# Set by run_scrapers.py for its child processes
+RUN_ID_ENV = "SCRAPE_RUN_ID"
+
+INGEST_COUNTS = ("inserted", "updated", "unchanged")
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+class SourceMetrics:
+    """Counters for one source in one run; page() and failure() are thread-safe"""
+
+    def __init__(self, source, status=None):
+        self.source = source
+        self.status = status
+        self.started_at = _now()
+        self.finished_at = None
+        self.pages = 0
+        self.jobs = 0
+        self.parse_failures = 0
+        self.bytes_fetched = 0
+        self._lock = threading.Lock()
+
+    def page(self, html):
+        """Count a page visited (fetched or read from the cache)"""
+        with self._lock:
+            self.pages += 1
+            self.bytes_fetched += len(html.encode("utf-8")) if html else 0
+
+    def failure(self):
+        with self._lock:
+            self.parse_failures += 1
+
+    def finish(self, ok, jobs):
+        self.finished_at = _now()
+        self.status = "ok" if ok else "failed"
+        self.jobs = jobs
+
+    def as_row(self):
+        return {
+            "source": self.source,
+            "status": self.status,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at or _now(),
+            "pages": self.pages,
+            "jobs": self.jobs,
+            "parse_failures": self.parse_failures,
+            "bytes_fetched": self.bytes_fetched,
+        }
+
+
+def metrics_enabled():
+    """True when DIRECT_DATABASE_URL is set, in the environment or in .env"""
+    try:
+        # Loads .env: nothing else has by the time run_scrapers.py opens its run
+        from database import get_database_url
+        get_database_url()
+        return True
+    except Exception:
+        return False
+
+
+def _session():
+    """A session for recording, or None when there is no database to record to"""
+    if not metrics_enabled():
+        return None
+    try:
+        from database import SessionLocal
+        return SessionLocal()
+    except Exception as e:
+        print(f"Run metrics: database unavailable ({e})")
+        return None
+
+
+def _record(action, session_factory=None):
+    """Run action(db) and commit; returns its result, or None if recording failed"""
+    db = session_factory() if session_factory else _session()
+    if db is None:
+        return None
+    try:
+        result = action(db)
+        db.commit()
+        return result
+    except Exception as e:
+        db.rollback()
+        print(f"Run metrics: not recorded ({e})")
+        return None
+    finally:
+        db.close()
+
+
+def start_run(mode, session_factory=None):
+    """Open a scrape_runs row; returns its id, or None when metrics are off"""
+    from database import Base, ScrapeRun, ScrapeRunSource
+
+    def action(db):
+        # Scraping alone never runs init_db
+        Base.metadata.create_all(db.get_bind(), tables=[ScrapeRun.__table__, ScrapeRunSource.__table__])
+        run = ScrapeRun(mode=mode, status="running", started_at=_now())
+        db.add(run)
+        db.flush()
+        return run.id
+
+    return _record(action, session_factory)
+
+
+def finish_run(run_id, ok, session_factory=None):
+    if run_id is None:
+        return
+    from database import ScrapeRun
+
+    def action(db):
+        run = db.get(ScrapeRun, run_id)
+        run.status = "ok" if ok else "failed"
+        run.finished_at = _now()
+
+    _record(action, session_factory)
+
+
+def current_run_id():
+    """The run opened by a parent run_scrapers.py, if any"""
+    value = os.getenv(RUN_ID_ENV)
+    return int(value) if value else None
+
+
+def record_sources(run_id, metrics, session_factory=None):
+    """Store the SourceMetrics of a run's sources"""
+    if run_id is None:
+        return
+    from database import ScrapeRunSource
+
+    def action(db):
+        db.add_all(ScrapeRunSource(run_id=run_id, **m.as_row()) for m in metrics)
+
+    _record(action, session_factory)
+
+
+def record_missing_sources(run_id, statuses, session_factory=None):
+    """
+    Add a row with just the status for each source in {source: status} that
+    recorded nothing itself, e.g. a scraper process that was killed.
+    """
+    if run_id is None:
+        return
+    from database import ScrapeRunSource
+
+    def action(db):
+        recorded = {source for (source,) in
+                    db.query(ScrapeRunSource.source).filter(ScrapeRunSource.run_id == run_id)}
+        for source, status in statuses.items():
+            if source not in recorded:
+                db.add(ScrapeRunSource(run_id=run_id, source=source, status=status,
+                                       started_at=_now(), finished_at=_now()))
+
+    _record(action, session_factory)
+
+
+def record_ingest(counts_by_source, run_id=None, session_factory=None):
+    """
+    Add ingest counts ({source: {'inserted': n, 'updated': n, 'unchanged': n}})
+    to the sources of `run_id` (default: SCRAPE_RUN_ID, else a new 'ingest' run).
+    """
+    from database import ScrapeRunSource
+
+    run_id = run_id or current_run_id()
+    own_run = run_id is None
+    if own_run:
+        run_id = start_run("ingest", session_factory)
+        if run_id is None:
+            return
+
+    def action(db):
+        for source, counts in counts_by_source.items():
+            row = (db.query(ScrapeRunSource)
+                   .filter(ScrapeRunSource.run_id == run_id, ScrapeRunSource.source == source)
+                   .first())
+            if row is None:
+                row = ScrapeRunSource(run_id=run_id, source=source, started_at=_now(), finished_at=_now(),
+                                      pages=0, jobs=0, parse_failures=0, bytes_fetched=0,
+                                      inserted=0, updated=0, unchanged=0)
+                db.add(row)
+            for name in INGEST_COUNTS:
+                setattr(row, name, (getattr(row, name) or 0) + counts.get(name, 0))
+
+    _record(action, session_factory)
+    if own_run:
+        finish_run(run_id, True, session_factory)
+
+
+def daily_throughput(db, days=14, source=None):
+    """
+    Per (day, source) totals over the last `days` days, oldest first:
+    [{'day', 'source', 'runs', 'pages', 'jobs', 'minutes', 'jobs_per_minute',
+      'parse_failures', 'mb', 'inserted', 'updated', 'unchanged'}]
+    """
+    from database import ScrapeRunSource
+
+    since = _now() - timedelta(days=days)
+    query = db.query(ScrapeRunSource).filter(ScrapeRunSource.started_at >= since)
+    if source:
+        query = query.filter(ScrapeRunSource.source == source)
+
+    totals = defaultdict(lambda: defaultdict(float))
+    for row in query:
+        day = row.started_at.date()
+        bucket = totals[(day, row.source)]
+        bucket["runs"] += 1 if row.status else 0
+        if row.finished_at:
+            bucket["minutes"] += (row.finished_at - row.started_at).total_seconds() / 60
+        for name in ("pages", "jobs", "parse_failures", "bytes_fetched") + INGEST_COUNTS:
+            bucket[name] += getattr(row, name) or 0
+
+    rows = []
+    for (day, name), bucket in sorted(totals.items(), key=lambda item: (item[0][0], item[0][1] or "")):
+        minutes = bucket["minutes"]
+        rows.append({
+            "day": day, "source": name, "runs": int(bucket["runs"]), "pages": int(bucket["pages"]),
+            "jobs": int(bucket["jobs"]), "minutes": minutes,
+            "jobs_per_minute": bucket["jobs"] / minutes if minutes else None,
+            "parse_failures": int(bucket["parse_failures"]), "mb": bucket["bytes_fetched"] / 1e6,
+            **{name: int(bucket[name]) for name in INGEST_COUNTS},
+        })
+    return rows
+
+
+def print_report(rows):
+    print(f"{'day':<11} {'source':<10} {'runs':>4} {'pages':>6} {'jobs':>6} {'min':>6} {'jobs/min':>8} "
+          f"{'fail':>5} {'MB':>7} {'ins':>6} {'upd':>6} {'same':>6}")
+    for row in rows:
+        rate = f"{row['jobs_per_minute']:.1f}" if row["jobs_per_minute"] is not None else "-"
+        print(f"{row['day'].isoformat():<11} {row['source'] or '-':<10} {row['runs']:>4} {row['pages']:>6} "
+              f"{row['jobs']:>6} {row['minutes']:>6.1f} {rate:>8} {row['parse_failures']:>5} "
+              f"{row['mb']:>7.1f} {row['inserted']:>6} {row['updated']:>6} {row['unchanged']:>6}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Jobs-per-minute trends per source")
+    parser.add_argument("source", nargs="?", help="Only this source (jobs.source value, e.g. careerone)")
+    parser.add_argument("--days", type=int, default=14)
+    args = parser.parse_args()
+
+    from database import SessionLocal
+    db = SessionLocal()
+    try:
+        print_report(daily_throughput(db, args.days, args.source))
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Shared normalization for parsed jobs.
+
+Every site parser extracts the raw fields (title, company, location, salary
+text, description, the site's work type if it has one) and hands the record
+to normalize_job(), which fills in the derived ones the same way for every
+source:
+
+- min_annual_salary / max_annual_salary from salary_range (utils.parse_salary)
+- suburb / city / state / country from location (locations.resolve_location)
+- posted_date from the site's "Posted 2d ago" text (utils.parse_posted_date),
+  and posted_date_open_ended for "30+ days ago", whose date moves every run
+- work_type (when the site gave none), is_remote, is_hybrid and seniority
+  from the title, location and description (classify)
+
+classify() finds every keyword of the tables below in one pass over each
+text with a KeywordMatcher, instead of a chain of substring checks per label.
+"""
+
+import re
+
+from locations import resolve_location
+from utils import parse_posted_date, parse_salary, posted_date_is_open_ended
+
+TITLE = "title"
+DESCRIPTION = "description"
+ANYWHERE = (TITLE, DESCRIPTION)
+
+# Work types, in the order they win when a text names several. A bare word
+# only counts in a title ("Casual Barista", not "casual dress code"); a
+# description has to spell it out ("casual role", "fixed-term contract").
+WORK_TYPES = [
+    ("Full time", TITLE, ("fulltime",)),
+    ("Full time", ANYWHERE, ("full time", "full-time")),
+    ("Part time", TITLE, ("parttime",)),
+    ("Part time", ANYWHERE, ("part time", "part-time")),
+    ("Casual", TITLE, ("casual",)),
+    ("Casual", ANYWHERE, ("casual role", "casual position", "casual basis", "casual employment",
+                          "casual contract", "casual shifts")),
+    ("Contract", TITLE, ("contract", "contractor")),
+    ("Contract", ANYWHERE, ("fixed term", "fixed-term", "fixed term contract", "fixed-term contract",
+                            "contract role", "contract position", "contract basis", "month contract")),
+    ("Temporary", TITLE, ("temporary", "temp")),
+    ("Temporary", ANYWHERE, ("temporary role", "temporary position", "temporary basis",
+                             "temp role", "temp position")),
+    ("Internship", TITLE, ("internship",)),
+    ("Internship", ANYWHERE, ("internship program", "internship programme")),
+]
+
+# Seniority levels, most junior first; the most senior one a title names wins
+SENIORITY = [
+    ("Intern", TITLE, ("intern", "internship")),
+    ("Graduate", TITLE, ("graduate", "grad")),
+    ("Graduate", ANYWHERE, ("graduate program", "graduate programme")),
+    ("Junior", TITLE, ("junior", "jnr", "jr", "trainee", "apprentice")),
+    ("Junior", ANYWHERE, ("entry level", "entry-level")),
+    ("Mid", TITLE, ("intermediate", "mid level", "mid-level")),
+    ("Senior", TITLE, ("senior", "snr", "sr", "experienced")),
+    ("Lead", TITLE, ("lead", "leader", "team lead", "team leader", "principal", "supervisor")),
+    ("Manager", TITLE, ("manager", "management")),
+    ("Director", TITLE, ("director", "head of", "general manager")),
+    ("Executive", TITLE, ("chief", "ceo", "cfo", "cto", "coo", "cio", "vice president", "vp")),
+]
+
+# "remote" alone counts in a title; a description needs it spelled out ("remote role")
+REMOTE = [
+    (TITLE, ("remote",)),
+    (ANYWHERE, ("work from home", "working from home", "wfh", "fully remote", "100% remote",
+                "remote first", "remote-first", "remote role", "remote position", "remote working",
+                "work remotely")),
+]
+HYBRID = [
+    (TITLE, ("hybrid",)),
+    (ANYWHERE, ("hybrid work", "hybrid working", "hybrid role", "hybrid position",
+                "hybrid arrangement", "hybrid model")),
+]
+
+
+def _fields(fields):
+    return (fields,) if isinstance(fields, str) else fields
+
+
+def _keyword_table():
+    """keyword -> [(category, value, fields), ...]"""
+    table = {}
+
+    def add(keywords, entry):
+        for keyword in keywords:
+            table.setdefault(keyword, []).append(entry)
+
+    for rank, (work_type, fields, keywords) in enumerate(WORK_TYPES):
+        add(keywords, ("work_type", rank, _fields(fields)))
+    for rank, (level, fields, keywords) in enumerate(SENIORITY):
+        add(keywords, ("seniority", rank, _fields(fields)))
+    for fields, keywords in REMOTE:
+        add(keywords, ("is_remote", True, _fields(fields)))
+    for fields, keywords in HYBRID:
+        add(keywords, ("is_hybrid", True, _fields(fields)))
+    return table
+
+
+def _trie_pattern(keywords):
+    """One regex alternation with the keywords' shared prefixes merged, longest match first"""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [(r"\s+" if char == " " else re.escape(char)) + build(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # A keyword may end here: the longer ones are tried first
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """
+    Finds the keywords of a table in one left-to-right pass over a text.
+
+    The keywords are merged into a trie and compiled into a single regular
+    expression, so at each position the shared prefixes ("part time",
+    "part-time", "parttime") are tried once: an Aho-Corasick-style
+    automaton, run by the C regex engine instead of a character loop in
+    Python. Only whole words match, and the longest keyword wins.
+    """
+
+    def __init__(self, keywords):
+        """keywords: {keyword: value}"""
+        self.values = {keyword.lower(): value for keyword, value in keywords.items()}
+        # Matched against lowercased text: IGNORECASE makes every position twice as slow
+        self.pattern = re.compile(r"(?<!\w)(?:" + _trie_pattern(self.values) + r")(?!\w)")
+
+    def find(self, text):
+        """Values of the keywords found in `text`, in order of appearance"""
+        if not text:
+            return []
+        return [self.values[" ".join(match.split())] for match in self.pattern.findall(text.lower())]
+
+
+MATCHER = KeywordMatcher(_keyword_table())
+
+
+def classify(title=None, description=None):
+    """
+    {'work_type', 'is_remote', 'is_hybrid', 'seniority'} from a job's title
+    and description. Title keywords take precedence over the description's.
+    """
+    labels = {"work_type": None, "is_remote": False, "is_hybrid": False, "seniority": None}
+    for field, text in ((TITLE, title), (DESCRIPTION, description)):
+        work_rank = seniority_rank = None
+        for entries in MATCHER.find(text):
+            for category, value, fields in entries:
+                if field not in fields:
+                    continue
+                if category == "work_type":
+                    work_rank = value if work_rank is None else min(work_rank, value)
+                elif category == "seniority":
+                    seniority_rank = value if seniority_rank is None else max(seniority_rank, value)
+                else:
+                    labels[category] = True
+        if labels["work_type"] is None and work_rank is not None:
+            labels["work_type"] = WORK_TYPES[work_rank][0]
+        if labels["seniority"] is None and seniority_rank is not None:
+            labels["seniority"] = SENIORITY[seniority_rank][0]
+    return labels
+
+
+def work_type_label(label):
+    """The work type a site's own label names ("Full time", "Contract/Temp"), or None"""
+    ranks = [value for entries in MATCHER.find(label)
+             for category, value, fields in entries if category == "work_type"]
+    return WORK_TYPES[min(ranks)][0] if ranks else None
+
+
+def normalize_job(job, posted=None, text=None):
+    """
+    Fill in a parsed job's derived fields in place and return it.
+    `posted` is the site's raw posted-date text; `text` is what to classify
+    besides the title (default: job_description), e.g. a whole listing card.
+    """
+    job["min_annual_salary"], job["max_annual_salary"] = parse_salary(job.get("salary_range"))
+
+    location = resolve_location(job.get("location"))
+    job["suburb"] = location.suburb
+    job["city"] = location.city
+    job["state"] = location.state
+    job["country"] = location.country
+
+    labels = classify(job.get("job_title"), job.get("job_description") if text is None else text)
+    if not job.get("work_type"):
+        job["work_type"] = labels["work_type"]
+    job["is_remote"] = location.is_remote or labels["is_remote"]
+    job["is_hybrid"] = location.is_hybrid or labels["is_hybrid"]
+    job["seniority"] = labels["seniority"]
+
+    job["posted_date"] = parse_posted_date(posted)
+    job["posted_date_open_ended"] = posted_date_is_open_ended(posted)
+    return job
@@ -0,0 +1,165 @@
+"""
+Streaming job output for the scrapers.
+
+JobWriter writes each parsed job to disk as soon as it is produced instead of
+dumping one big list after the run. Records go to `<path>.part`, one JSON
+object per line, and finalize() renames the file into place atomically. A
+crash, or a run that fails (abort()), keeps every job written so far in the
+.part file and leaves the last complete output in place; the readers below
+fall back to the .part file when no finalized file exists.
+
+Two formats, chosen by OUTPUT_FORMAT (or the file extension):
+- "json":  a JSON array with one record per line, readable by json.load
+- "jsonl": JSON Lines
+
+iter_records() reads either format lazily, one record at a time. It also
+reads legacy indented .json files, which it has to load whole.
+"""
+
+import json
+import os
+import threading
+
+OUTPUT_FORMAT = os.getenv("OUTPUT_FORMAT", "json")
+
+PART_SUFFIX = ".part"
+
+
+def output_path(directory, name, fmt=OUTPUT_FORMAT):
+    """e.g. output_path('output/seek', 'seek_jobs') -> 'output/seek/seek_jobs.json'"""
+    return os.path.join(directory, f"{name}.{fmt}")
+
+
+class JobWriter:
+    """
+    Append-as-you-go writer with an atomic finalize step.
+
+    Usage:
+        with JobWriter("output/seek/seek_jobs.jsonl") as writer:
+            for job in jobs:
+                writer.write(job)
+    """
+
+    def __init__(self, path, on_write=None):
+        self.path = path
+        # Called with each record after it is written (e.g. to feed a live ingest)
+        self.on_write = on_write
+        self.part_path = path + PART_SUFFIX
+        self.jsonl = path.endswith(".jsonl")
+        self.count = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.part_path, "w", encoding="utf-8")
+        if not self.jsonl:
+            self._file.write("[")
+            self._file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.finalize()
+        else:
+            # Jobs written before an error are still worth keeping, but not over a complete file
+            self.abort()
+
+    def write(self, record):
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            if self.jsonl:
+                self._file.write(line + "\n")
+            else:
+                self._file.write(("\n" if self.count == 0 else ",\n") + line)
+            self._file.flush()
+            self.count += 1
+        if self.on_write:
+            self.on_write(record)
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+
+    def _close(self):
+        if not self.jsonl:
+            self._file.write("\n]\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+
+    def finalize(self):
+        """Close the .part file and move it over the final path"""
+        with self._lock:
+            if self._file is None:
+                return
+            self._close()
+            os.replace(self.part_path, self.path)
+
+    def abort(self):
+        """Close the .part file and leave it there: the final path keeps the last complete run"""
+        with self._lock:
+            if self._file is None:
+                return
+            self._close()
+
+
+def resolve_output_file(filepath):
+    """
+    Find the file holding a scraper's output.
+    `filepath` may name either format; the most recently written of
+    <stem>.json / <stem>.jsonl wins, then a leftover .part from a crashed run.
+    Returns None if nothing exists.
+    """
+    stem, _ = os.path.splitext(filepath)
+    finalized = [p for p in (stem + ".json", stem + ".jsonl") if os.path.exists(p)]
+    if finalized:
+        return max(finalized, key=os.path.getmtime)
+    partial = [p + PART_SUFFIX for p in (stem + ".json", stem + ".jsonl")]
+    partial = [p for p in partial if os.path.exists(p)]
+    if partial:
+        return max(partial, key=os.path.getmtime)
+    return None
+
+
+def _iter_lines(f):
+    """Records from JSONL, or from a one-record-per-line array written by JobWriter"""
+    for line in f:
+        line = line.strip().rstrip(",")
+        if line in ("", "[", "]"):
+            continue
+        yield json.loads(line)
+
+
+def iter_records(filepath):
+    """
+    Lazily yield the records of a scraper output file (see resolve_output_file).
+    Raises FileNotFoundError if there is no output at all.
+    """
+    path = resolve_output_file(filepath)
+    if path is None:
+        raise FileNotFoundError(filepath)
+
+    with open(path, "r", encoding="utf-8") as f:
+        if ".jsonl" in os.path.basename(path):
+            yield from _iter_lines(f)
+            return
+
+        first = f.readline()
+        second = f.readline()
+        f.seek(0)
+        try:
+            line_per_record = first.strip() == "[" and (
+                second.strip() in ("", "]") or isinstance(json.loads(second.strip().rstrip(",")), dict)
+            )
+        except ValueError:
+            line_per_record = False
+
+        if line_per_record:
+            yield from _iter_lines(f)
+        else:
+            # Legacy indented JSON: has to be loaded whole
+            yield from json.load(f)
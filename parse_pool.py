@@ -0,0 +1,119 @@
+"""
+Parse stage in a process pool.
+
+Fetch threads (and the listing browsers) only hand over raw HTML; the site
+parser, and the salary / location / date / remote-hybrid normalization it
+runs, happen in worker processes. Parsing then uses every core and never
+holds the GIL the browser-driving threads need.
+
+    with ParsePool() as pool:
+        jobs = pool.parse(scraper.parse_listing, html, url)
+        for url, job in pool.parse_stream(scraper.parse_detail, fetched_pages):
+            ...
+
+Workers are spawned (not forked: the parent runs browser threads) and date
+relative "posted" times from the parent's run anchor. A parser that cannot
+be pickled (a lambda, say) runs inline instead. PARSE_WORKERS=0 parses
+everything inline, as before.
+"""
+
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+
+from utils import reference_time, set_reference_time
+
+# Worker processes; one core is left for the fetch threads and browsers
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", str(max((os.cpu_count() or 1) - 1, 0))))
+
+
+def _init_worker(anchor):
+    set_reference_time(anchor)
+
+
+class ParsePool:
+    """Runs parser(html, ...) calls in worker processes, or inline when workers=0"""
+
+    def __init__(self, workers=PARSE_WORKERS):
+        self.workers = workers
+        self._executor = None
+        self._lock = threading.Lock()
+        # parser -> whether it can be sent to a worker
+        self._picklable = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker, initargs=(reference_time(),))
+            return self._executor
+
+    def _offload(self, parser):
+        if not self.workers:
+            return False
+        picklable = self._picklable.get(parser)
+        if picklable is None:
+            try:
+                pickle.dumps(parser)
+                picklable = True
+            except Exception:
+                picklable = False
+            self._picklable[parser] = picklable
+        return picklable
+
+    def submit(self, parser, *args):
+        """Future for parser(*args)"""
+        if self._offload(parser):
+            return self._get_executor().submit(parser, *args)
+        future = Future()
+        try:
+            future.set_result(parser(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def parse(self, parser, *args):
+        """parser(*args), run in a worker"""
+        return self.submit(parser, *args).result()
+
+    def parse_stream(self, parser, pages):
+        """
+        Parse (url, html) pairs as they arrive, e.g. from DetailFetchPool.fetch_all.
+        Yields (url, parsed) in completion order; pages with no HTML or whose
+        parser raised are reported and yielded as (url, None).
+        """
+        pending = {}
+
+        def finished(futures):
+            for future in futures:
+                url = pending.pop(future)
+                try:
+                    yield url, future.result()
+                except Exception as e:
+                    print(f"Error parsing {url}: {e}")
+                    yield url, None
+
+        for url, html in pages:
+            if html is None:
+                yield url, None
+            else:
+                pending[self.submit(parser, html)] = url
+            yield from finished([future for future in pending if future.done()])
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            yield from finished(done)
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
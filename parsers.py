@@ -0,0 +1,401 @@
+"""
+HTML parsers for every job site.
+
+All parsers build their soup through make_soup(), so the parser backend is
+pluggable (set PARSER_BACKEND to pick one):
+
+- "html.parser": Python's built-in parser, the original behaviour.
+- "lxml": BeautifulSoup on top of the lxml C parser.
+- "lxml-subtree": lxml parses the whole page, an XPath picks out only the
+  elements the parser reads, and BeautifulSoup builds a tree of just those.
+  Building the BeautifulSoup tree is the expensive part, so this is the
+  default when lxml is installed.
+
+Output is identical across backends; see test_parsers.py and
+benchmarks/bench_parsers.py.
+"""
+
+import importlib.util
+import os
+import re
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from normalize import normalize_job, work_type_label
+
+HAS_LXML = importlib.util.find_spec("lxml") is not None
+
+BACKENDS = ["lxml-subtree", "lxml", "html.parser"] if HAS_LXML else ["html.parser"]
+PARSER_BACKEND = os.getenv("PARSER_BACKEND") or BACKENDS[0]
+
+
+def _outermost(nodes):
+    """Drop nodes nested inside another selected node, keeping document order"""
+    selected = set(nodes)
+    kept = []
+    for node in nodes:
+        parent = node.getparent()
+        while parent is not None and parent not in selected:
+            parent = parent.getparent()
+        if parent is None:
+            kept.append(node)
+    return kept
+
+
+def extract_subtrees(html, xpath):
+    """Serialize only the outermost elements matching `xpath`, in document order"""
+    import lxml.etree
+    import lxml.html
+
+    if not html or not html.strip():
+        # Failed fetch: lxml refuses an empty document
+        return ""
+    root = lxml.html.fromstring(html)
+    nodes = _outermost(root.xpath(xpath))
+    # XML serialization: the HTML serializer percent-escapes href/src values
+    return "".join(
+        lxml.etree.tostring(node, encoding="unicode", method="xml", with_tail=False)
+        for node in nodes
+    )
+
+
+def make_soup(html, subtrees=None, backend=None):
+    """
+    Parse `html` with the configured backend.
+    `subtrees` is an XPath covering every element the caller will look at;
+    the "lxml-subtree" backend builds the soup from those elements only.
+    """
+    backend = backend or PARSER_BACKEND
+    if backend == "lxml-subtree":
+        if subtrees:
+            html = extract_subtrees(html, subtrees)
+        backend = "lxml"
+    return BeautifulSoup(html, backend)
+
+
+def _has_class(name):
+    """XPath test for a single class token, like CSS .name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# =======================================
+# SEEK
+# =======================================
+
+SEEK_LISTING_SELECTOR = "a[data-testid='job-list-item-link-overlay']"
+SEEK_POSTED_RE = re.compile(r"Posted\s+\d+[hdw]")
+# Every field is on a data-automation element, except the posted date span
+SEEK_DETAIL_XPATH = "//*[@data-automation] | //span[contains(., 'Posted')]"
+
+
+def safe_extract(soup, selector):
+    el = soup.find(attrs={"data-automation": selector})
+    return el.get_text(strip=True) if el else None
+
+def extract_job_details(html, backend=None):
+    soup = make_soup(html, subtrees=SEEK_DETAIL_XPATH, backend=backend)
+
+    job = {}
+
+    job["job_title"] = safe_extract(soup, "job-detail-title")
+    job["company_name"] = safe_extract(soup, "advertiser-name")
+    job["location"] = safe_extract(soup, "job-detail-location")
+    # job["classification"] = safe_extract(soup, "job-detail-classifications") # REMOVED
+    job["work_type"] = safe_extract(soup, "job-detail-work-type")
+    job["salary_range"] = safe_extract(soup, "job-detail-salary")
+
+    # Posted date (no unique selector)
+    posted_tag = soup.find("span", string=SEEK_POSTED_RE)
+    job_post = posted_tag.get_text(strip=True) if posted_tag else None
+
+    # Job description
+    details_div = soup.find("div", attrs={"data-automation": "jobAdDetails"})
+    if details_div:
+        text = details_div.get_text("\n", strip=True)
+        lines = [line.strip() for line in text.split("\n") if line.strip()]
+        job["job_description"] = "\n".join(lines)
+    else:
+        job["job_description"] = None
+
+    return normalize_job(job, posted=job_post)
+
+
+def extract_seek_listing_urls(html, base_url, backend=None):
+    """Collect job detail links from a Seek search results page"""
+    soup = make_soup(html, subtrees="//a", backend=backend)
+    links = soup.select(SEEK_LISTING_SELECTOR)
+    return [urljoin(base_url, a["href"]) for a in links if a.get("href")]
+
+
+# =======================================
+# JORA
+# =======================================
+
+JORA_LISTING_SELECTOR = "a.job-link.show-job-description"
+DIGIT_RE = re.compile(r"\d")
+JORA_DETAIL_XPATH = (
+    "//h1 | //span[@class] | //*[@id='job-meta'] | //div[@id='job-description-container']"
+    f" | //div[{_has_class('badge')}]"
+)
+
+
+def extract_badges(soup):
+    # Collect ALL badge types you care about
+    badge_selectors = [
+        "div.badge.-default-badge .content",
+        "div.badge.-work-arrangement-badge .content"
+    ]
+
+    badges = []
+    for sel in badge_selectors:
+        for b in soup.select(sel):
+            text = b.get_text(strip=True)
+            if text:
+                badges.append(text)
+
+    salary = None
+    work_types = []
+
+    for text in badges:
+        # Filter nonsense
+        if text.lower() in ["badge", ""]:
+            continue
+
+        # Salary detection
+        if "$" in text or DIGIT_RE.search(text):
+            # rudimentary check, sometimes digits might be in other things, but usually OK for badges
+            salary = text
+            continue
+
+        # Everything else = work type
+        work_types.append(text)
+
+    return salary, work_types
+
+
+# -----------------------------------------
+# Extract fields from the NEW website
+# -----------------------------------------
+def parse_new_site(html, backend=None):
+    soup = make_soup(html, subtrees=JORA_DETAIL_XPATH, backend=backend)
+    job = {}
+
+    # Job Title
+    title_el = soup.find("h1", class_="job-title")
+    job["job_title"] = title_el.get_text(strip=True) if title_el else None
+
+    # Company name (previously advertiser_name)
+    advertiser_el = soup.find("span", class_="company")
+    job["company_name"] = advertiser_el.get_text(strip=True) if advertiser_el else None
+
+    # Location
+    location_el = soup.find("span", class_="location")
+    raw_location = location_el.get_text(strip=True) if location_el else None
+    job["location"] = raw_location
+
+    salary, work_types = extract_badges(soup)
+
+    job["salary_range"] = salary
+    job["work_type"] = ", ".join(work_types) if work_types else None
+    # job["classification"] = None  # REMOVED
+
+    # Posted date
+    posted_el = soup.select_one("#job-meta .listed-date")
+    raw_posted = posted_el.get_text(strip=True) if posted_el else None
+
+    # FULL job description
+    desc_container = soup.find("div", id="job-description-container")
+    if desc_container:
+        text = desc_container.get_text("\n", strip=True)
+        lines = [line.strip() for line in text.split("\n") if line.strip()]
+        job["job_description"] = "\n".join(lines)
+    else:
+        job["job_description"] = None
+
+    return normalize_job(job, posted=raw_posted)
+
+
+def extract_jora_listing_urls(html, base_url, backend=None):
+    """Collect job detail links from a Jora search results page"""
+    soup = make_soup(html, subtrees="//a", backend=backend)
+    links = soup.select(JORA_LISTING_SELECTOR)
+    return [urljoin(base_url, a["href"]) for a in links if a.get("href")]
+
+
+# =======================================
+# CAREERONE
+# =======================================
+
+CAREER_XPATH = (
+    f"//*[{_has_class('job-card-detailed')}]"
+    " | //div[normalize-space(@class)='d-block cursor-pointer']"
+)
+
+
+def parse_career_jobs(html, backend=None):
+    soup = make_soup(html, subtrees=CAREER_XPATH, backend=backend)
+    parsed_jobs = []
+
+    # Iterate over job cards
+    # Based on browser subagent: .job-card-detailed
+    job_cards = soup.select(".job-card-detailed")
+
+    for card in job_cards:
+        job = {}
+
+        # Title
+        title_el = card.select_one("h2 a")
+        job["job_title"] = title_el.get_text(strip=True) if title_el else None
+        job["url"] = None
+        if title_el and title_el.has_attr('href'):
+            # Ensure absolute URL
+            href = title_el['href']
+            if href.startswith('/'):
+                job["url"] = f"https://www.careerone.com.au{href}"
+            else:
+                job["url"] = href
+
+        # Company
+        company_el = card.select_one("h3 a")
+        job["company_name"] = company_el.get_text(strip=True) if company_el else None
+
+        # Location
+        # Finds div with location-like text or specific class if available
+        # Previous scraper used a somewhat generic locator, let's try to be robust
+        # This selector targets the location text usually found under company
+        location_el = card.select_one(".text-body-4.text-truncate a")
+        raw_location = location_el.get_text(strip=True) if location_el else None
+        job["location"] = raw_location
+
+        # Salary
+        # Looking for text that looks like salary
+        salary_el = card.find(string=lambda t: t and '$' in t)
+        raw_salary = salary_el.strip() if salary_el else None
+        # Try a more specific selector if that failed
+        if not raw_salary:
+             sal_span = card.select_one("span.text-title-4")
+             if sal_span:
+                 raw_salary = sal_span.get_text(strip=True)
+
+        job["salary_range"] = raw_salary
+
+        # Description / Key Points
+        # Updated via second loop below
+        job["job_description"] = None
+
+        # Work Type
+        # A badge like "Full time"; without one it is classified from the card
+        badges = [badge.get_text(strip=True) for badge in card.select("span.badge")]
+        job["work_type"] = next(filter(None, map(work_type_label, badges)), None)
+
+        # job["classification"] = None # REMOVED
+
+        # Posted Date
+        # Look for "2d ago" etc.
+        posted_el = card.select_one(".job-date")
+        raw_posted = posted_el.get_text(strip=True) if posted_el else None
+
+        parsed_jobs.append(normalize_job(job, posted=raw_posted, text=card.get_text(" ", strip=True)))
+
+    # ------------- SECOND LOOP: Update Job_description ---------------
+    job_descrip_containers = soup.find_all('div', class_="d-block cursor-pointer")
+
+    for i, div in enumerate(job_descrip_containers, 1):
+        # Find the <ul> inside this div
+        ul_tag = div.find('ul')
+        if ul_tag:
+            # Extract all <li> text
+            key_points = [li.get_text(strip=True) for li in ul_tag.find_all('li')]
+            # Join as single string or keep as list
+            key_points_text = "; ".join(key_points)
+
+            # Update existing entry
+            if i-1 < len(parsed_jobs):  # safety check
+                parsed_jobs[i-1]["job_description"] = key_points_text
+
+    return parsed_jobs
+
+
+# =======================================
+# JOBSEARCH
+# =======================================
+
+JOBSEARCH_CARD_CLASS = (
+    "group relative bg-white rounded-xl border transition-all duration-300 "
+    "overflow-hidden cursor-pointer w-full border-gray-200 shadow-sm "
+    "hover:shadow-md hover:border-indigo-300 hover:-translate-y-0.5"
+)
+
+
+JOBSEARCH_XPATH = f"//li[normalize-space(@class)='{JOBSEARCH_CARD_CLASS}']"
+
+
+def parse_jobsearch_jobs(html, backend=None):
+    """Parse every job card on a JobSearch results page"""
+    # Everything we read lives inside the <li> cards
+    soup = make_soup(html, subtrees=JOBSEARCH_XPATH, backend=backend)
+    li_elements = soup.find_all("li", class_=JOBSEARCH_CARD_CLASS)
+
+    data = []
+    for li in li_elements:
+
+        job_id = li.get("data-job-id")
+
+        company_span = li.find("span", class_="font-medium truncate min-w-0")
+        company_name = company_span.get_text(strip=True) if company_span else None
+
+        h2 = li.find("h2", class_="text-lg font-semibold transition-colors line-clamp-2 mb-2 break-words text-gray-900 group-hover:text-indigo-600")
+        job_title = h2.get_text(strip=True) if h2 else None
+
+        # Location
+        location = None
+        for s in li.find_all("span", class_="truncate"):
+            if company_span and s == company_span:
+                continue
+            classes = s.get("class", [])
+            if "font-medium" in classes or "min-w-0" in classes:
+                continue
+            location = s.get_text(strip=True)
+            if location:
+                break
+
+        salary_span = li.find("span", class_="px-2.5 py-1 rounded-lg bg-gray-50 text-gray-700 text-xs font-medium border border-gray-200")
+        salary_range = salary_span.get_text(strip=True) if salary_span else None
+
+        work = li.find("span", class_="px-2.5 py-1 rounded-lg bg-indigo-50 text-indigo-700 text-xs font-medium border border-indigo-100")
+        work_type = work.get_text(strip=True) if work else None
+
+        posting_time = None
+        for element in li.find_all(string=lambda text: text and "Posted" in text):
+            # Get the parent element that contains the full text
+            parent = element.parent
+
+            # Get all text from this parent element, including child elements
+            # Use separator=" " to avoid "Postedyesterday"
+            full_text = parent.get_text(separator=" ", strip=True)
+
+            # Extract just the time part (remove "Posted" and any extra whitespace)
+            if "Posted" in full_text:
+                # Ensure "Posted" is separated
+                posting_time = full_text.replace("Posted", "Posted ").strip()
+                # Clean up multiple spaces if any
+                posting_time = " ".join(posting_time.split())
+                break
+
+        desc_div = li.find("div", class_="space-y-2 text-sm text-gray-700")
+        job_description = desc_div.get_text(separator=" ", strip=True) if desc_div else None
+
+        data.append(normalize_job({
+            "job_title": job_title,
+            "company_name": company_name,
+            "location": location,
+            # "classification": None, # REMOVED
+            "salary_range": salary_range,
+            "work_type": work_type,
+            # "posting_time": posting_time,
+            "job_description": job_description,
+            "url": f"https://www.jobsearch.com.au/job/{job_id}" if job_id else None,
+        }, posted=posting_time))
+
+    return data
@@ -0,0 +1,99 @@
+"""
+Filtered, paginated job listings.
+
+find_jobs() pages through jobs newest first with keyset pagination on
+(posted_date, id): each page asks for the rows after the last one it
+returned instead of using OFFSET, so page 1000 costs the same as page 1.
+The filters line up with the composite and partial indexes on Job.
+
+Only live jobs are listed; expired ones (see retention.py) are skipped.
+Jobs without a posted_date cannot be placed in the newest-first order and
+are left out of these listings; they are still found by search.search_jobs.
+
+Usage:
+    from database import SessionLocal
+    from queries import find_jobs
+
+    db = SessionLocal()
+    jobs, cursor = find_jobs(db, state="VIC", is_remote=True, min_salary=100000)
+    while cursor:
+        jobs, cursor = find_jobs(db, state="VIC", is_remote=True, min_salary=100000, after=cursor)
+"""
+
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import func, or_, select, tuple_
+
+from database import Job
+
+DEFAULT_PAGE_SIZE = 50
+
+
+def encode_cursor(job):
+    """Opaque cursor for the page after `job`, e.g. '2024-05-01:1234'"""
+    return f"{job.posted_date.isoformat()}:{job.id}"
+
+
+def decode_cursor(cursor):
+    """(posted_date, id) from encode_cursor(); raises ValueError for a malformed cursor"""
+    posted, _, job_id = cursor.rpartition(":")
+    if not posted or not job_id.isdigit():
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return date.fromisoformat(posted), int(job_id)
+
+
+def apply_filters(stmt, state=None, work_type=None, is_remote=None, is_hybrid=None,
+                  min_salary=None, max_salary=None, posted_within_days=None, source=None):
+    """Add the job filters shared by listings and search to a SELECT"""
+    # Expired jobs wait in the table until retention.py archives them
+    stmt = stmt.where(Job.expired_at.is_(None))
+    if state:
+        stmt = stmt.where(Job.state == state.upper())
+    if source:
+        stmt = stmt.where(Job.source == source)
+    if work_type:
+        stmt = stmt.where(func.lower(Job.work_type) == work_type.lower())
+    # Plain boolean tests, so the planner can match the partial remote/hybrid indexes
+    if is_remote is not None:
+        stmt = stmt.where(Job.is_remote if is_remote else ~Job.is_remote)
+    if is_hybrid is not None:
+        stmt = stmt.where(Job.is_hybrid if is_hybrid else ~Job.is_hybrid)
+    if min_salary is not None:
+        # The advertised range reaches the wanted minimum
+        stmt = stmt.where(or_(Job.max_annual_salary >= min_salary,
+                              Job.max_annual_salary.is_(None) & (Job.min_annual_salary >= min_salary)))
+    if max_salary is not None:
+        stmt = stmt.where(Job.min_annual_salary <= max_salary)
+    if posted_within_days is not None:
+        stmt = stmt.where(Job.posted_date >= datetime.now().date() - timedelta(days=posted_within_days))
+    return stmt
+
+
+def jobs_query(after=None, limit=DEFAULT_PAGE_SIZE, **filters):
+    """SELECT for one page of jobs, newest first, starting after the `after` cursor"""
+    stmt = apply_filters(select(Job).where(Job.posted_date.is_not(None)), **filters)
+    if after:
+        stmt = stmt.where(tuple_(Job.posted_date, Job.id) < decode_cursor(after))
+    return stmt.order_by(Job.posted_date.desc(), Job.id.desc()).limit(limit)
+
+
+def find_jobs(db, state=None, work_type=None, is_remote=None, is_hybrid=None, min_salary=None,
+              max_salary=None, posted_within_days=None, source=None, after=None,
+              limit=DEFAULT_PAGE_SIZE):
+    """
+    One page of matching jobs, newest first. Returns (jobs, next_cursor);
+    next_cursor is None on the last page.
+
+    state               exact state code, e.g. "NSW"
+    is_remote/is_hybrid True or False to filter, None for either
+    min_salary          the job's advertised range reaches at least this
+    max_salary          the job's advertised range starts at or below this
+    posted_within_days  only jobs posted in the last N days
+    after               cursor returned with the previous page
+    """
+    stmt = jobs_query(after, limit, state=state, work_type=work_type, is_remote=is_remote,
+                      is_hybrid=is_hybrid, min_salary=min_salary, max_salary=max_salary,
+                      posted_within_days=posted_within_days, source=source)
+    jobs = db.execute(stmt).scalars().all()
+    next_cursor = encode_cursor(jobs[-1]) if len(jobs) == limit else None
+    return jobs, next_cursor
@@ -1,8 +1,8 @@
-from database import engine, Base, Job
+from database import get_engine, Base, Job
 
-def reset_db():
+def reset_db(engine=None):
     print("Dropping all tables...")
-    Base.metadata.drop_all(bind=engine)
+    Base.metadata.drop_all(bind=engine or get_engine())
     print("Tables dropped.")
 
 if __name__ == "__main__":
@@ -0,0 +1,150 @@
+"""
+Expiry and archival of jobs that are no longer listed.
+
+Every ingest bumps jobs.last_seen_at for the postings it saw. A job that no
+ingest has seen for a source's expire period is marked expired (listings
+and search skip it from then on); if it turns up again, the next ingest
+clears the mark. Once it has been expired for the archive period it is
+moved, in batches of RETENTION_BATCH_SIZE rows per transaction, from
+`jobs` to `jobs_archive` (on PostgreSQL a table partitioned by month of
+posted_date), so `jobs` and its indexes only hold live postings.
+
+Settings (environment):
+    RETENTION_EXPIRE_DAYS     days unseen before a job expires (default 30, 0 = never)
+    RETENTION_ARCHIVE_DAYS    days expired before a job is archived (default 7)
+    RETENTION_BATCH_SIZE      jobs moved per transaction (default 1000)
+    RETENTION_EXPIRE_DAYS_<SOURCE>, RETENTION_ARCHIVE_DAYS_<SOURCE>
+                              per-source overrides, e.g. RETENTION_EXPIRE_DAYS_SEEK=14
+
+Usage:
+    python retention.py               # every source
+    python retention.py seek jora     # just these
+"""
+
+import argparse
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import DateTime, and_, delete, insert, literal, or_, select, text, update
+
+from database import SessionLocal, Job, jobs_archive
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+RETENTION_EXPIRE_DAYS = int(os.getenv("RETENTION_EXPIRE_DAYS", "30"))
+RETENTION_ARCHIVE_DAYS = int(os.getenv("RETENTION_ARCHIVE_DAYS", "7"))
+RETENTION_BATCH_SIZE = int(os.getenv("RETENTION_BATCH_SIZE", "1000"))
+
+
+def policy_for(source):
+    """(expire_days, archive_days) for a source, honouring the per-source overrides"""
+    suffix = (source or "").upper()
+    expire_days = int(os.getenv(f"RETENTION_EXPIRE_DAYS_{suffix}", RETENTION_EXPIRE_DAYS))
+    archive_days = int(os.getenv(f"RETENTION_ARCHIVE_DAYS_{suffix}", RETENTION_ARCHIVE_DAYS))
+    return expire_days, archive_days
+
+
+def _source_is(source):
+    return Job.source.is_(None) if source is None else Job.source == source
+
+
+def expire_jobs(db, source, days, now=None):
+    """Mark the source's jobs not seen for `days` days as expired. The caller commits."""
+    now = now or datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=days)
+    # Jobs ingested before last_seen_at existed only have created_at
+    unseen = or_(Job.last_seen_at < cutoff, and_(Job.last_seen_at.is_(None), Job.created_at < cutoff))
+    result = db.execute(
+        update(Job.__table__)
+        .where(_source_is(source), Job.expired_at.is_(None), unseen)
+        .values(expired_at=now)
+    )
+    return result.rowcount
+
+
+def ensure_archive_partitions(db, posted_dates):
+    """On PostgreSQL, create the monthly jobs_archive partitions these dates fall in"""
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    months = {day.replace(day=1) for day in posted_dates if day}
+    for month in sorted(months):
+        following = (month + timedelta(days=32)).replace(day=1)
+        db.execute(text(
+            f"CREATE TABLE IF NOT EXISTS jobs_archive_{month:%Y_%m} PARTITION OF jobs_archive "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{following.isoformat()}')"
+        ))
+
+
+def archive_jobs(db, source, days, batch_size=RETENTION_BATCH_SIZE, now=None):
+    """
+    Move the source's jobs expired for at least `days` days into jobs_archive,
+    committing after every batch. Returns the number of jobs moved.
+    """
+    now = now or datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=days)
+    table = Job.__table__
+    columns = [column.name for column in table.columns]
+    moved = 0
+    while True:
+        batch = db.execute(
+            select(table.c.id, table.c.posted_date)
+            .where(_source_is(source), table.c.expired_at <= cutoff)
+            .order_by(table.c.id)
+            .limit(batch_size)
+        ).all()
+        if not batch:
+            return moved
+
+        ids = [job_id for job_id, _ in batch]
+        ensure_archive_partitions(db, [posted for _, posted in batch])
+        db.execute(insert(jobs_archive).from_select(
+            columns + ["archived_at"],
+            select(*table.columns, literal(now, DateTime(timezone=True))).where(table.c.id.in_(ids)),
+        ))
+        db.execute(delete(table).where(table.c.id.in_(ids)))
+        db.commit()
+        moved += len(ids)
+
+
+def run_retention(sources=None, session_factory=SessionLocal, batch_size=RETENTION_BATCH_SIZE):
+    """
+    Apply each source's policy (default: every source in the jobs table).
+    Returns {source: (expired, archived)}.
+    """
+    results = {}
+    db = session_factory()
+    try:
+        if sources is None:
+            sources = [source for (source,) in db.execute(select(Job.source).distinct())]
+        now = datetime.now(timezone.utc)
+        for source in sources:
+            expire_days, archive_days = policy_for(source)
+            expired = 0
+            if expire_days > 0:
+                expired = expire_jobs(db, source, expire_days, now)
+                db.commit()
+            archived = archive_jobs(db, source, archive_days, batch_size, now)
+            logger.info(f"{source}: expired {expired} jobs unseen for {expire_days} days, "
+                        f"archived {archived} expired for {archive_days}+ days")
+            results[source] = (expired, archived)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Expire and archive jobs that are no longer listed")
+    parser.add_argument("sources", nargs="*", help="Sources to process (default: all)")
+    parser.add_argument("--batch-size", type=int, default=RETENTION_BATCH_SIZE,
+                        help="Jobs moved to the archive per transaction")
+    args = parser.parse_args()
+    run_retention(args.sources or None, batch_size=args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
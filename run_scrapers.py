@@ -1,8 +1,19 @@
 """
 Parallel Job Scraper Runner
 
-This script runs seek.py, jobsearch.py, jora.py, and career.py in parallel using multiprocessing,
-then combines their JSON outputs into a single CSV file.
+This script runs every registered scraper (see scraper.py) in parallel, either as
+one child process per source or, with --in-process, in this process with a shared
+scheduler, then combines their JSON outputs into a single CSV file.
+
+Child processes are driven by asyncio: their output is streamed line by line to
+logs/<name>.log (and the console), each has a wall-clock limit (SCRAPER_TIMEOUT,
+or SCRAPER_TIMEOUT_<NAME>) after which it is stopped together with its browsers,
+and each source's output is loaded for the CSV as soon as it finishes.
+
+    python run_scrapers.py                  # all sources, one process each
+    python run_scrapers.py seek jora        # just these
+    python run_scrapers.py --in-process     # shared fetchers and rate limits
+    python run_scrapers.py --in-process --ingest   # and load jobs into the DB as they arrive
 
 Directory Structure:
 - output/seek/seek_jobs.json
@@ -12,151 +23,174 @@ Directory Structure:
 - combined_jobs.csv (root directory)
 """
 
-import multiprocessing
-import subprocess
-import json
-import pandas as pd
+import argparse
+import asyncio
 import os
+import signal
 import sys
-from pathlib import Path
+import time
+import pandas as pd
+from output import iter_records, resolve_output_file
+from metrics import RUN_ID_ENV, finish_run, record_missing_sources, start_run
+from utils import RUN_STARTED_ENV, set_reference_time
+from scraper import get_scraper, load_scrapers, run_in_process
 
+# Wall-clock limit per scraper, in seconds; SCRAPER_TIMEOUT_<NAME> overrides it for one source
+SCRAPER_TIMEOUT = float(os.getenv("SCRAPER_TIMEOUT", "3600"))
+# Child output is streamed here as logs/<name>.log
+LOG_DIR = os.getenv("SCRAPER_LOG_DIR", "logs")
+# Seconds a timed-out scraper gets to exit after SIGTERM before it is killed
+KILL_GRACE = 10
 
-def run_seek_scraper():
-    """Run the Seek job scraper"""
-    print("\n[SEEK] Starting Seek scraper...")
-    try:
-        result = subprocess.run(
-            [sys.executable, "seek.py"],
-            cwd=os.getcwd(),
-            capture_output=True,
-            text=True
-        )
-        print(f"[SEEK] {result.stdout}")
-        if result.stderr:
-            print(f"[SEEK ERROR] {result.stderr}")
-        print("[SEEK] Completed!")
-        return result.returncode == 0
-    except Exception as e:
-        print(f"[SEEK ERROR] Failed to run: {e}")
-        return False
+
+def scraper_timeout(name):
+    return float(os.getenv(f"SCRAPER_TIMEOUT_{name.upper()}", SCRAPER_TIMEOUT))
 
 
-def run_jobsearch_scraper():
-    """Run the JobSearch scraper"""
-    print("\n[JOBSEARCH] Starting JobSearch scraper...")
+async def _stream_output(stream, label, log):
+    """Copy the child's output line by line to its log file and to the console"""
+    while True:
+        line = await stream.readline()
+        if not line:
+            break
+        text = line.decode("utf-8", errors="replace").rstrip()
+        log.write(text + "\n")
+        log.flush()
+        print(f"[{label}] {text}", flush=True)
+
+
+def _signal_group(process, sig):
+    """Signal the child and everything it started (Chrome, chromedriver)"""
     try:
-        result = subprocess.run(
-            [sys.executable, "jobsearch.py"],
-            cwd=os.getcwd(),
-            capture_output=True,
-            text=True
-        )
-        print(f"[JOBSEARCH] {result.stdout}")
-        if result.stderr:
-            print(f"[JOBSEARCH ERROR] {result.stderr}")
-        print("[JOBSEARCH] Completed!")
-        return result.returncode == 0
-    except Exception as e:
-        print(f"[JOBSEARCH ERROR] Failed to run: {e}")
-        return False
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, sig)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
 
 
-def run_jora_scraper():
-    """Run the Jora scraper"""
-    print("\n[JORA] Starting Jora scraper...")
+async def _stop(process):
+    """SIGTERM the child's process group, then SIGKILL it if it does not exit"""
+    if process.returncode is not None:
+        return
+    _signal_group(process, signal.SIGTERM)
     try:
-        result = subprocess.run(
-            [sys.executable, "jora.py"],
-            cwd=os.getcwd(),
-            capture_output=True,
-            text=True
-        )
-        print(f"[JORA] {result.stdout}")
-        if result.stderr:
-            print(f"[JORA ERROR] {result.stderr}")
-        print("[JORA] Completed!")
-        return result.returncode == 0
-    except Exception as e:
-        print(f"[JORA ERROR] Failed to run: {e}")
-        return False
+        await asyncio.wait_for(process.wait(), KILL_GRACE)
+    except asyncio.TimeoutError:
+        _signal_group(process, getattr(signal, "SIGKILL", signal.SIGTERM))
+        await process.wait()
+
 
+async def run_scraper(name, timeout=None):
+    """
+    Run one registered scraper as a child process, streaming its output to
+    logs/<name>.log. Returns "ok", "failed" or "timeout".
+    """
+    module = load_scrapers()[name].__module__
+    log_path = os.path.join(LOG_DIR, f"{name}.log")
+    return await run_child(name, [sys.executable, "-u", "-m", module],
+                           timeout or scraper_timeout(name), log_path)
 
-def run_career_scraper():
-    """Run the CareerOne scraper"""
-    print("\n[CAREER] Starting CareerOne scraper...")
+
+async def run_child(name, argv, timeout, log_path):
+    """Run `argv` with a wall-clock limit, streaming its output to `log_path`"""
+    label = name.upper()
+    log_dir = os.path.dirname(log_path)
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+
+    print(f"\n[{label}] Starting {name} scraper (timeout {timeout:.0f}s, log {log_path})...")
+    start = time.time()
     try:
-        result = subprocess.run(
-            [sys.executable, "career.py"],
+        process = await asyncio.create_subprocess_exec(
+            *argv,
             cwd=os.getcwd(),
-            capture_output=True,
-            text=True
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            limit=1024 * 1024,  # longest output line
+            # Own process group, so a timeout takes its browsers down with it
+            start_new_session=True,
         )
-        print(f"[CAREER] {result.stdout}")
-        if result.stderr:
-            print(f"[CAREER ERROR] {result.stderr}")
-        print("[CAREER] Completed!")
-        return result.returncode == 0
     except Exception as e:
-        print(f"[CAREER ERROR] Failed to run: {e}")
-        return False
+        print(f"[{label} ERROR] Failed to run: {e}")
+        return "failed"
 
+    with open(log_path, "w", encoding="utf-8") as log:
+        pump = asyncio.create_task(_stream_output(process.stdout, label, log))
+        try:
+            await asyncio.wait_for(process.wait(), timeout)
+            status = "ok" if process.returncode == 0 else "failed"
+        except asyncio.TimeoutError:
+            print(f"[{label} ERROR] Timed out after {timeout:.0f}s, stopping it")
+            await _stop(process)
+            status = "timeout"
+        except asyncio.CancelledError:
+            await _stop(process)
+            pump.cancel()
+            raise
+        try:
+            await asyncio.wait_for(pump, KILL_GRACE)
+        except asyncio.TimeoutError:
+            pump.cancel()
 
-def load_json_file(filepath):
-    """Load JSON file and return data, or empty list if file doesn't exist"""
+    print(f"[{label}] Completed ({status}, exit code {process.returncode}) in {time.time() - start:.1f}s")
+    return status
+
+
+def load_json_file(filepath, lazy=False):
+    """
+    Load a scraper's output (.json or .jsonl, see output.iter_records).
+    Returns a list, or an iterator over the records when lazy=True.
+    Missing or unreadable files give an empty result.
+    """
+    if resolve_output_file(filepath) is None:
+        print(f"⚠ File not found: {filepath}")
+        return iter(()) if lazy else []
+    if lazy:
+        return iter_records(filepath)
     try:
-        if os.path.exists(filepath):
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                print(f"✓ Loaded {len(data)} jobs from {filepath}")
-                return data
-        else:
-            print(f"⚠ File not found: {filepath}")
-            return []
+        data = list(iter_records(filepath))
+        print(f"✓ Loaded {len(data)} jobs from {resolve_output_file(filepath)}")
+        return data
     except Exception as e:
         print(f"✗ Error loading {filepath}: {e}")
         return []
 
 
-def combine_to_csv():
-    """Combine JSON files from all scrapers into a single CSV"""
-    print("\n" + "="*60)
-    print("COMBINING RESULTS INTO CSV")
-    print("="*60)
-    
-    # Load data from all sources
-    seek_data = load_json_file("output/seek/seek_jobs.json")
-    jobsearch_data = load_json_file("output/jobsearch/jobsearch_jobs.json")
-    jora_data = load_json_file("output/jora/jora_jobs.json")
-    career_data = load_json_file("output/career/career_jobs.json")
-    
+def load_source_frame(scraper):
+    """Load one scraper's output as a DataFrame tagged with its source"""
+    data = load_json_file(scraper.output_file)
+    df = pd.DataFrame(data)
     # Add source column to identify where each job came from
-    for job in seek_data:
-        job['source'] = 'seek'
-    
-    for job in jobsearch_data:
-        job['source'] = 'jobsearch'
+    df['source'] = scraper.source
+    return df
 
-    for job in jora_data:
-        job['source'] = 'jora'
 
-    for job in career_data:
-        job['source'] = 'careerone'
-    
-    # Combine all jobs
-    all_jobs = seek_data + jobsearch_data + jora_data + career_data
+def combine_to_csv(frames=None):
+    """
+    Combine JSON files from all scrapers into a single CSV.
+    `frames` are per-source DataFrames already loaded by load_source_frame;
+    by default every registered source is loaded here.
+    """
+    if frames is None:
+        frames = [load_source_frame(scraper_cls()) for scraper_cls in load_scrapers().values()]
+
+    print("\n" + "="*60)
+    print("COMBINING RESULTS INTO CSV")
+    print("="*60)
     
-    if not all_jobs:
+    frames = [df for df in frames if len(df)]
+    if not frames:
         print("⚠ No jobs found to combine!")
         return False
     
-    print(f"\nTotal jobs collected: {len(all_jobs)}")
-    print(f"  - Seek: {len(seek_data)}")
-    print(f"  - JobSearch: {len(jobsearch_data)}")
-    print(f"  - Jora: {len(jora_data)}")
-    print(f"  - CareerOne: {len(career_data)}")
+    print(f"\nTotal jobs collected: {sum(len(df) for df in frames)}")
+    for df in frames:
+        print(f"  - {df['source'].iloc[0]}: {len(df)}")
     
     # Convert to DataFrame
-    df = pd.DataFrame(all_jobs)
+    df = pd.concat(frames, ignore_index=True)
     
     print(f"\nTotal jobs before removing duplicates: {len(df)}")
     
@@ -175,6 +209,7 @@ def combine_to_csv():
         'job_title',
         'company_name',
         'location',
+        'suburb',
         'city',
         'state',
         'country',
@@ -182,6 +217,7 @@ def combine_to_csv():
         'is_hybrid',
         # 'classification', # REMOVED
         'work_type',
+        'seniority',
         'salary_range',
         'min_annual_salary',
         'max_annual_salary',
@@ -206,54 +242,76 @@ def combine_to_csv():
     return True
 
 
+async def scrape_and_load(scraper):
+    """Run one scraper, then load its output for the CSV while the others keep running"""
+    status = await run_scraper(scraper.name)
+    # A failed or timed-out run still leaves the jobs it wrote (see output.py)
+    frame = await asyncio.to_thread(load_source_frame, scraper)
+    return scraper.name, status, frame
+
+
+async def run_all(names):
+    """Run the scrapers as concurrent child processes; returns ({name: status}, frames)"""
+    scrapers = [load_scrapers()[name]() for name in names]
+    statuses = {}
+    frames = []
+    for next_done in asyncio.as_completed([scrape_and_load(scraper) for scraper in scrapers]):
+        name, status, frame = await next_done
+        statuses[name] = status
+        frames.append(frame)
+    return statuses, frames
+
+
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="Run the job scrapers and combine their output")
+    parser.add_argument("sources", nargs="*", help="Scrapers to run (default: all)")
+    parser.add_argument("--in-process", action="store_true",
+                        help="Run every scraper in this process with one shared scheduler")
+    parser.add_argument("--ingest", action="store_true",
+                        help="With --in-process: write jobs to the database while scraping")
+    args = parser.parse_args()
+
+    names = args.sources or list(load_scrapers())
+    # Every scraper, in this process or a child, dates relative "posted" times from here
+    os.environ[RUN_STARTED_ENV] = set_reference_time().isoformat()
+
     print("="*60)
     print("PARALLEL JOB SCRAPER RUNNER")
     print("="*60)
     
-    # Ensure output directories exist
-    os.makedirs("output/seek", exist_ok=True)
-    os.makedirs("output/jobsearch", exist_ok=True)
-    os.makedirs("output/jora", exist_ok=True)
-    os.makedirs("output/career", exist_ok=True)
-    
-    # Create processes for parallel execution
-    seek_process = multiprocessing.Process(target=run_seek_scraper)
-    jobsearch_process = multiprocessing.Process(target=run_jobsearch_scraper)
-    jora_process = multiprocessing.Process(target=run_jora_scraper)
-    career_process = multiprocessing.Process(target=run_career_scraper)
-    
-    # Start all scrapers in parallel
-    print("\nStarting all scrapers in parallel...")
-    seek_process.start()
-    jobsearch_process.start()
-    jora_process.start()
-    career_process.start()
-    
-    # Wait for all to complete
-    print("\nWaiting for scrapers to complete...")
-    seek_process.join()
-    jobsearch_process.join()
-    jora_process.join()
-    career_process.join()
+    if args.in_process:
+        print("\nRunning scrapers in-process: " + ", ".join(names))
+        run_in_process(names, ingest=args.ingest)
+        frames = None
+    else:
+        # One child process per scraper, all started at once
+        print("\nStarting all scrapers in parallel...")
+        run_id = start_run("processes")
+        if run_id is not None:
+            # The scraper processes record their numbers under this run
+            os.environ[RUN_ID_ENV] = str(run_id)
+        statuses, frames = asyncio.run(run_all(names))
+        record_missing_sources(run_id, {get_scraper(name).source: status for name, status in statuses.items()})
+        finish_run(run_id, all(status == "ok" for status in statuses.values()))
+        print("\nScraper results:")
+        for name, status in statuses.items():
+            print(f"  - {name}: {status}")
     
     print("\n" + "="*60)
     print("ALL SCRAPERS COMPLETED")
     print("="*60)
     
     # Combine results into CSV
-    success = combine_to_csv()
+    success = combine_to_csv(frames)
     
     if success:
         print("\n" + "="*60)
         print("✓ ALL DONE!")
         print("="*60)
         print("\nOutput files:")
-        print("  - output/seek/seek_jobs.json")
-        print("  - output/jobsearch/jobsearch_jobs.json")
-        print("  - output/jora/jora_jobs.json")
-        print("  - output/career/career_jobs.json")
+        for scraper_cls in load_scrapers().values():
+            print(f"  - {resolve_output_file(scraper_cls().output_file)}")
         print("  - combined_jobs.csv")
     else:
         print("\n⚠ Warning: CSV generation had issues. Check the logs above.")
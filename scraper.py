@@ -0,0 +1,377 @@
+"""
+Scraper framework.
+
+Every job site is a Scraper subclass with the same three steps:
+
+    listing pages -> parse_listing(html) -> parse_detail(html)
+
+parse_listing returns either detail-page URLs (Seek, Jora) or, for sites
+whose result cards already hold the whole record (CareerOne, JobSearch),
+the job records themselves; those sites leave parse_detail unset.
+
+Subclasses register themselves with @register. A Scheduler runs any number
+of them in one process: the sources run side by side, sharing one pooled
+HTTP fetcher and one detail-page pool (and with it the per-domain limits),
+while the Scheduler owns each source's cache, seen-URL index and output
+writer.
+
+Each scraper module can still be run on its own (python seek.py);
+run_scrapers.py runs them all.
+"""
+
+import importlib
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from cache import HtmlCache
+from drivers import DriverPool, DRIVER_POOL_WARM
+from fetcher import DetailFetchPool, HttpFetcher, fetch_page, DETAIL_WORKERS, DETAIL_PER_DOMAIN, HTTP_FIRST
+from metrics import SourceMetrics, current_run_id, finish_run, record_sources, start_run
+from output import JobWriter, output_path
+from parse_pool import PARSE_WORKERS, ParsePool
+from seen_urls import SeenIndex, STOP_ON_KNOWN_PAGE
+from utils import set_reference_time
+from waits import print_wait_summary
+
+# Modules that define the built-in scrapers; importing them fills SCRAPERS
+SCRAPER_MODULES = ["seek", "jobsearch", "jora", "career"]
+
+# name -> Scraper subclass
+SCRAPERS = {}
+
+
+def register(cls):
+    """Class decorator adding a Scraper subclass to the registry under cls.name"""
+    if not cls.name:
+        raise ValueError(f"{cls.__name__} has no name")
+    SCRAPERS[cls.name] = cls
+    return cls
+
+
+def load_scrapers():
+    """Import the built-in scraper modules and return the registry"""
+    for module in SCRAPER_MODULES:
+        importlib.import_module(module)
+    return SCRAPERS
+
+
+def get_scraper(name):
+    """Return a new instance of the registered scraper `name`"""
+    load_scrapers()
+    try:
+        return SCRAPERS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown scraper '{name}'. Available: {', '.join(sorted(SCRAPERS))}")
+
+
+class Scraper:
+    """
+    Base class for a job site.
+
+    Subclasses set `name` and implement listing_urls() and parse_listing();
+    sites with detail pages also set parse_detail. Sites whose pagination
+    is not a list of URLs (e.g. a Next button) override listing_pages().
+    """
+
+    # Registry key; also names the cache TTL, output folder and log prefix
+    name = None
+    # Value stored in jobs.source (defaults to name)
+    source = None
+
+    # Fragment a usable listing / detail page must contain (see fetcher.is_usable)
+    listing_marker = None
+    detail_marker = None
+    # Element the browser waits for before a page is read
+    listing_selector = None
+    detail_selector = None
+    # Fixed sleeps the waits replaced, for the wait summary
+    listing_baseline = None
+    detail_baseline = None
+
+    # Browser mode for listing pages
+    headless = True
+
+    # parse_detail(html) -> dict or None; None means listing cards are full records
+    parse_detail = None
+
+    def __init__(self):
+        if self.source is None:
+            self.source = self.name
+
+    @property
+    def output_file(self):
+        return output_path(f"output/{self.name}", f"{self.name}_jobs")
+
+    @property
+    def has_details(self):
+        return self.parse_detail is not None
+
+    def listing_urls(self):
+        """Yield the listing page URLs to visit, in order"""
+        raise NotImplementedError
+
+    def parse_listing(self, html, url):
+        """Return detail URLs, or job records when the site has no detail pages"""
+        raise NotImplementedError
+
+    def fetch_listing(self, url, ctx):
+        """Fetch one listing page: cache, then HTTP, then the browser"""
+        def browser():
+            # fetch_page only asks for the browser to load this page in it
+            ctx.page_visited()
+            return ctx.get_driver()
+
+        return fetch_page(url, ctx.http, browser, expect=self.listing_marker,
+                          wait_selector=self.listing_selector, source=self.name,
+                          cache=ctx.cache, baseline=self.listing_baseline)
+
+    def listing_pages(self, ctx):
+        """Yield (url, parse_listing result) for each listing page"""
+        for url in self.listing_urls():
+            print(f"\n[{self.name}] Scraping listing page: {url}")
+            html = self.fetch_listing(url, ctx)
+            ctx.metrics.page(html)
+            yield url, ctx.parse_listing(html, url)
+
+    def detail_options(self):
+        """Page settings for this source's detail pages in the shared pool"""
+        return {
+            "source": self.name,
+            "expect": self.detail_marker,
+            "wait_selector": self.detail_selector,
+            "baseline": self.detail_baseline,
+        }
+
+    def run(self, ctx):
+        """Scrape the site into ctx.writer and return the number of jobs written"""
+        detail_urls = []
+        for url, items in self.listing_pages(ctx):
+            print(f"  [{self.name}] Found {len(items)} jobs")
+            if self.has_details:
+                detail_urls.extend(items)
+                page_urls = items
+            else:
+                ctx.writer.write_many(items)
+                page_urls = [job["url"] for job in items if job.get("url")]
+
+            if STOP_ON_KNOWN_PAGE and ctx.seen.page_fully_known(page_urls):
+                print(f"  [{self.name}] Every job on this page is already known. Stopping pagination.")
+                break
+
+        # Listing pages are done, free the browser before the detail pool needs one
+        ctx.release_driver()
+
+        if self.has_details:
+            print(f"\n[{self.name}] Total job URLs collected: {len(detail_urls)}")
+            new_urls, known_jobs = ctx.seen.split(detail_urls)
+            print(f"  [{self.name}] To fetch: {len(new_urls)}, carried from the last run: {len(known_jobs)}")
+            ctx.writer.write_many(known_jobs)
+
+            def fetched(html):
+                # On the fetch thread: count the page, leave the parsing to the parse pool
+                ctx.metrics.page(html)
+                return html
+
+            pages = ctx.details.fetch_all(new_urls, fetched, cache=ctx.cache, **self.detail_options())
+            for url, job in ctx.parser.parse_stream(self.parse_detail, pages):
+                if job is None:
+                    ctx.metrics.failure()
+                    continue
+                job["url"] = url
+                ctx.writer.write(job)
+
+        return ctx.writer.count
+
+
+class ScrapeContext:
+    """Per-source state handed to Scraper.run() by the Scheduler"""
+
+    def __init__(self, scraper, http, details, drivers, sink=None, parser=None):
+        self.scraper = scraper
+        self.http = http
+        self.details = details
+        self.drivers = drivers
+        # Where pages are parsed; an inline ParsePool when none is shared
+        self.parser = parser or ParsePool(workers=0)
+        # Card-only sites only need the index to stop paginating early.
+        # Loaded before anything is opened: it holds nothing that needs closing
+        if scraper.has_details or STOP_ON_KNOWN_PAGE:
+            self.seen = SeenIndex.load(scraper.source, scraper.output_file)
+        else:
+            self.seen = SeenIndex()
+        self.cache = HtmlCache(scraper.name)
+        # Jobs are written as they are parsed; a crash keeps them in the .part file
+        self.sink = sink
+        try:
+            self.writer = JobWriter(scraper.output_file, on_write=self._feed_sink if sink else None)
+        except Exception:
+            self.cache.close()
+            raise
+        self.metrics = SourceMetrics(scraper.source)
+        self.driver = None
+        self._driver_pages = 0
+
+    def _feed_sink(self, record):
+        """Pass a written job on to the sink; a failing sink is dropped, the scrape carries on"""
+        if self.sink is None:
+            return
+        try:
+            self.sink(self.scraper.source, record)
+        except Exception as e:
+            print(f"[{self.scraper.name}] Live ingest failed, output file only from here on: {e}")
+            self.sink = None
+
+    def parse_listing(self, html, url):
+        """The scraper's parse_listing(html, url), run in the parse pool"""
+        return self.parser.parse(self.scraper.parse_listing, html, url)
+
+    def get_driver(self):
+        """This source's listing browser, borrowed from the driver pool on first use"""
+        if self.driver is None:
+            self.driver = self.drivers.acquire(self.scraper.headless)
+            self._driver_pages = 0
+        return self.driver
+
+    def page_visited(self):
+        """Count a page loaded in the listing browser, towards the pool's DRIVER_MAX_PAGES"""
+        self._driver_pages += 1
+
+    def restart_driver(self):
+        """Give back a broken listing browser (the pool replaces it) and borrow another"""
+        self.release_driver(failed=True)
+        return self.get_driver()
+
+    def release_driver(self, failed=False):
+        if self.driver is not None:
+            self.drivers.release(self.driver, failed=failed, pages=max(1, self._driver_pages))
+            self.driver = None
+
+    def close(self, ok=True):
+        """Release the browser and close the output; a failed scrape keeps its jobs in the .part file"""
+        self.release_driver()
+        if ok:
+            self.writer.finalize()
+        else:
+            self.writer.abort()
+        self.cache.print_stats()
+        self.cache.close()
+
+
+class Scheduler:
+    """
+    Run several scrapers in one process.
+
+    Each source gets a thread for its listing pages; detail pages from every
+    source go through one shared DetailFetchPool, so DETAIL_WORKERS and
+    DETAIL_PER_DOMAIN bound the whole run rather than each source. Browsers
+    come from one warm DriverPool with room for every detail worker plus
+    one listing browser per source. Pages are parsed in one ParsePool of
+    parse_workers processes.
+    """
+
+    def __init__(self, scrapers, workers=DETAIL_WORKERS, per_domain=DETAIL_PER_DOMAIN,
+                 http_first=HTTP_FIRST, warm_drivers=DRIVER_POOL_WARM, sink=None,
+                 parse_workers=PARSE_WORKERS):
+        self.scrapers = list(scrapers)
+        self.parse_workers = parse_workers
+        # sink(source, record) receives every job as it is written, e.g. BackgroundIngest.submit
+        self.sink = sink
+        self.workers = workers
+        self.per_domain = per_domain
+        self.http_first = http_first
+        self.warm_drivers = warm_drivers
+        # SourceMetrics of every source run, for metrics.record_sources
+        self.metrics = []
+
+    def _run_one(self, scraper, http, details, drivers, parser):
+        start = time.time()
+        ctx = None
+        ok = False
+        try:
+            # Opening the cache, output file or seen index can fail too: that fails this source only
+            ctx = ScrapeContext(scraper, http, details, drivers, self.sink, parser)
+            self.metrics.append(ctx.metrics)
+            count = scraper.run(ctx)
+            ok = True
+            return True, count
+        except Exception:
+            print(f"[{scraper.name}] Failed:")
+            traceback.print_exc()
+            return False, ctx.writer.count if ctx else 0
+        finally:
+            if ctx is None:
+                metrics = SourceMetrics(scraper.source)
+                metrics.finish(False, 0)
+                self.metrics.append(metrics)
+            else:
+                ctx.close(ok)
+                ctx.metrics.finish(ok, ctx.writer.count)
+                saved_to = scraper.output_file if ok else ctx.writer.part_path
+                print(f"[{scraper.name}] Saved {ctx.writer.count} jobs to {saved_to} "
+                      f"in {time.time() - start:.1f}s")
+            print_wait_summary(scraper.name)
+
+    def run(self):
+        """Run every scraper; returns {name: (succeeded, jobs_written)}"""
+        results = {}
+        if not self.scrapers:
+            return results
+
+        # "Posted 2d ago" counts back from the start of the run, not from when the page was parsed
+        set_reference_time()
+        http = HttpFetcher(pool_size=self.workers + len(self.scrapers)) if self.http_first else None
+        drivers = DriverPool(size=self.workers + len(self.scrapers))
+        if self.warm_drivers:
+            # Browsers start in the background while the first pages come over HTTP
+            drivers.warm(self.warm_drivers)
+        try:
+            with DetailFetchPool(workers=self.workers, per_domain=self.per_domain,
+                                 http_first=self.http_first, http=http, drivers=drivers) as details, \
+                    ParsePool(workers=self.parse_workers) as parser:
+                with ThreadPoolExecutor(max_workers=len(self.scrapers),
+                                        thread_name_prefix="source") as executor:
+                    futures = {
+                        scraper.name: executor.submit(self._run_one, scraper, http, details, drivers, parser)
+                        for scraper in self.scrapers
+                    }
+                    for name, future in futures.items():
+                        results[name] = future.result()
+        finally:
+            drivers.print_stats()
+            drivers.close()
+            if http is not None:
+                http.close()
+        return results
+
+
+def run_in_process(names=None, ingest=False):
+    """
+    Run the named scrapers (default: all) with one Scheduler; returns True if all succeeded.
+    With ingest=True every job is also written to the database while the scrape runs.
+    """
+    load_scrapers()
+    scrapers = [get_scraper(name) for name in (names or SCRAPERS)]
+    # Part of the run opened by run_scrapers.py, or a run of its own
+    run_id = current_run_id()
+    own_run = run_id is None
+    if own_run:
+        run_id = start_run("in-process")
+    if ingest:
+        # Imported here: plain scraping must not need a database
+        from ingest_jobs import BackgroundIngest
+        with BackgroundIngest(run_id=run_id) as live_ingest:
+            scheduler = Scheduler(scrapers, sink=live_ingest.submit)
+            results = scheduler.run()
+            # Before the ingest adds its counts to the same rows
+            record_sources(run_id, scheduler.metrics)
+    else:
+        scheduler = Scheduler(scrapers)
+        results = scheduler.run()
+        record_sources(run_id, scheduler.metrics)
+    for name, (ok, count) in results.items():
+        print(f"[{name}] {'OK' if ok else 'FAILED'}: {count} jobs")
+    succeeded = all(ok for ok, _ in results.values())
+    if own_run:
+        finish_run(run_id, succeeded)
+    return succeeded
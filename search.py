@@ -0,0 +1,86 @@
+"""
+Ranked keyword search over jobs.
+
+Matches the query against job title, company and description through the
+full-text index set up by database.setup_full_text_search (a tsvector column
+with a GIN index on PostgreSQL, an FTS5 table on SQLite) instead of scanning
+every description with ILIKE. Title matches rank above company matches,
+which rank above description matches.
+
+Usage:
+    from database import SessionLocal
+    from search import search_jobs
+
+    db = SessionLocal()
+    for job, score in search_jobs(db, "data engineer python", state="NSW", min_salary=120000):
+        print(score, job.job_title, job.company_name)
+"""
+
+import re
+
+from sqlalchemy import column, func, literal_column, select, table
+
+from database import Job
+from queries import apply_filters
+
+# FTS5 column weights for bm25(): job_title, company_name, job_description
+SQLITE_WEIGHTS = (10.0, 5.0, 1.0)
+
+TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+jobs_fts = table("jobs_fts", column("rowid"))
+
+
+def fts5_query(query):
+    """
+    Turn free text into a safe FTS5 query: every word must match, each one
+    quoted so punctuation and FTS5 operators in user input are taken literally.
+    """
+    return " ".join(f'"{term}"' for term in TERM_RE.findall(query))
+
+
+def search_query(dialect_name, query, state=None, work_type=None, min_salary=None, max_salary=None,
+                 limit=20, offset=0):
+    """
+    SELECT of (Job, score) for `query`, best match first, or None when the
+    query has no searchable words.
+    """
+    if dialect_name == "postgresql":
+        tsquery = func.websearch_to_tsquery("english", query)
+        vector = literal_column("jobs.search_vector")
+        score = func.ts_rank_cd(vector, tsquery).label("score")
+        stmt = select(Job, score).where(vector.op("@@")(tsquery)).order_by(score.desc(), Job.id)
+    elif dialect_name == "sqlite":
+        match = fts5_query(query)
+        if not match:
+            return None
+        # bm25() is lower-is-better; negate it so a higher score is always better
+        score = (-func.bm25(literal_column("jobs_fts"), *SQLITE_WEIGHTS)).label("score")
+        stmt = (
+            select(Job, score)
+            .join(jobs_fts, jobs_fts.c.rowid == Job.id)
+            .where(literal_column("jobs_fts").op("MATCH")(match))
+            .order_by(score.desc(), Job.id)
+        )
+    else:
+        raise NotImplementedError(f"No full-text search for {dialect_name}")
+
+    stmt = apply_filters(stmt, state=state, work_type=work_type, min_salary=min_salary, max_salary=max_salary)
+    return stmt.limit(limit).offset(offset)
+
+
+def search_jobs(db, query, state=None, work_type=None, min_salary=None, max_salary=None,
+                limit=20, offset=0):
+    """
+    Ranked full-text search. Returns a list of (Job, score) pairs, best first.
+
+    state       exact state code, e.g. "NSW"
+    work_type   e.g. "Full time" (case-insensitive)
+    min_salary  the job's advertised range reaches at least this
+    max_salary  the job's advertised range starts at or below this
+    """
+    stmt = search_query(db.get_bind().dialect.name, query, state, work_type,
+                        min_salary, max_salary, limit, offset)
+    if stmt is None:
+        return []
+    return [(job, score) for job, score in db.execute(stmt).all()]
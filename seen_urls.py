@@ -0,0 +1,180 @@
+"""
+Seen-URL index for incremental scraping.
+
+Before visiting detail pages, the scrapers check the collected listing URLs
+against the jobs already known for their source, so only new postings are
+fetched. Known URLs come from the `jobs` table when DIRECT_DATABASE_URL is
+set (in the environment or .env), and from the previous run's output JSON.
+
+Known jobs that are still listed are carried forward instead of fetched, so
+the output file (and the next run's index) stays complete: from the previous
+output JSON, or, for URLs only the database knows, from their stored rows,
+which are loaded for just the listed URLs.
+"""
+
+import os
+from urllib.parse import urlsplit
+
+from output import iter_records
+
+# INCREMENTAL=0 forces a full re-scrape of every detail page
+INCREMENTAL = os.getenv("INCREMENTAL", "1") != "0"
+# STOP_ON_KNOWN_PAGE=1 stops paginating at the first listing page with no new jobs
+STOP_ON_KNOWN_PAGE = os.getenv("STOP_ON_KNOWN_PAGE", "0") == "1"
+
+
+def job_key(url):
+    """
+    Identity of a job posting: host + path.
+    Listing links carry per-search tracking params (tk=, sol=, ref=...) that
+    change every run, so the query string and fragment are ignored.
+    """
+    parts = urlsplit(url)
+    return f"{parts.netloc.lower()}{parts.path.rstrip('/')}"
+
+
+# Job columns that are not part of a scraped record
+NON_RECORD_COLUMNS = {"id", "source", "content_hash", "created_at", "last_seen_at", "expired_at"}
+# URLs per query when loading stored records
+DB_LOAD_CHUNK = 500
+
+
+def _database_configured():
+    try:
+        from database import get_database_url
+        get_database_url()
+        return True
+    except Exception:
+        return False
+
+
+def _load_from_db(source):
+    """Return the set of known URLs for `source`, or None if the DB is unavailable"""
+    try:
+        from database import SessionLocal, Job
+    except Exception as e:
+        print(f"  Seen-URL index: database unavailable ({e})")
+        return None
+
+    db = SessionLocal()
+    try:
+        return {url for (url,) in db.query(Job.url).filter(Job.source == source) if url}
+    except Exception as e:
+        print(f"  Seen-URL index: database query failed ({e})")
+        return None
+    finally:
+        db.close()
+
+
+def _load_records_from_db(source, urls):
+    """Return {url: record} for the stored jobs at `urls`, shaped like a scraped record"""
+    if not urls:
+        return {}
+    try:
+        from database import SessionLocal, Job
+    except Exception as e:
+        print(f"  Seen-URL index: database unavailable ({e})")
+        return {}
+
+    columns = [c for c in Job.__table__.columns if c.name not in NON_RECORD_COLUMNS]
+    records = {}
+    db = SessionLocal()
+    try:
+        for start in range(0, len(urls), DB_LOAD_CHUNK):
+            rows = db.query(*columns).filter(Job.source == source, Job.url.in_(urls[start:start + DB_LOAD_CHUNK]))
+            for row in rows:
+                record = dict(row._mapping)
+                if record.get("posted_date") is not None:
+                    record["posted_date"] = record["posted_date"].isoformat()
+                records[record["url"]] = record
+    except Exception as e:
+        print(f"  Seen-URL index: could not load stored jobs ({e})")
+    finally:
+        db.close()
+    return records
+
+
+def _load_from_output(output_file):
+    """Return {url: record} from a previous output file (.json or .jsonl)"""
+    try:
+        return {job["url"]: job for job in iter_records(output_file) if job.get("url")}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"  Seen-URL index: could not read {output_file} ({e})")
+        return {}
+
+
+class SeenIndex:
+    """Known job URLs for one source, keyed by job_key()"""
+
+    def __init__(self, records=None, source=None, db_urls=None):
+        # job_key -> previous record (or None when only the database knows the URL)
+        self.records = records or {}
+        self.source = source
+        # job_key -> URL as stored in the database, for loading its record
+        self.db_urls = db_urls or {}
+
+    @classmethod
+    def load(cls, source, output_file):
+        """Build the index from the DB and/or the previous output file"""
+        if not INCREMENTAL:
+            return cls()
+
+        records = {}
+        for url, job in _load_from_output(output_file).items():
+            records[job_key(url)] = job
+
+        db_urls = _load_from_db(source) if _database_configured() else None
+        stored = {}
+        for url in db_urls or ():
+            key = job_key(url)
+            if records.setdefault(key, None) is None:
+                stored[key] = url
+
+        origin = "database + previous output" if db_urls is not None else "previous output"
+        print(f"  Seen-URL index: {len(records)} known {source} jobs ({origin})")
+        return cls(records, source, stored)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, url):
+        return job_key(url) in self.records
+
+    def page_fully_known(self, urls):
+        """True if a listing page had results and every one of them is already known"""
+        return bool(urls) and all(url in self for url in urls)
+
+    def split(self, urls):
+        """
+        Split listing URLs into (urls_to_fetch, carried_records).
+        carried_records are previous records for known URLs; they keep their
+        original URL so ingest keeps matching the existing row. Records of
+        URLs only the database knows are loaded from it; if that fails they
+        are fetched, so the output never loses them.
+        """
+        new_urls = []
+        carried = []
+        from_db = []
+        seen_keys = set()
+        for url in urls:
+            key = job_key(url)
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+
+            if self.records.get(key) is not None:
+                carried.append(self.records[key])
+            elif key in self.db_urls:
+                from_db.append((url, self.db_urls[key]))
+            else:
+                new_urls.append(url)
+
+        stored = _load_records_from_db(self.source, [db_url for _, db_url in from_db])
+        for url, db_url in from_db:
+            if db_url in stored:
+                carried.append(stored[db_url])
+            else:
+                new_urls.append(url)
+        return new_urls, carried
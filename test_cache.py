@@ -0,0 +1,72 @@
+import os
+
+from cache import HtmlCache, normalize_url
+
+
+def test_normalize_url():
+    assert normalize_url("HTTPS://WWW.Seek.com.au/job/123?type=promoted&ref=search#sol=abc") == \
+        "https://www.seek.com.au/job/123"
+    assert normalize_url("https://au.jora.com/j?q=&l=&p=2&sp=homepage") == \
+        normalize_url("https://au.jora.com/j?p=2&l=&q=")
+    assert normalize_url("https://x.com/jobs?page=2") != normalize_url("https://x.com/jobs?page=3")
+
+
+def test_get_put_and_ttl(tmp_path):
+    cache = HtmlCache("seek", cache_dir=str(tmp_path), enabled=True)
+    url = "https://www.seek.com.au/job/1?ref=a"
+    assert cache.get(url) is None
+    cache.put(url, "<html>job one</html>")
+    assert cache.get("https://www.seek.com.au/job/1?ref=b") == "<html>job one</html>"
+    assert cache.stats["hits"] == 1 and cache.stats["misses"] == 1
+
+    expired = HtmlCache("seek", ttl=-1, cache_dir=str(tmp_path), enabled=True)
+    assert expired.get(url) is None
+    cache.close()
+    expired.close()
+
+
+def test_lru_eviction(tmp_path):
+    page = "<p>" + os.urandom(2000).hex() + "</p>"
+    cache = HtmlCache("jora", cache_dir=str(tmp_path), max_bytes=5000, enabled=True)
+    cache.put("https://a.com/1", page)
+    cache.put("https://a.com/2", page)
+    cache.get("https://a.com/1")  # 1 is now more recent than 2
+    cache.put("https://a.com/3", page)
+
+    assert cache.stats["evictions"] >= 1
+    assert cache.get("https://a.com/2") is None
+    assert cache.get("https://a.com/3") == page
+    cache.close()
+
+
+def test_locked_cache_is_retried_then_disabled(tmp_path, monkeypatch):
+    import sqlite3
+    import cache as cache_module
+
+    # Another process holds an exclusive lock on a cache file not yet in WAL mode
+    lock = sqlite3.connect(str(tmp_path / "html_cache.sqlite3"), isolation_level=None)
+    lock.execute("CREATE TABLE other (x)")
+    lock.execute("BEGIN EXCLUSIVE")
+    monkeypatch.setattr(cache_module, "OPEN_BACKOFF", 0.01)
+    connect = sqlite3.connect
+    monkeypatch.setattr(cache_module.sqlite3, "connect",
+                        lambda *args, **kwargs: connect(*args, **{**kwargs, "timeout": 0.01}))
+
+    cache = HtmlCache("jora", cache_dir=str(tmp_path), enabled=True)
+    assert cache.enabled is False
+    assert cache.get("https://a.com/1") is None
+    cache.put("https://a.com/1", "<p>page</p>")
+    lock.rollback()
+    lock.close()
+
+    cache = HtmlCache("jora", cache_dir=str(tmp_path), enabled=True)
+    assert cache.enabled
+    cache.close()
+    # Already in WAL mode: another open does not switch the journal mode again
+    lock = sqlite3.connect(str(tmp_path / "html_cache.sqlite3"), isolation_level=None)
+    lock.execute("BEGIN EXCLUSIVE")
+    reopened = HtmlCache("jora", cache_dir=str(tmp_path), enabled=True)
+    assert reopened.enabled
+    reopened.close()
+    lock.rollback()
+    lock.close()
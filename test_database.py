@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+
+import database
+from database import Job, SessionLocal, configure, init_db
+
+
+def test_models_import_without_database_url(tmp_path):
+    env = {key: value for key, value in os.environ.items() if key != "DIRECT_DATABASE_URL"}
+    env["PYTHONPATH"] = os.path.dirname(os.path.abspath(__file__))
+    # Run from an empty directory so no .env is picked up
+    result = subprocess.run([sys.executable, "-c", "import database; print(database.Job.__tablename__)"],
+                            cwd=tmp_path, env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "jobs"
+
+
+def test_configure_in_memory_sqlite():
+    try:
+        engine = configure("sqlite://")
+        assert database.engine is engine
+        init_db()
+
+        # Every session shares the one in-memory database
+        db = SessionLocal()
+        db.add(Job(url="https://x/1"))
+        db.commit()
+        db.close()
+        assert SessionLocal().query(Job).count() == 1
+    finally:
+        database._engine = database._sessionmaker = None
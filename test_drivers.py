@@ -0,0 +1,84 @@
+import threading
+import time
+
+from drivers import DriverPool
+
+
+class FakeDriver:
+    """Stands in for a seleniumbase Driver"""
+
+    def __init__(self, headless):
+        self.headless = headless
+        self.alive = True
+        self.quit_called = False
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise RuntimeError("session deleted")
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_reuse_recycle_and_health_checks():
+    pool = DriverPool(size=2, max_pages=2, factory=FakeDriver)
+
+    with pool.lease() as first:
+        pass
+    with pool.lease() as driver:
+        assert driver is first
+    # Two pages served: replaced on return
+    assert first.quit_called
+    with pool.lease() as second:
+        assert second is not first
+
+    # A driver that died while idle is swapped for a fresh one
+    second.alive = False
+    with pool.lease() as third:
+        assert third is not second
+
+    # A failure while leased retires the driver
+    try:
+        with pool.lease() as broken:
+            raise RuntimeError("crashed")
+    except RuntimeError:
+        pass
+    assert broken is third and broken.quit_called
+
+    with pool.lease() as fourth:
+        assert fourth is not third
+    pool.close()
+    assert fourth.quit_called
+    assert pool.stats["started"] == 4
+    assert pool.stats["unhealthy"] == 1
+    assert pool.stats["recycled"] == 2
+
+
+def test_size_cap_and_warm_up():
+    pool = DriverPool(size=1, factory=FakeDriver)
+    pool.warm(3)
+    deadline = time.time() + 5
+    while not pool._idle and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(pool._idle) == 1
+
+    held = pool.acquire()
+    assert pool.stats["started"] == 1 and pool.stats["reused"] == 1
+
+    # The pool is full: a second borrower waits for the first to return
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(pool.acquire()))
+    waiter.start()
+    time.sleep(0.1)
+    assert got == []
+    pool.release(held)
+    waiter.join(timeout=5)
+    assert got == [held]
+
+    # A headed request takes over the idle headless slot
+    pool.release(held)
+    headed = pool.acquire(headless=False)
+    assert headed.headless is False and held.quit_called
+    pool.release(headed)
+    pool.close()
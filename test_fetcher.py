@@ -0,0 +1,123 @@
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from fetcher import HttpFetcher, DetailFetchPool, looks_like_challenge, looks_like_shell
+
+PAD = "<p>" + "lorem ipsum " * 60 + "</p>"
+
+PAGES = {
+    "/job/1": (200, f'<html><body><h1>Data Engineer</h1><div data-automation="jobAdDetails">Build pipes</div>{PAD}</body></html>'),
+    "/job/2": (200, f'<html><body><h1>Nurse</h1><div data-automation="jobAdDetails">Care</div>{PAD}</body></html>'),
+    "/challenge": (200, f'<html><head><title>Just a moment...</title></head><body><div id="cf-challenge"></div>{PAD}</body></html>'),
+    "/shell": (200, f'<html><body><div id="root"></div><script src="/app.js"></script>{PAD}</body></html>'),
+    "/blocked": (403, f"<html><body>Forbidden{PAD}</body></html>"),
+}
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves canned pages in place of the real job sites"""
+
+    def do_GET(self):
+        status, body = PAGES.get(self.path, (404, "not found"))
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_detection():
+    assert looks_like_challenge(PAGES["/challenge"][1])
+    assert not looks_like_challenge(PAGES["/job/1"][1])
+    assert looks_like_shell(PAGES["/shell"][1], expect="jobAdDetails")
+    assert looks_like_shell("<html></html>")
+    assert not looks_like_shell(PAGES["/job/1"][1], expect="jobAdDetails")
+
+
+def test_http_fetcher():
+    server, base = start_server()
+    http = HttpFetcher(pool_size=2)
+    try:
+        assert "Data Engineer" in http.fetch(f"{base}/job/1", expect="jobAdDetails")
+        assert http.fetch(f"{base}/challenge", expect="jobAdDetails") is None
+        assert http.fetch(f"{base}/shell", expect="jobAdDetails") is None
+        assert http.fetch(f"{base}/blocked") is None
+        assert http.fetch(f"{base}/missing") is None
+        assert http.stats == {"ok": 1, "fallback": 4}
+    finally:
+        http.close()
+        server.shutdown()
+
+
+def test_pool_serves_static_pages_without_browser():
+    server, base = start_server()
+    urls = [f"{base}/job/1", f"{base}/job/2"]
+    try:
+        with DetailFetchPool(workers=2, per_domain=2, expect="jobAdDetails") as pool:
+            results = dict(pool.fetch_all(urls, lambda html: "jobAdDetails" in html))
+            assert results == {urls[0]: True, urls[1]: True}
+            assert pool.drivers.stats["started"] == 0
+    finally:
+        server.shutdown()
+
+
+def test_pool_renders_in_browsers_and_reports_failed_pages():
+    from drivers import DriverPool
+
+    browsers = []
+    active = {}
+    peak = {}
+    lock = threading.Lock()
+
+    class FakeBrowser:
+        """Renders pages from a dict; /broken raises like a crashed tab"""
+
+        def __init__(self, headless):
+            self.url = None
+            self.quit_called = False
+            browsers.append(self)
+
+        def get(self, url):
+            domain = url.split("/")[2]
+            with lock:
+                active[domain] = active.get(domain, 0) + 1
+                peak[domain] = max(peak.get(domain, 0), active[domain])
+            time.sleep(0.05)
+            with lock:
+                active[domain] -= 1
+            self.url = url
+            if url.endswith("/broken"):
+                raise RuntimeError("tab crashed")
+
+        def execute_script(self, script):
+            if script == "return 1":
+                return 1
+            return f"<html><body>{self.url}</body></html>"
+
+        def quit(self):
+            self.quit_called = True
+
+    drivers = DriverPool(size=4, factory=FakeBrowser)
+    urls = [f"https://www.seek.com.au/job/{n}" for n in range(4)] + \
+        [f"https://au.jora.com/job/{n}" for n in range(2)] + ["https://au.jora.com/broken"]
+    with DetailFetchPool(workers=4, per_domain=2, http_first=False, drivers=drivers) as pool:
+        results = dict(pool.fetch_all(urls, lambda html: html.split("<body>")[1].split("<")[0]))
+    drivers.close()
+
+    # Every page is reported, a failing one as None, and no domain saw more than per_domain at once
+    assert results == {**{url: url for url in urls[:-1]}, "https://au.jora.com/broken": None}
+    assert max(peak.values()) <= 2
+    # The browser that failed is retired, the others went back to the pool
+    assert [browser.quit_called for browser in browsers if (browser.url or "").endswith("/broken")] == [True]
+    assert drivers.stats["reused"] > 0
@@ -0,0 +1,226 @@
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, Job, add_missing_columns
+from ingest_jobs import prepare_job, upsert_jobs
+from normalize import normalize_job
+
+
+def make_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+
+def job(url, title, **extra):
+    return {"url": url, "job_title": title, "source": "seek", "posted_date": "2025-01-31",
+            "min_annual_salary": "90000", **extra}
+
+
+def test_bulk_upsert_counts_and_values():
+    db = make_session()
+    rows = [prepare_job(job(f"https://x/{n}", f"Job {n}")) for n in range(7)]
+    assert upsert_jobs(db, rows, batch_size=3) == (7, 0, 0)
+    db.commit()
+
+    again = [prepare_job(job("https://x/1", "Renamed", is_remote=True)),
+             prepare_job(job("https://x/new", "New")),
+             prepare_job({"job_title": "no url"})]
+    assert upsert_jobs(db, again, batch_size=3) == (1, 1, 0)
+    db.commit()
+
+    assert db.query(Job).count() == 8
+    renamed = db.query(Job).filter(Job.url == "https://x/1").one()
+    assert renamed.job_title == "Renamed" and renamed.is_remote
+    assert renamed.min_annual_salary == 90000.0
+    assert str(renamed.posted_date) == "2025-01-31"
+    assert renamed.created_at is not None
+
+
+def test_duplicate_urls_in_one_batch():
+    db = make_session()
+    rows = [prepare_job(job("https://x/1", "First")), prepare_job(job("https://x/1", "Second"))]
+    assert upsert_jobs(db, rows) == (1, 0, 0)
+    db.commit()
+    assert db.query(Job).one().job_title == "First"
+
+
+def test_streaming_ingest_chunks(tmp_path, monkeypatch):
+    import ingest_jobs
+    from output import JobWriter
+
+    seek_file, jora_file = str(tmp_path / "seek.jsonl"), str(tmp_path / "jora.json")
+    with JobWriter(seek_file) as writer:
+        writer.write_many(job(f"https://x/{n}", f"Job {n}") for n in range(5))
+        writer.write(job("https://x/bad", "Bad", min_annual_salary="n/a"))
+    with JobWriter(jora_file) as writer:
+        writer.write(job("https://x/0", "Same job on jora"))
+        writer.write(job("https://x/jora", "Jora only"))
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    files = [("seek", seek_file), ("jora", jora_file)]
+
+    totals = ingest_jobs.ingest_stream(files, chunk_size=2, session_factory=Session)
+    assert totals == {"processed": 6, "inserted": 6, "updated": 0, "unchanged": 0, "failed": 0}
+    db = Session()
+    assert db.query(Job).filter(Job.url == "https://x/0").one().source == "seek"
+
+    # A failing chunk is rolled back alone; the others still commit
+    real_upsert = ingest_jobs.upsert_jobs
+    calls = []
+
+    def flaky_upsert(db, rows, **kwargs):
+        calls.append(1)
+        if len(calls) == 2:
+            raise RuntimeError("boom")
+        return real_upsert(db, rows, **kwargs)
+
+    monkeypatch.setattr(ingest_jobs, "upsert_jobs", flaky_upsert)
+    totals = ingest_jobs.ingest_stream(files, chunk_size=2, session_factory=Session)
+    assert totals == {"processed": 4, "inserted": 0, "updated": 0, "unchanged": 4, "failed": 2}
+
+
+def test_batch_and_streaming_ingest_pick_the_same_duplicate(tmp_path):
+    import ingest_jobs
+    from output import JobWriter
+
+    seek_file, jora_file = str(tmp_path / "seek.json"), str(tmp_path / "jora.json")
+    with JobWriter(seek_file) as writer:
+        writer.write(job("https://x/0", "Listed on seek"))
+    with JobWriter(jora_file) as writer:
+        writer.write(job("https://x/0", "Listed on jora"))
+    files = [("seek", seek_file), ("jora", jora_file)]
+
+    stored = []
+    for ingest in (ingest_jobs.ingest_data, ingest_jobs.ingest_stream):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine)
+        ingest(files=files, session_factory=Session)
+        row = Session().query(Job).one()
+        stored.append((row.source, row.job_title))
+    assert stored == [("seek", "Listed on seek")] * 2
+
+
+def test_unchanged_jobs_are_only_touched():
+    db = make_session()
+    upsert_jobs(db, [prepare_job(job("https://x/1", "Dev", job_description="Build  things\n"))])
+    db.commit()
+    first_seen = db.query(Job).one().last_seen_at
+
+    # Whitespace-only differences do not count as a change
+    same = prepare_job(job("https://x/1", " Dev ", job_description="Build things"))
+    assert upsert_jobs(db, [same]) == (0, 0, 1)
+    db.commit()
+    stored = db.query(Job).one()
+    assert stored.job_description == "Build  things\n"
+    assert stored.last_seen_at >= first_seen
+
+    changed = prepare_job(job("https://x/1", "Dev", job_description="Build other things"))
+    assert upsert_jobs(db, [changed]) == (0, 1, 0)
+    db.commit()
+    db.expire_all()
+    assert db.query(Job).one().job_description == "Build other things"
+
+
+def test_open_ended_posted_date_is_not_a_change():
+    db = make_session()
+    upsert_jobs(db, [prepare_job(job("https://x/1", "Dev", posted_date_open_ended=True))])
+    db.commit()
+
+    # "30+ days ago" read a day later
+    next_run = prepare_job(job("https://x/1", "Dev", posted_date="2025-02-01", posted_date_open_ended=True))
+    assert upsert_jobs(db, [next_run]) == (0, 0, 1)
+    dated = prepare_job(job("https://x/1", "Dev", posted_date="2025-02-01"))
+    assert upsert_jobs(db, [dated]) == (0, 1, 0)
+
+
+def test_add_missing_columns():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE jobs (id INTEGER PRIMARY KEY, url VARCHAR UNIQUE)"))
+    with engine.begin() as conn:
+        add_missing_columns(conn)
+    columns = {column["name"] for column in inspect(engine).get_columns("jobs")}
+    assert {"content_hash", "last_seen_at", "job_description", "seniority", "suburb"} <= columns
+
+
+def test_suburb_is_stored():
+    db = make_session()
+    record = normalize_job(job("https://x/1", "Dev", location="Toowong, Brisbane QLD"))
+    upsert_jobs(db, [prepare_job(record)])
+    db.commit()
+    stored = db.query(Job).one()
+    assert (stored.suburb, stored.city, stored.state) == ("Toowong", "Brisbane", "QLD")
+
+
+def test_seniority_is_stored_and_hashed():
+    db = make_session()
+    upsert_jobs(db, [prepare_job(job("https://x/1", "Senior Dev", seniority="Senior"))])
+    db.commit()
+    assert db.query(Job).one().seniority == "Senior"
+
+    # A new classification is a change worth writing
+    assert upsert_jobs(db, [prepare_job(job("https://x/1", "Senior Dev", seniority="Lead"))]) == (0, 1, 0)
+    db.commit()
+    db.expire_all()
+    assert db.query(Job).one().seniority == "Lead"
+
+
+def test_async_ingest_files_and_live_records(tmp_path):
+    import asyncio
+    from database import create_async_db_engine, get_async_sessionmaker, init_db_async
+    from ingest_jobs import BackgroundIngest, ingest_files_async
+    from output import JobWriter
+
+    seek_file = str(tmp_path / "seek.json")
+    with JobWriter(seek_file) as writer:
+        writer.write_many(job(f"https://x/{n}", f"Job {n}") for n in range(5))
+
+    url = f"sqlite:///{tmp_path / 'jobs.db'}"
+
+    async def from_files():
+        async_engine = create_async_db_engine(url)
+        await init_db_async(async_engine)
+        totals = await ingest_files_async([("seek", seek_file)], chunk_size=2,
+                                          session_factory=get_async_sessionmaker(async_engine))
+        await async_engine.dispose()
+        return totals
+
+    assert asyncio.run(from_files())["inserted"] == 5
+
+    # Records handed over one at a time from scraper threads
+    async_engine = create_async_db_engine(url)
+    with BackgroundIngest(chunk_size=2, session_factory=get_async_sessionmaker(async_engine)) as ingest:
+        ingest.submit("jora", job("https://x/1", "Job 1"))
+        ingest.submit("jora", job("https://x/new", "New"))
+        ingest.submit("jora", job("https://x/new", "New"))
+    assert ingest.totals == {"processed": 2, "inserted": 1, "updated": 1, "unchanged": 0, "failed": 0}
+
+    db = sessionmaker(bind=create_engine(url))()
+    assert db.query(Job).count() == 6
+    assert db.query(Job).filter(Job.url == "https://x/1").one().source == "jora"
+
+
+def test_copy_stream_csv_and_fallback():
+    import csv
+    import io
+
+    from ingest_jobs import COPY_COLUMNS, COPY_NULL, CopyStream, copy_upsert_jobs
+
+    rows = [prepare_job(job(f"https://x/{n}", f'Title, "{n}"\nline two')) for n in range(5)]
+    rows[0]["city"] = None
+    stream = CopyStream(rows, rows_per_read=2)
+    # Small reads, like the driver's, must still add up to the whole CSV
+    data = "".join(iter(lambda: stream.read(7), ""))
+    assert stream.count == 5
+    parsed = list(csv.reader(io.StringIO(data)))
+    assert len(parsed) == 5 and len(parsed[0]) == len(COPY_COLUMNS)
+    assert parsed[0][COPY_COLUMNS.index("city")] == COPY_NULL
+    assert parsed[3][COPY_COLUMNS.index("job_title")] == 'Title, "3"\nline two'
+
+    # Not PostgreSQL: batched inserts instead
+    db = make_session()
+    assert copy_upsert_jobs(db, rows) == (5, 0, 0)
@@ -0,0 +1,40 @@
+from locations import load_gazetteer, resolve_location
+from utils import parse_location
+
+
+def test_resolves_suburbs_cities_and_states():
+    cases = {
+        "Toowong, Brisbane QLD(Hybrid)": ("Toowong", "Brisbane", "QLD"),
+        "West End, Brisbane QLD": ("West End", "Brisbane", "QLD"),
+        "Naracoorte,": (None, "Naracoorte", "SA"),
+        "Clare SA 5453": (None, "Clare", "SA"),
+        "Sydney CBD NSW": (None, "Sydney", "NSW"),
+        "Parramatta NSW 2150": ("Parramatta", "Sydney", "NSW"),
+        "Perth TAS": (None, "Perth", "TAS"),
+        "Western Australia": (None, None, "WA"),
+        '"Australia NSW"': (None, None, "NSW"),
+        # In several states and nothing to tell them apart
+        "Belmont,": (None, "Belmont", None),
+        "Unknown Place QLD": (None, "Unknown Place", "QLD"),
+    }
+    for text, expected in cases.items():
+        location = resolve_location(text)
+        assert (location.suburb, location.city, location.state) == expected, text
+
+
+def test_remote_and_hybrid_flags():
+    assert resolve_location("Brisbane QLD(Remote)").is_remote
+    assert not resolve_location("Brisbane QLD(Remote)").is_hybrid
+    assert resolve_location("Milton, Brisbane QLD(Hybrid)").is_hybrid
+    assert resolve_location("Sydney NSW, Work from home").is_remote
+    assert not resolve_location("Remote Hill QLD").is_remote
+    assert parse_location(None) == {"suburb": None, "city": None, "state": None, "country": "Australia",
+                                    "is_remote": False, "is_hybrid": False}
+
+
+def test_custom_gazetteer(tmp_path):
+    path = tmp_path / "places.csv"
+    path.write_text("name,state,city\nSmallville,SA,\nNorth Smallville,SA,Smallville\n")
+    places = load_gazetteer(str(path))
+    assert places["smallville"][0].city == "Smallville"
+    assert places["north smallville"][0].city == "Smallville"
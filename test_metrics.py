@@ -0,0 +1,69 @@
+import os
+import subprocess
+import sys
+from datetime import timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, ScrapeRun, ScrapeRunSource
+from metrics import (SourceMetrics, daily_throughput, finish_run, record_ingest,
+                     record_missing_sources, record_sources, start_run)
+
+
+def make_sessionmaker():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+def test_run_metrics_and_report():
+    Session = make_sessionmaker()
+    run_id = start_run("processes", Session)
+
+    seek = SourceMetrics("seek")
+    seek.page("<html>é</html>")
+    seek.page(None)
+    seek.failure()
+    seek.finish(True, 30)
+    seek.started_at = seek.finished_at - timedelta(minutes=10)
+    record_sources(run_id, [seek], Session)
+    record_missing_sources(run_id, {"seek": "ok", "jora": "timeout"}, Session)
+    record_ingest({"seek": {"inserted": 20, "updated": 5, "unchanged": 5}}, run_id, Session)
+    finish_run(run_id, False, Session)
+
+    db = Session()
+    assert db.get(ScrapeRun, run_id).status == "failed"
+    rows = {row.source: row for row in db.query(ScrapeRunSource)}
+    assert rows["jora"].status == "timeout"
+    seek_row = rows["seek"]
+    assert (seek_row.pages, seek_row.jobs, seek_row.parse_failures, seek_row.bytes_fetched) == (2, 30, 1, 15)
+    assert (seek_row.inserted, seek_row.updated, seek_row.unchanged) == (20, 5, 5)
+
+    report = {row["source"]: row for row in daily_throughput(db)}
+    assert round(report["seek"]["jobs_per_minute"]) == 3
+    assert report["jora"]["jobs"] == 0
+
+
+def test_ingest_without_a_run_opens_its_own():
+    Session = make_sessionmaker()
+    record_ingest({"jora": {"inserted": 2}, "seek": {"unchanged": 1}}, session_factory=Session)
+
+    db = Session()
+    run = db.query(ScrapeRun).one()
+    assert run.mode == "ingest" and run.status == "ok"
+    counts = {row.source: (row.inserted, row.unchanged) for row in db.query(ScrapeRunSource)}
+    assert counts == {"jora": (2, 0), "seek": (0, 1)}
+
+
+def test_database_url_from_dotenv_only(tmp_path):
+    db_path = tmp_path / "metrics.db"
+    (tmp_path / ".env").write_text(f"DIRECT_DATABASE_URL=sqlite:///{db_path}\n", encoding="utf-8")
+    env = {key: value for key, value in os.environ.items() if key != "DIRECT_DATABASE_URL"}
+    env["PYTHONPATH"] = os.path.dirname(os.path.abspath(__file__))
+    # Run from the directory holding the .env, the way run_scrapers.py is started
+    result = subprocess.run([sys.executable, "-c", "import metrics; print(metrics.start_run('processes'))"],
+                            cwd=tmp_path, env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "1"
+    assert db_path.exists()
@@ -0,0 +1,61 @@
+from datetime import datetime
+
+from normalize import KeywordMatcher, classify, normalize_job, work_type_label
+from utils import set_reference_time
+
+
+def test_keyword_matcher_whole_words_longest_first():
+    matcher = KeywordMatcher({"part time": "pt", "part-time": "pt", "contract": "c", "contractor": "cr",
+                              "temp": "t", "remote role": "rr"})
+    assert matcher.find("Contractor, PART  time; template work") == ["cr", "pt"]
+    assert matcher.find("A remote\nrole or a temp contract") == ["rr", "t", "c"]
+    assert matcher.find(None) == []
+
+
+def test_classify_title_before_description():
+    labels = classify("Senior Data Engineer (Remote)", "Full-time, casual dress code")
+    assert labels == {"work_type": "Full time", "is_remote": True, "is_hybrid": False, "seniority": "Senior"}
+    # The most senior level named wins; a title's work type beats the description's
+    assert classify("Senior Manager - Part Time", "full time hours")["work_type"] == "Part time"
+    assert classify("Senior Manager")["seniority"] == "Manager"
+    # A bare "remote" in a description is not a remote job, spelled-out forms are
+    assert not classify("Nurse", "Servicing remote communities")["is_remote"]
+    assert classify("Nurse", "Hybrid working, 2 days work from home") == {
+        "work_type": None, "is_remote": True, "is_hybrid": True, "seniority": None}
+    assert classify("Graduate Accountant", "Join our graduate program")["seniority"] == "Graduate"
+
+
+def test_work_type_words_only_count_in_titles():
+    # Bare words in a description say nothing about the job's work type
+    for description in ("Casual dress code on Fridays", "You will own contract management",
+                        "Temp agency staff report to you", "Support our contractors on site"):
+        assert classify("Site Manager", description)["work_type"] is None
+    assert classify("Casual Barista")["work_type"] == "Casual"
+    assert classify("Barista", "This is a casual role, weekends only")["work_type"] == "Casual"
+    assert classify("Analyst", "12 month fixed-term contract")["work_type"] == "Contract"
+    # A site's own label is trusted as it is
+    assert [work_type_label(label) for label in ("Casual", "Contract/Temp", "2d ago")] == \
+        ["Casual", "Contract", None]
+
+
+def test_normalize_job_fills_derived_fields():
+    set_reference_time(datetime(2025, 3, 10, 12, 0))
+    try:
+        job = normalize_job({
+            "job_title": "Junior Developer",
+            "location": "Toowong, Brisbane QLD(Hybrid)",
+            "salary_range": "$80k - $90k",
+            "work_type": None,
+            "job_description": "Contract role",
+        }, posted="Posted 2d ago")
+    finally:
+        set_reference_time()
+    assert (job["suburb"], job["city"], job["state"], job["country"]) == ("Toowong", "Brisbane", "QLD", "Australia")
+    assert (job["min_annual_salary"], job["max_annual_salary"]) == (80000, 90000)
+    assert job["work_type"] == "Contract" and job["seniority"] == "Junior"
+    assert job["is_hybrid"] and not job["is_remote"]
+    assert job["posted_date"] == "2025-03-08"
+
+    # The site's own work type is kept
+    assert normalize_job({"work_type": "Full time", "job_description": "casual"})["work_type"] == "Full time"
+
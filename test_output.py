@@ -0,0 +1,64 @@
+import json
+import os
+
+from output import JobWriter, iter_records, resolve_output_file
+
+
+def test_writer_json_round_trip(tmp_path):
+    path = str(tmp_path / "jobs.json")
+    with JobWriter(path) as writer:
+        writer.write({"url": "a", "job_title": "Dev"})
+        writer.write_many([{"url": "b"}, {"url": "c"}])
+
+    assert writer.count == 3
+    assert not os.path.exists(path + ".part")
+    with open(path, encoding="utf-8") as f:
+        assert [job["url"] for job in json.load(f)] == ["a", "b", "c"]
+    assert [job["url"] for job in iter_records(path)] == ["a", "b", "c"]
+
+
+def test_writer_jsonl_round_trip(tmp_path):
+    path = str(tmp_path / "jobs.jsonl")
+    with JobWriter(path) as writer:
+        writer.write({"url": "a", "job_description": "line one\nline two"})
+
+    records = list(iter_records(path))
+    assert records == [{"url": "a", "job_description": "line one\nline two"}]
+    # Either extension finds the file
+    assert list(iter_records(str(tmp_path / "jobs.json"))) == records
+
+
+def test_reads_part_file_after_crash(tmp_path):
+    path = str(tmp_path / "jobs.json")
+    writer = JobWriter(path)
+    writer.write({"url": "a"})
+    writer.write({"url": "b"})
+    # No finalize: the run died mid-way
+
+    assert resolve_output_file(path) == path + ".part"
+    assert [job["url"] for job in iter_records(path)] == ["a", "b"]
+
+
+def test_reads_legacy_indented_json(tmp_path):
+    path = tmp_path / "jobs.json"
+    path.write_text(json.dumps([{"url": "a"}, {"url": "b"}], indent=4), encoding="utf-8")
+    assert [job["url"] for job in iter_records(str(path))] == ["a", "b"]
+
+
+
+def test_failed_run_keeps_last_complete_output(tmp_path):
+    path = str(tmp_path / "jobs.json")
+    with JobWriter(path) as writer:
+        writer.write({"url": "a"})
+        writer.write({"url": "b"})
+
+    try:
+        with JobWriter(path) as writer:
+            writer.write({"url": "c"})
+            raise RuntimeError("blocked on page 2")
+    except RuntimeError:
+        pass
+
+    assert [job["url"] for job in iter_records(path)] == ["a", "b"]
+    with open(path + ".part", encoding="utf-8") as f:
+        assert [job["url"] for job in json.load(f)] == ["c"]
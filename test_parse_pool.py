@@ -0,0 +1,40 @@
+import glob
+import os
+from datetime import datetime
+
+from parse_pool import ParsePool
+from parsers import extract_job_details, parse_jobsearch_jobs
+from utils import parse_posted_date, set_reference_time
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def read(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def test_workers_parse_like_inline():
+    set_reference_time(datetime(2025, 3, 10, 12, 0))
+    try:
+        pages = [(path, read(os.path.basename(path)))
+                 for path in sorted(glob.glob(os.path.join(FIXTURES, "seek_detail*.html")))]
+        listing = read("jobsearch_listing.html")
+        with ParsePool(workers=2) as pool:
+            parsed = dict(pool.parse_stream(extract_job_details, pages + [("missing", None)]))
+            cards = pool.parse(parse_jobsearch_jobs, listing)
+            # Dated from the parent's anchor, not the worker's clock
+            assert pool.parse(parse_posted_date, "Posted 2d ago") == "2025-03-08"
+        assert parsed.pop("missing") is None
+        assert parsed == {url: extract_job_details(html) for url, html in pages}
+        assert cards == parse_jobsearch_jobs(listing)
+    finally:
+        set_reference_time()
+
+
+def test_unpicklable_parsers_run_inline():
+    with ParsePool(workers=2) as pool:
+        assert pool.parse(lambda html: html.upper(), "abc") == "ABC"
+        results = dict(pool.parse_stream(lambda html: 1 / len(html), [("a", "xy"), ("b", "")]))
+        assert results == {"a": 0.5, "b": None}
+        assert pool._executor is None
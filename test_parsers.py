@@ -0,0 +1,52 @@
+import glob
+import os
+
+from parsers import (
+    BACKENDS, extract_job_details, parse_new_site, parse_career_jobs, parse_jobsearch_jobs,
+)
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+PARSERS = {
+    "seek_detail": extract_job_details,
+    "jora_detail": parse_new_site,
+    "career_listing": parse_career_jobs,
+    "jobsearch_listing": parse_jobsearch_jobs,
+}
+
+
+def load_fixtures(prefix):
+    pages = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES, f"{prefix}*.html"))):
+        with open(path, encoding="utf-8") as f:
+            pages.append(f.read())
+    return pages
+
+
+def test_backends_produce_identical_output():
+    for prefix, parse in PARSERS.items():
+        pages = load_fixtures(prefix)
+        assert pages, f"no fixtures for {prefix}"
+        for html in pages:
+            reference = parse(html, backend="html.parser")
+            for backend in BACKENDS:
+                assert parse(html, backend=backend) == reference, f"{prefix} differs on {backend}"
+
+
+def test_fixture_fields():
+    seek = extract_job_details(load_fixtures("seek_detail")[0])
+    assert seek["job_title"] == "Director of Finance"
+    assert seek["is_hybrid"] is True
+    assert seek["posted_date"] is not None
+    assert seek["job_description"].startswith("About the organisation")
+
+    jora = parse_new_site(load_fixtures("jora_detail")[0])
+    assert jora["job_title"] and jora["company_name"] and jora["job_description"]
+
+    career = parse_career_jobs(load_fixtures("career_listing")[0])
+    assert len(career) == 20
+    assert all(job["url"].startswith("https://www.careerone.com.au/") for job in career)
+
+    jobsearch = parse_jobsearch_jobs(load_fixtures("jobsearch_listing")[0])
+    assert len(jobsearch) == 20
+    assert all(job["url"].startswith("https://www.jobsearch.com.au/job/") for job in jobsearch)
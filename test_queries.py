@@ -0,0 +1,64 @@
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, Job, add_missing_indexes
+from queries import decode_cursor, find_jobs
+
+
+def make_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+
+def test_keyset_pages_cover_every_match_once():
+    db = make_session()
+    today = date.today()
+    for n in range(25):
+        # Several jobs share each day, so the id breaks ties
+        db.add(Job(url=f"u{n}", state="NSW" if n % 2 else "VIC", is_remote=n % 3 == 0,
+                   posted_date=today - timedelta(days=n // 4)))
+    db.add(Job(url="undated", state="NSW"))
+    db.commit()
+
+    urls, cursor = [], None
+    while True:
+        jobs, cursor = find_jobs(db, limit=4, after=cursor)
+        urls.extend(job.url for job in jobs)
+        if cursor is None:
+            break
+    assert len(urls) == len(set(urls)) == 25
+    assert urls[0] == "u3" and urls[-1] == "u24"  # newest first, highest id first within a day
+
+    remote, _ = find_jobs(db, is_remote=True, state="nsw", limit=50)
+    assert [job.url for job in remote] == ["u3", "u9", "u15", "u21"]
+    recent, _ = find_jobs(db, posted_within_days=1, limit=50)
+    assert {job.url for job in recent} == {f"u{n}" for n in range(8)}
+
+
+def test_salary_filters():
+    db = make_session()
+    today = date.today()
+    db.add(Job(url="a", posted_date=today, min_annual_salary=120000, max_annual_salary=140000))
+    db.add(Job(url="b", posted_date=today, min_annual_salary=70000, max_annual_salary=80000))
+    db.add(Job(url="c", posted_date=today, min_annual_salary=110000))
+    db.commit()
+
+    assert {job.url for job in find_jobs(db, min_salary=100000)[0]} == {"a", "c"}
+    assert {job.url for job in find_jobs(db, max_salary=90000)[0]} == {"b"}
+
+
+def test_cursor_validation_and_index_migration():
+    with pytest.raises(ValueError):
+        decode_cursor("nonsense")
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_jobs_remote_posted_date_id")
+        add_missing_indexes(conn)
+    names = {index["name"] for index in inspect(engine).get_indexes("jobs")}
+    assert {"ix_jobs_remote_posted_date_id", "ix_jobs_posted_date_id", "ix_jobs_salary"} <= names
@@ -0,0 +1,60 @@
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, Job, jobs_archive
+from ingest_jobs import prepare_job, upsert_jobs
+from queries import find_jobs
+from retention import archive_jobs, expire_jobs, policy_for, run_retention
+
+
+def make_sessionmaker():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+def add(db, url, source, seen_days_ago):
+    db.add(Job(url=url, source=source, posted_date=date.today(),
+               last_seen_at=datetime.now(timezone.utc) - timedelta(days=seen_days_ago)))
+
+
+def test_per_source_policy(monkeypatch):
+    monkeypatch.setenv("RETENTION_EXPIRE_DAYS_SEEK", "5")
+    monkeypatch.setenv("RETENTION_ARCHIVE_DAYS_SEEK", "0")
+    assert policy_for("seek") == (5, 0)
+
+    Session = make_sessionmaker()
+    db = Session()
+    add(db, "seek-old", "seek", 10)
+    add(db, "seek-new", "seek", 1)
+    add(db, "jora-old", "jora", 10)  # within the default 30 days
+    db.commit()
+    db.close()
+
+    results = run_retention(session_factory=Session, batch_size=1)
+    assert results == {"seek": (1, 1), "jora": (0, 0)}
+
+    db = Session()
+    assert sorted(url for (url,) in db.execute(select(Job.url))) == ["jora-old", "seek-new"]
+    assert db.execute(select(jobs_archive.c.url, jobs_archive.c.source)).all() == [("seek-old", "seek")]
+
+
+def test_expired_jobs_leave_listings_until_seen_again():
+    db = make_sessionmaker()()
+    add(db, "https://example.com/a", "seek", 40)
+    add(db, "https://example.com/b", "seek", 1)
+    db.commit()
+
+    assert expire_jobs(db, "seek", 30) == 1
+    db.commit()
+    assert [job.url for job in find_jobs(db)[0]] == ["https://example.com/b"]
+    # Still inside the archive period
+    assert archive_jobs(db, "seek", 7) == 0
+
+    upsert_jobs(db, [prepare_job({"url": "https://example.com/a", "source": "seek",
+                                  "posted_date": date.today().isoformat()})])
+    db.commit()
+    assert len(find_jobs(db)[0]) == 2
+    assert db.execute(select(func.count()).select_from(jobs_archive)).scalar() == 0
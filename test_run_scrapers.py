@@ -0,0 +1,39 @@
+import asyncio
+import sys
+import time
+
+import pandas as pd
+
+from run_scrapers import run_child, combine_to_csv
+
+
+def test_run_child_streams_output_to_log(tmp_path):
+    log_path = tmp_path / "logs" / "fake.log"
+    argv = [sys.executable, "-u", "-c", "print('page 1'); print('page 2')"]
+    assert asyncio.run(run_child("fake", argv, 30, str(log_path))) == "ok"
+    assert log_path.read_text().splitlines() == ["page 1", "page 2"]
+
+    argv = [sys.executable, "-c", "import sys; sys.exit(3)"]
+    assert asyncio.run(run_child("fake", argv, 30, str(log_path))) == "failed"
+
+
+def test_run_child_timeout_stops_the_process(tmp_path):
+    log_path = tmp_path / "hung.log"
+    argv = [sys.executable, "-u", "-c", "import time; print('started'); time.sleep(60)"]
+    start = time.time()
+    assert asyncio.run(run_child("hung", argv, 1, str(log_path))) == "timeout"
+    assert time.time() - start < 15
+    assert log_path.read_text().strip() == "started"
+
+
+def test_combine_frames(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    seek = pd.DataFrame([{"job_title": "Dev", "url": "a"}, {"job_title": "Dev", "url": "a"}])
+    seek["source"] = "seek"
+    jora = pd.DataFrame([{"job_title": "Chef", "url": "b"}])
+    jora["source"] = "jora"
+    assert combine_to_csv([jora, seek, pd.DataFrame()])
+
+    combined = pd.read_csv(tmp_path / "combined_jobs.csv", encoding="utf-8-sig")
+    assert list(combined.columns) == ["source", "job_title", "url"]
+    assert sorted(combined["url"]) == ["a", "b"]
@@ -0,0 +1,190 @@
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from output import iter_records
+from scraper import Scraper, Scheduler, load_scrapers, get_scraper
+
+PAD = "<p>" + "lorem ipsum " * 60 + "</p>"
+
+PAGES = {
+    "/list": '<html><body><a class="job" href="/job/1">1</a><a class="job" href="/job/2">2</a>' + PAD + "</body></html>",
+    "/job/1": f'<html><body><h1>Data Engineer</h1><div class="details">Build pipes</div>{PAD}</body></html>',
+    "/job/2": f'<html><body><h1>Nurse</h1><div class="details">Care</div>{PAD}</body></html>',
+    "/cards": f'<html><body><li class="card">Chef</li><li class="card">Baker</li>{PAD}</body></html>',
+}
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves canned listing and detail pages in place of the real job sites"""
+
+    def do_GET(self):
+        body = PAGES.get(self.path)
+        payload = (body or "not found").encode("utf-8")
+        self.send_response(200 if body else 404)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class DetailSite(Scraper):
+    name = "standin_details"
+    listing_marker = 'class="job"'
+    detail_marker = 'class="details"'
+    parse_detail = staticmethod(lambda html: {"job_title": html.split("<h1>")[1].split("</h1>")[0]})
+
+    def __init__(self, base):
+        super().__init__()
+        self.base = base
+
+    def listing_urls(self):
+        yield f"{self.base}/list"
+
+    def parse_listing(self, html, url):
+        return [f"{self.base}/job/{n}" for n in ("1", "2") if f"/job/{n}" in html]
+
+
+class CardSite(Scraper):
+    name = "standin_cards"
+    source = "cards"
+    listing_marker = 'class="card"'
+
+    def __init__(self, base):
+        super().__init__()
+        self.base = base
+
+    def listing_urls(self):
+        yield f"{self.base}/cards"
+
+    def parse_listing(self, html, url):
+        titles = [part.split("<")[0] for part in html.split('class="card">')[1:]]
+        return [{"job_title": title, "url": f"{url}#{title}"} for title in titles]
+
+
+def test_registry():
+    assert set(load_scrapers()) >= {"seek", "jora", "career", "jobsearch"}
+    assert get_scraper("career").source == "careerone"
+    try:
+        get_scraper("nope")
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_scheduler_runs_sources_without_browser(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("DIRECT_DATABASE_URL", raising=False)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        details, cards = DetailSite(base), CardSite(base)
+        results = Scheduler([details, cards], workers=2, per_domain=1, warm_drivers=0).run()
+    finally:
+        server.shutdown()
+
+    assert results == {"standin_details": (True, 2), "standin_cards": (True, 2)}
+    jobs = {job["url"]: job["job_title"] for job in iter_records(details.output_file)}
+    assert jobs == {f"{base}/job/1": "Data Engineer", f"{base}/job/2": "Nurse"}
+    assert [job["job_title"] for job in iter_records(cards.output_file)] == ["Chef", "Baker"]
+
+
+def test_source_that_cannot_start_fails_alone(tmp_path, monkeypatch):
+    import scraper as scraper_module
+
+    monkeypatch.chdir(tmp_path)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    opened = scraper_module.HtmlCache
+
+    def cache(source):
+        if source == "standin_details":
+            raise OSError("cache file locked")
+        return opened(source)
+
+    monkeypatch.setattr(scraper_module, "HtmlCache", cache)
+    try:
+        scheduler = Scheduler([DetailSite(base), CardSite(base)], workers=1, warm_drivers=0)
+        results = scheduler.run()
+    finally:
+        server.shutdown()
+
+    assert results == {"standin_details": (False, 0), "standin_cards": (True, 2)}
+    assert {m.source: m.status for m in scheduler.metrics} == {"standin_details": "failed", "cards": "ok"}
+
+
+def test_listing_browser_counts_each_page_once(tmp_path, monkeypatch):
+    from drivers import DriverPool
+    from scraper import ScrapeContext
+
+    class FakeDriver:
+        page_source = '<div class="job-search-result">Job</div>'
+
+        def __init__(self, headless):
+            self.quit_called = False
+
+        def uc_open_with_reconnect(self, url, reconnect_time):
+            pass
+
+        def find_element(self, by, selector):
+            return object()
+
+        def quit(self):
+            self.quit_called = True
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("DIRECT_DATABASE_URL", raising=False)
+    drivers = DriverPool(size=1, max_pages=4, factory=FakeDriver)
+    jobsearch = get_scraper("jobsearch")
+    ctx = ScrapeContext(jobsearch, None, None, drivers)
+    for page in range(3):
+        jobsearch.fetch_listing(f"https://www.jobsearch.com.au/jobs?page={page}", ctx)
+    driver = ctx.driver
+    ctx.close()
+
+    # Three pages of a four-page budget: the browser goes back to the pool
+    assert not driver.quit_called
+
+
+def test_context_closes_what_it_opened_when_setup_fails(tmp_path, monkeypatch):
+    import scraper as scraper_module
+    from scraper import ScrapeContext
+
+    class RecordingCache:
+        opened = []
+
+        def __init__(self, source):
+            self.closed = False
+            RecordingCache.opened.append(self)
+
+        def close(self):
+            self.closed = True
+
+    def broken(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(scraper_module, "HtmlCache", RecordingCache)
+    site = DetailSite("http://127.0.0.1:9")
+
+    monkeypatch.setattr(scraper_module.SeenIndex, "load", classmethod(lambda cls, *args: broken()))
+    try:
+        ScrapeContext(site, None, None, None)
+        assert False, "expected OSError"
+    except OSError:
+        pass
+    # The index is loaded before the cache is opened
+    assert RecordingCache.opened == []
+
+    monkeypatch.setattr(scraper_module.SeenIndex, "load", classmethod(lambda cls, *args: cls()))
+    monkeypatch.setattr(scraper_module, "JobWriter", broken)
+    try:
+        ScrapeContext(site, None, None, None)
+        assert False, "expected OSError"
+    except OSError:
+        pass
+    assert [cache.closed for cache in RecordingCache.opened] == [True]
@@ -0,0 +1,57 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, Job, setup_full_text_search
+from search import fts5_query, search_jobs
+
+
+def make_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        setup_full_text_search(conn)
+    return sessionmaker(bind=engine)()
+
+
+def add(db, url, title, company, description, **extra):
+    db.add(Job(url=url, job_title=title, company_name=company, job_description=description, **extra))
+    db.commit()
+
+
+def test_ranked_search_with_filters():
+    db = make_session()
+    add(db, "a", "Data Engineer", "Acme", "Build pipelines in Python.", state="NSW",
+        work_type="Full time", min_annual_salary=120000, max_annual_salary=140000)
+    add(db, "b", "Nurse", "Health Co", "Ward nurse. Some data entry.", state="VIC",
+        work_type="Part time", min_annual_salary=70000, max_annual_salary=80000)
+    add(db, "c", "Analyst", "Data Corp", "Reporting with spreadsheets.", state="NSW",
+        work_type="Full time", min_annual_salary=90000)
+
+    ranked = [job.url for job, _ in search_jobs(db, "data")]
+    assert ranked == ["a", "c", "b"]  # title, then company, then description
+
+    assert [job.url for job, _ in search_jobs(db, "data", state="nsw")] == ["a", "c"]
+    assert [job.url for job, _ in search_jobs(db, "data", work_type="part TIME")] == ["b"]
+    assert [job.url for job, _ in search_jobs(db, "data", min_salary=100000)] == ["a"]
+    assert [job.url for job, _ in search_jobs(db, "data", max_salary=85000)] == ["b"]
+    # Porter stemming, and every word must match
+    assert [job.url for job, _ in search_jobs(db, "pipeline python")] == ["a"]
+
+
+def test_index_follows_updates_and_deletes():
+    db = make_session()
+    add(db, "a", "Chef", "Bistro", "Cooking.")
+    job = db.query(Job).one()
+    job.job_title = "Head Baker"
+    db.commit()
+    assert search_jobs(db, "chef") == []
+    assert [j.url for j, _ in search_jobs(db, "baker")] == ["a"]
+
+    db.delete(job)
+    db.commit()
+    assert search_jobs(db, "baker") == []
+
+
+def test_query_sanitizing():
+    assert fts5_query('c++ "senior" OR dev*') == '"c" "senior" "OR" "dev"'
+    assert search_jobs(make_session(), "  ++ ") == []
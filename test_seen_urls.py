@@ -0,0 +1,64 @@
+import json
+import os
+import subprocess
+import sys
+from datetime import date
+
+from seen_urls import SeenIndex, job_key
+
+
+def test_job_key_ignores_tracking_params():
+    a = "https://www.seek.com.au/job/89064001?type=promoted&ref=search-standalone#sol=02906f"
+    b = "https://www.seek.com.au/job/89064001?type=standard&origin=jobCard#sol=7db91b"
+    assert job_key(a) == job_key(b)
+    assert job_key(a) != job_key("https://www.seek.com.au/job/89064002")
+
+
+def test_split_carries_known_records(tmp_path):
+    known_url = "https://au.jora.com/job/Payroll-Officer-803548?tk=old"
+    output_file = tmp_path / "jora_jobs.json"
+    output_file.write_text(json.dumps([{"job_title": "Payroll Officer", "url": known_url}]))
+
+    seen = SeenIndex.load("jora", str(output_file))
+    listed = [
+        "https://au.jora.com/job/Payroll-Officer-803548?tk=new",
+        "https://au.jora.com/job/Chef-123?tk=new",
+        "https://au.jora.com/job/Chef-123?tk=dup",
+    ]
+    new_urls, carried = seen.split(listed)
+
+    assert new_urls == ["https://au.jora.com/job/Chef-123?tk=new"]
+    assert carried == [{"job_title": "Payroll Officer", "url": known_url}]
+    assert seen.page_fully_known(listed[:1])
+    assert not seen.page_fully_known(listed)
+    assert not seen.page_fully_known([])
+
+
+def test_database_known_jobs_are_carried_not_fetched(tmp_path):
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from database import Base, Job
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add(Job(url="https://www.seek.com.au/job/1?type=standard", source="seek", job_title="Nurse",
+               posted_date=date(2025, 3, 1)))
+    db.commit()
+    db.close()
+
+    # The URL is only in .env, the way the scrapers are normally configured
+    (tmp_path / ".env").write_text(f"DIRECT_DATABASE_URL=sqlite:///{tmp_path / 'jobs.db'}\n", encoding="utf-8")
+    env = {key: value for key, value in os.environ.items() if key != "DIRECT_DATABASE_URL"}
+    env["PYTHONPATH"] = os.path.dirname(os.path.abspath(__file__))
+    code = ("import json; from seen_urls import SeenIndex; "
+            "seen = SeenIndex.load('seek', 'seek_jobs.json'); "
+            "print(json.dumps(seen.split(['https://www.seek.com.au/job/1?ref=a', 'https://www.seek.com.au/job/2'])))")
+    result = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+    new_urls, carried = json.loads(result.stdout.splitlines()[-1])
+    assert new_urls == ["https://www.seek.com.au/job/2"]
+    assert [(job["url"], job["job_title"], job["posted_date"]) for job in carried] == [
+        ("https://www.seek.com.au/job/1?type=standard", "Nurse", "2025-03-01")]
+    assert "source" not in carried[0] and "id" not in carried[0]
@@ -1,4 +1,7 @@
-from utils import parse_salary, parse_posted_date
+import pandas as pd
+
+from utils import (parse_salary, parse_posted_date, parse_posted_dates,
+                   posted_date_is_open_ended, set_reference_time)
 from datetime import datetime, timedelta
 
 def test_salary():
@@ -19,6 +22,16 @@ def test_salary():
         status = "✅" if result == expected else f"❌ Expected {expected}, got {result}"
         print(f"  '{inp}' -> {result} {status}")
 
+def test_parse_salary_periods_and_cache():
+    parse_salary.cache_clear()
+    assert parse_salary("$50 per hour") == (104000, 104000)
+    assert parse_salary("$50 per hour") == (104000, 104000)
+    assert parse_salary.cache_info().hits == 1
+    # No period and small figures: hourly
+    assert parse_salary("45-50") == (93600, 104000)
+    assert parse_salary("$5000 - $6000 per month") == (60000, 72000)
+    assert parse_salary("") == (None, None) and parse_salary(None) == (None, None)
+
 def test_date():
     print("\nTesting Date Parsing:")
     cases = [
@@ -34,6 +47,38 @@ def test_date():
         status = "✅" if result == expected else f"❌ Expected {expected}, got {result}"
         print(f"  '{inp}' -> {result} {status}")
 
+def test_posted_dates_use_the_run_anchor():
+    set_reference_time(datetime(2025, 3, 10, 23, 59))
+    try:
+        # Parsed "later" on the wall clock, still dated from the run's start
+        assert parse_posted_date("Posted 2d ago") == "2025-03-08"
+        assert parse_posted_date("5 hours ago") == "2025-03-10"
+        assert parse_posted_date("Posted 3 months ago") == "2024-12-10"
+        assert parse_posted_date("30+ days ago") == "2025-02-08"
+        assert posted_date_is_open_ended("30+ days ago") and posted_date_is_open_ended("Posted 30d+ ago")
+        assert not posted_date_is_open_ended("Posted 2d ago") and not posted_date_is_open_ended(None)
+        # The old parser read these as 30 days back and as today
+        assert parse_posted_date("Posted 30 seconds ago") == "2025-03-10"
+        assert parse_posted_date("Posted 3 business days ago") is None
+        assert parse_posted_date("Posted 2d ago", now=datetime(2025, 3, 11, 0, 1)) == "2025-03-09"
+    finally:
+        set_reference_time()
+
+def test_absolute_and_batch_posted_dates():
+    now = datetime(2025, 3, 10, 12, 0)
+    assert parse_posted_date("Posted on 12 Mar 2024", now) == "2024-03-12"
+    assert parse_posted_date("March 3, 2025", now) == "2025-03-03"
+    assert parse_posted_date("03/02/2025", now) == "2025-02-03"
+    assert parse_posted_date("2025-02-28T10:00:00Z", now) == "2025-02-28"
+    # No year, and later in the year than today: last year's
+    assert parse_posted_date("Posted 20 December", now) == "2024-12-20"
+    assert parse_posted_date("Closing soon", now) is None
+
+    texts = ["Posted 1w ago", None, "Posted 1w ago", "", "Posted yesterday"]
+    assert parse_posted_dates(texts, now) == ["2025-03-03", None, "2025-03-03", None, "2025-03-09"]
+    series = parse_posted_dates(pd.Series(texts, index=list("abcde")), now)
+    assert list(series.index) == list("abcde") and series["e"] == "2025-03-09"
+
 if __name__ == "__main__":
     test_salary()
     test_date()
@@ -0,0 +1,30 @@
+import time
+
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+
+from waits import WAIT_STATS, wait_for_selector
+
+
+class ReloadingPage:
+    """The old page's element goes stale after `reload` seconds; the new content never shows"""
+
+    def __init__(self, reload):
+        self.stale_at = time.monotonic() + reload
+
+    def is_enabled(self):
+        if time.monotonic() >= self.stale_at:
+            raise StaleElementReferenceException()
+        return True
+
+    def find_element(self, by, selector):
+        raise NoSuchElementException()
+
+
+def test_staleness_and_presence_share_the_timeout():
+    page = ReloadingPage(reload=0.8)
+    start = time.monotonic()
+    assert not wait_for_selector(page, ".job", timeout=1, source="test_waits", replaces=page)
+
+    # One timeout for the whole wait, not one per condition
+    assert time.monotonic() - start < 1.5
+    assert WAIT_STATS["test_waits"]["timeouts"] == 1
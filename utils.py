@@ -1,167 +1,199 @@
+import os
 import re
-from datetime import datetime, timedelta
+import sys
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 
+from locations import resolve_location
+
+# A figure, optionally with a 'k' suffix: "120", "120.5", "120k"
+SALARY_NUMBER_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(k)?')
+
+# Pay period keywords -> annual multiplier; the first period found in this order wins
+SALARY_PERIODS = [
+    (2080.0, ('hour', 'hr', '/h', 'p.h')),   # 40 * 52
+    (260.0, ('day', 'daily', '/d', 'p.d')),  # 5 * 52
+    (52.0, ('week', 'weekly', '/w')),
+    (12.0, ('month', 'monthly', '/m')),
+]
+SALARY_PERIOD_RES = [(multiplier, re.compile('|'.join(re.escape(k) for k in keywords)))
+                     for multiplier, keywords in SALARY_PERIODS]
+
+# With no period given, figures all below this are taken as hourly rates
+HOURLY_THRESHOLD = 200
+HOURLY_MULTIPLIER = 2080.0
+
+@lru_cache(maxsize=8192)
 def parse_salary(salary_text):
     """
     Parses salary text and returns (min_annual, max_annual) as integers.
     Handles hourly, daily, and annual rates.
     Handles 'k' suffix.
+    Results are memoized; scraped salary strings repeat a lot.
     """
     if not salary_text:
         return None, None
-    
+
     text = salary_text.lower().replace(',', '')
-    
-    # Search for numbers, possibly with 'k'
-    # logical groups: (number) (optional k)
-    matches = re.findall(r'(\d+(?:\.\d+)?)\s*(k)?', text)
-    
-    if not matches:
-        return None, None
-    
-    values = []
-    for num_str, k_suffix in matches:
-        try:
-            val = float(num_str)
-            if k_suffix:
-                val *= 1000
-            values.append(val)
-        except ValueError:
-            continue
-            
+
+    values = [float(num) * 1000 if k else float(num) for num, k in SALARY_NUMBER_RE.findall(text)]
     if not values:
         return None, None
-        
-    # Determine multiplier
+
     # Default is 1 (Annual)
-    multiplier = 1.0
-    
-    # Check text for period indicators
-    if any(x in text for x in ['hour', 'hr', '/h', 'p.h']):
-        multiplier = 2080.0  # 40 * 52
-    elif any(x in text for x in ['day', 'daily', '/d', 'p.d']):
-        multiplier = 260.0   # 5 * 52
-    elif any(x in text for x in ['week', 'weekly', '/w']):
-        multiplier = 52.0
-    elif any(x in text for x in ['month', 'monthly', '/m']):
-        multiplier = 12.0
-        
-    # Heuristic: If values are small (< 200) and no period specified, assume hourly
-    if multiplier == 1.0:
-        if all(v < 200 for v in values):
-            multiplier = 2080.0
-    
-    annual_values = [v * multiplier for v in values]
-    
-    # Sort to find range
-    annual_values.sort()
-    
-    if len(annual_values) >= 2:
-        # Take min and max
-        min_salary = int(annual_values[0])
-        max_salary = int(annual_values[-1])
-        return min_salary, max_salary
-    elif len(annual_values) == 1:
-        val = int(annual_values[0])
-        return val, val
-        
-    return None, None
-
-def parse_posted_date(date_text):
+    multiplier = next((m for m, pattern in SALARY_PERIOD_RES if pattern.search(text)), 1.0)
+    if multiplier == 1.0 and all(v < HOURLY_THRESHOLD for v in values):
+        multiplier = HOURLY_MULTIPLIER
+
+    low = min(values) * multiplier
+    high = max(values) * multiplier
+    return int(low), int(high)
+
+# Set by run_scrapers.py so every scraper process dates its jobs from the same moment
+RUN_STARTED_ENV = "SCRAPE_STARTED_AT"
+
+_reference_time = None
+
+def set_reference_time(when=None):
     """
-    Parses relative date strings like 'Posted 2 days ago' into ISO date string YYYY-MM-DD.
+    Anchor relative dates ("2d ago") to one moment for the rest of the run:
+    `when`, else SCRAPE_STARTED_AT, else now. Returns the anchor.
+    """
+    global _reference_time
+    if when is None:
+        started = os.getenv(RUN_STARTED_ENV)
+        when = datetime.fromisoformat(started) if started else datetime.now()
+    _reference_time = when
+    return when
+
+def reference_time():
+    """The run's anchor; set on first use if no run set it"""
+    return _reference_time or set_reference_time()
+
+MONTHS = {name: number for number in range(1, 13)
+          for name in (date(2000, number, 1).strftime('%B').lower(), date(2000, number, 1).strftime('%b').lower())}
+MONTHS['sept'] = 9
+
+# Absolute dates some sources emit, tried before the relative forms
+ISO_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+SLASH_DATE_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')  # day first
+DAY_MONTH_RE = re.compile(r'(\d{1,2})(?:st|nd|rd|th)?\s+([a-z]{3,9})\.?,?(?:\s+(\d{4}))?\b')
+MONTH_DAY_RE = re.compile(r'\b([a-z]{3,9})\.?\s+(\d{1,2})(?:st|nd|rd|th)?,?(?:\s+(\d{4}))?\b')
+
+RELATIVE_RE = re.compile(r'(\d+)\s*\+?\s*([a-z]+)')
+
+# Unit as the sites write it -> timedelta per unit
+POSTED_UNITS = [
+    (('s', 'sec', 'secs', 'second', 'seconds'), timedelta(seconds=1)),
+    (('m', 'min', 'mins', 'minute', 'minutes'), timedelta(minutes=1)),
+    (('h', 'hr', 'hrs', 'hour', 'hours'), timedelta(hours=1)),
+    (('d', 'day', 'days'), timedelta(days=1)),
+    (('w', 'wk', 'wks', 'week', 'weeks'), timedelta(weeks=1)),
+    (('mo', 'mon', 'mos', 'month', 'months'), timedelta(days=30)),
+    (('y', 'yr', 'yrs', 'year', 'years'), timedelta(days=365)),
+]
+POSTED_UNIT_DELTAS = {unit: delta for units, delta in POSTED_UNITS for unit in units}
+
+# Phrases with no number
+POSTED_WORDS = [
+    ('yesterday', timedelta(days=1)),
+    ('today', timedelta(0)),
+    ('just now', timedelta(0)),
+    ('30+', timedelta(days=30)),
+]
+
+# "30+ days ago", "Posted 30d+ ago": only a bound, so the date it gives moves with every run
+OPEN_ENDED_RE = re.compile(r'\d+\s*[a-z]*\s*\+')
+
+def posted_date_is_open_ended(date_text):
+    """True for phrases like '30+ days ago' that give a bound rather than the posted date"""
+    return bool(date_text) and OPEN_ENDED_RE.search(date_text.lower()) is not None
+
+def _absolute_date(text, today):
+    """The date in `text` if it is an absolute one; "12 Mar" is the latest 12 March up to `today`"""
+    match = ISO_DATE_RE.search(text)
+    if match:
+        y, m, d = map(int, match.groups())
+        return date(y, m, d)
+    match = SLASH_DATE_RE.search(text)
+    if match:
+        d, m, y = map(int, match.groups())
+        return date(y, m, d)
+    match = DAY_MONTH_RE.search(text)
+    if match and match.group(2) in MONTHS:
+        day, month, year = match.group(1), match.group(2), match.group(3)
+    else:
+        match = MONTH_DAY_RE.search(text)
+        if not (match and match.group(1) in MONTHS):
+            return None
+        month, day, year = match.groups()
+    if year:
+        return date(int(year), MONTHS[month], int(day))
+    posted = date(today.year, MONTHS[month], int(day))
+    return posted if posted <= today else posted.replace(year=today.year - 1)
+
+@lru_cache(maxsize=1024)
+def _posted_phrase(date_text, today):
+    """
+    What a posted-date phrase says, independent of when it was read:
+    a date for absolute forms, a timedelta before the anchor for relative ones,
+    or None. Cached; a run sees the same few phrases over and over.
     """
-    if not date_text:
-        return None
-        
     text = date_text.lower()
-    now = datetime.now()
-    
     try:
-        if 'yesterday' in text:
-            return (now - timedelta(days=1)).date().isoformat()
-        if 'today' in text:
-            return now.date().isoformat()
-        if '30+' in text:
-             return (now - timedelta(days=30)).date().isoformat()
-             
-        # Find number and unit
-        match = re.search(r'(\d+)\s*([a-z]+)', text)
-        if match:
-            num = int(match.group(1))
-            unit = match.group(2)
-            
-            delta = timedelta(0)
-            if 'h' in unit: # hours, hr
-                delta = timedelta(hours=num)
-            elif 'd' in unit: # days, day
-                delta = timedelta(days=num)
-            elif 'm' in unit and 'mon' not in unit: # minutes, min
-                delta = timedelta(minutes=num)
-            elif 'w' in unit: # weeks
-                delta = timedelta(weeks=num)
-            elif 'mon' in unit: # months
-                delta = timedelta(days=num*30)
-            elif 'y' in unit: # years
-                delta = timedelta(days=num*365)
-                
-            return (now - delta).date().isoformat()
-            
-    except Exception:
+        for word, delta in POSTED_WORDS:
+            if word in text:
+                return delta
+        absolute = _absolute_date(text, today)
+        if absolute:
+            return absolute
+        match = RELATIVE_RE.search(text)
+        if match and match.group(2) in POSTED_UNIT_DELTAS:
+            return int(match.group(1)) * POSTED_UNIT_DELTAS[match.group(2)]
+    except (ValueError, OverflowError):
         pass
-        
     return None
 
+def parse_posted_date(date_text, now=None):
+    """
+    Parses date strings like 'Posted 2 days ago', '3h ago' or '12 Mar 2025'
+    into ISO date string YYYY-MM-DD. Relative ones count back from `now`,
+    default the run's reference_time().
+    """
+    if not date_text:
+        return None
+
+    now = now or reference_time()
+    parsed = _posted_phrase(date_text, now.date())
+    if parsed is None:
+        return None
+    if isinstance(parsed, timedelta):
+        return (now - parsed).date().isoformat()
+    return parsed.isoformat()
+
+def parse_posted_dates(date_texts, now=None):
+    """
+    Batch version of parse_posted_date: every string dated from the same `now`
+    (default the run's reference_time()), each distinct phrase dated once and
+    the rest looked up. A pandas Series gives a Series on the same index;
+    anything else a list.
+    """
+    now = now or reference_time()
+    texts = list(date_texts)
+    dates = {text: parse_posted_date(text, now) if isinstance(text, str) else None for text in set(texts)}
+    result = [dates[text] for text in texts]
+    # Only a caller that has imported pandas can pass a Series
+    pd = sys.modules.get('pandas')
+    if pd is not None and isinstance(date_texts, pd.Series):
+        return pd.Series(result, index=date_texts.index, dtype=object)
+    return result
+
 def parse_location(location_str):
     """
-    Parses a location string into city, state, and country.
+    Parses a location string into suburb, city, state and country, plus the
+    remote/hybrid flags from tags like "(Remote)".
     Default country is "Australia".
-    Wrapper for handling cases like "Toowong, Brisbane QLD(Hybrid)".
-    Returns a dict with city, state, country.
+    e.g. "Toowong, Brisbane QLD(Hybrid)" -> Toowong, Brisbane, QLD, hybrid.
+    Returns a dict with suburb, city, state, country, is_remote, is_hybrid.
     """
-    if not location_str:
-        return {"city": None, "state": None, "country": "Australia"}
-
-    # Clean up brackets like (Hybrid), (Remote) which we handle separately
-    clean_loc = re.sub(r'\(.*?\)', '', location_str).strip()
-    
-    parts = [p.strip() for p in clean_loc.split(',')]
-    
-    city = None
-    state = None
-    country = "Australia"
-    
-    if len(parts) == 1:
-        # Check if it looks like "Brisbane QLD"
-        match = re.search(r'^(.*?)\s+([A-Z]{2,3})$', parts[0])
-        if match:
-            city = match.group(1).strip()
-            state = match.group(2).strip()
-        else:
-            # Just city or state? Assume city for now if no state code found
-            city = parts[0]
-            
-    elif len(parts) >= 2:
-        # "Toowong, Brisbane QLD"
-        # Last part usually has state
-        last_part = parts[-1]
-        match = re.search(r'^(.*?)\s+([A-Z]{2,3})$', last_part)
-        if match:
-            # "Brisbane QLD" -> City could be Toowong, State QLD. 
-            # Or City Brisbane, State QLD? 
-            # Usually "Suburb, City State" or "City, State"
-            state = match.group(2).strip()
-            # If the last part had a city too ("Brisbane QLD"), maybe join with previous?
-            # Let's take the first part as city/suburb
-            city = parts[0]
-        else:
-            # Maybe just "City, State"?
-            if re.match(r'^[A-Z]{2,3}$', last_part):
-                state = last_part
-                city = parts[0]
-            else:
-                 # Fallback
-                 city = parts[0]
-                 state = parts[-1]
-
-    return {"city": city, "state": state, "country": country}
+    return resolve_location(location_str)._asdict()
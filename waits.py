@@ -0,0 +1,79 @@
+"""
+Condition-based waits for the browser scrapers.
+
+wait_for_selector() returns as soon as the element a parser depends on is
+present instead of sleeping for a fixed time. Every wait is recorded per
+source together with the fixed sleep it replaced, so print_wait_summary()
+can show how much time the waits actually saved.
+"""
+
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+DEFAULT_TIMEOUT = 15
+
+# source -> {"waits", "timeouts", "waited", "baseline"}
+WAIT_STATS = {}
+_stats_lock = threading.Lock()
+
+
+def _record(source, elapsed, timed_out, baseline):
+    with _stats_lock:
+        stats = WAIT_STATS.setdefault(
+            source, {"waits": 0, "timeouts": 0, "waited": 0.0, "baseline": 0.0}
+        )
+        stats["waits"] += 1
+        stats["timeouts"] += int(timed_out)
+        stats["waited"] += elapsed
+        stats["baseline"] += baseline or 0.0
+
+
+def wait_for_selector(driver, selector, timeout=DEFAULT_TIMEOUT, source="default",
+                      baseline=None, replaces=None):
+    """
+    Block until `selector` (CSS) matches an element, or `timeout` seconds pass.
+
+    `replaces` is an element from the previous page; when given, the wait
+    first lets it go stale so a click-driven reload is not mistaken for the
+    old content still being on screen.
+    `baseline` is the fixed sleep this wait replaced, used for reporting.
+
+    Returns True if the element appeared, False on timeout. A timeout is not
+    an error: the caller parses whatever is on the page, as before.
+    """
+    start = time.monotonic()
+    timed_out = False
+    try:
+        if replaces is not None:
+            WebDriverWait(driver, timeout).until(EC.staleness_of(replaces))
+        # Both waits share the one timeout
+        remaining = max(0.0, timeout - (time.monotonic() - start))
+        WebDriverWait(driver, remaining).until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+    except TimeoutException:
+        timed_out = True
+    elapsed = time.monotonic() - start
+    _record(source, elapsed, timed_out, baseline)
+    return not timed_out
+
+
+def print_wait_summary(source=None):
+    """Print per-source wait counts, average wait and time saved against the old sleeps"""
+    with _stats_lock:
+        items = sorted(WAIT_STATS.items())
+    for name, stats in items:
+        if source and name != source:
+            continue
+        if not stats["waits"]:
+            continue
+        avg = stats["waited"] / stats["waits"]
+        saved = stats["baseline"] - stats["waited"]
+        print(
+            f"[{name}] waits: {stats['waits']}, timeouts: {stats['timeouts']}, "
+            f"avg wait: {avg:.2f}s, total: {stats['waited']:.1f}s, "
+            f"saved vs fixed sleeps: {saved:.1f}s"
+        )